@@ -1,4 +1,4 @@
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from datetime import date
 from typing import Any
 
@@ -9,6 +9,7 @@ from aiochainscan.adapters.endpoint_builder_urlbuilder import UrlBuilderEndpoint
 from aiochainscan.adapters.retry_exponential import ExponentialBackoffRetry
 from aiochainscan.adapters.simple_rate_limiter import SimpleRateLimiter
 from aiochainscan.adapters.structlog_telemetry import StructlogTelemetry
+from aiochainscan.adapters.token_bucket_rate_limiter import TokenBucketRateLimiter
 from aiochainscan.capabilities import FEATURE_SUPPORT as _FEATURE_SUPPORT_SRC
 from aiochainscan.capabilities import (
     get_supported_features as _caps_get_supported_features,
@@ -44,6 +45,7 @@ from aiochainscan.ports.endpoint_builder import EndpointBuilder
 from aiochainscan.ports.http_client import HttpClient
 from aiochainscan.ports.rate_limiter import RateLimiter, RetryPolicy
 from aiochainscan.ports.telemetry import Telemetry
+from aiochainscan.runtime import install_uvloop
 from aiochainscan.services.account import (
     get_account_balance_by_blockno as get_account_balance_by_blockno_service,
 )
@@ -107,6 +109,7 @@ from aiochainscan.services.gas import get_gas_oracle as get_gas_oracle_service
 from aiochainscan.services.gas import normalize_gas_oracle
 from aiochainscan.services.logs import get_logs_page as get_logs_page_service
 from aiochainscan.services.logs import normalize_log_entry, normalize_logs
+from aiochainscan.services.proxy import ProxySnapshot, normalize_proxy_tx
 from aiochainscan.services.proxy import estimate_gas as estimate_gas_service
 from aiochainscan.services.proxy import eth_call as eth_call_service
 from aiochainscan.services.proxy import get_block_number as get_block_number_service
@@ -115,16 +118,19 @@ from aiochainscan.services.proxy import (
 )
 from aiochainscan.services.proxy import get_code as get_code_service
 from aiochainscan.services.proxy import get_gas_price as get_gas_price_service
+from aiochainscan.services.proxy import get_proxy_snapshot as get_proxy_snapshot_service
 from aiochainscan.services.proxy import get_storage_at as get_storage_at_service
 from aiochainscan.services.proxy import (
     get_tx_by_block_number_and_index as get_tx_by_block_number_and_index_service,
 )
 from aiochainscan.services.proxy import get_tx_count as get_tx_count_service
 from aiochainscan.services.proxy import get_tx_receipt as get_tx_receipt_service
+from aiochainscan.services.proxy import (
+    get_txs_by_block_number_and_index as get_txs_by_block_number_and_index_service,
+)
 from aiochainscan.services.proxy import (
     get_uncle_by_block_number_and_index as get_uncle_by_block_number_and_index_service,
 )
-from aiochainscan.services.proxy import normalize_proxy_tx
 from aiochainscan.services.proxy import send_raw_tx as send_raw_tx_service
 from aiochainscan.services.stats import (
     normalize_daily_average_block_size,
@@ -152,6 +158,7 @@ from aiochainscan.services.token import get_token_balance as get_token_balance_s
 from aiochainscan.services.transaction import (
     get_transaction_by_hash,  # facade use-case
     normalize_transaction,
+    normalize_transactions,
 )
 
 __all__ = [
@@ -187,6 +194,7 @@ __all__ = [
     'TokenBalanceDTO',
     'normalize_block',
     'normalize_transaction',
+    'normalize_transactions',
     'normalize_log_entry',
     'normalize_logs',
     'normalize_eth_price',
@@ -217,7 +225,9 @@ __all__ = [
     'UrlBuilderEndpoint',
     'StructlogTelemetry',
     'SimpleRateLimiter',
+    'TokenBucketRateLimiter',
     'ExponentialBackoffRetry',
+    'install_uvloop',
     # New facade helpers
     'get_daily_average_block_size',
     'get_daily_block_rewards',
@@ -239,6 +249,9 @@ __all__ = [
     'get_storage_at',
     'get_block_tx_count_by_number',
     'get_tx_by_block_number_and_index',
+    'get_txs_by_block_number_and_index',
+    'get_proxy_snapshot',
+    'ProxySnapshot',
     'get_uncle_by_block_number_and_index',
     'estimate_gas',
     'send_raw_tx',
@@ -320,6 +333,7 @@ async def get_balance(
     Convenience facade for simple use without manual client wiring.
     """
 
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -337,7 +351,8 @@ async def get_balance(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 # --- Capabilities read-only facade ---
@@ -399,6 +414,7 @@ async def get_block(
 ) -> dict[str, Any]:
     """Fetch block by number via default adapter."""
 
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -417,7 +433,8 @@ async def get_block(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 # --- Typed facade helpers (non-breaking, return DTOs) ---
@@ -542,7 +559,7 @@ async def get_logs_typed(
         retry=retry,
         telemetry=telemetry,
     )
-    return normalize_logs(items)
+    return normalize_logs(items, trusted=True)
 
 
 async def get_logs_page_typed(
@@ -577,6 +594,7 @@ async def get_logs_page_typed(
     )
     from aiochainscan.adapters.simple_provider_federator import SimpleProviderFederator
 
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -609,7 +627,8 @@ async def get_logs_page_typed(
         )
         return Page(items=normalize_logs(items), next_cursor=next_cursor)
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_token_transfers_page_typed(
@@ -635,6 +654,7 @@ async def get_token_transfers_page_typed(
     from aiochainscan.adapters.simple_provider_federator import SimpleProviderFederator
     from aiochainscan.services.account import normalize_token_transfers
 
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -690,7 +710,8 @@ async def get_token_transfers_page_typed(
             )
         return Page(items=normalize_token_transfers(items), next_cursor=next_cursor)
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_address_transactions_page_typed(
@@ -712,6 +733,7 @@ async def get_address_transactions_page_typed(
     from aiochainscan.adapters.simple_provider_federator import SimpleProviderFederator
     from aiochainscan.services.account import normalize_normal_txs
 
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -767,7 +789,8 @@ async def get_address_transactions_page_typed(
             )
         return Page(items=normalize_normal_txs(items), next_cursor=next_cursor)
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_token_balance_typed(
@@ -925,6 +948,7 @@ async def get_address_balances(
     retry: RetryPolicy | None = None,
     telemetry: Telemetry | None = None,
 ) -> list[dict[str, Any]]:
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -942,7 +966,8 @@ async def get_address_balances(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_normal_transactions(
@@ -962,6 +987,7 @@ async def get_normal_transactions(
     retry: RetryPolicy | None = None,
     telemetry: Telemetry | None = None,
 ) -> list[dict[str, Any]]:
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -983,7 +1009,8 @@ async def get_normal_transactions(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_all_transactions_optimized(
@@ -1011,6 +1038,7 @@ async def get_all_transactions_optimized(
     Uses range splitting + priority queue under the hood, respects rate limits
     and works with Blockscout without API key.
     """
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -1035,7 +1063,8 @@ async def get_all_transactions_optimized(
             stats=stats,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_all_transactions_optimized_typed(
@@ -1095,6 +1124,7 @@ async def get_all_internal_transactions_optimized(
     max_attempts_per_range: int = 3,
     stats: dict[str, int] | None = None,
 ) -> list[dict[str, Any]]:
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -1118,7 +1148,8 @@ async def get_all_internal_transactions_optimized(
             stats=stats,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_all_logs_optimized(
@@ -1142,6 +1173,7 @@ async def get_all_logs_optimized(
     max_attempts_per_range: int = 3,
     stats: dict[str, int] | None = None,
 ) -> list[dict[str, Any]]:
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -1171,7 +1203,8 @@ async def get_all_logs_optimized(
             stats=stats,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_internal_transactions(
@@ -1192,6 +1225,7 @@ async def get_internal_transactions(
     retry: RetryPolicy | None = None,
     telemetry: Telemetry | None = None,
 ) -> list[dict[str, Any]]:
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -1214,7 +1248,8 @@ async def get_internal_transactions(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_token_transfers(
@@ -1236,6 +1271,7 @@ async def get_token_transfers(
     retry: RetryPolicy | None = None,
     telemetry: Telemetry | None = None,
 ) -> list[dict[str, Any]]:
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -1259,7 +1295,8 @@ async def get_token_transfers(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_mined_blocks(
@@ -1277,6 +1314,7 @@ async def get_mined_blocks(
     retry: RetryPolicy | None = None,
     telemetry: Telemetry | None = None,
 ) -> list[dict[str, Any]]:
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -1296,7 +1334,8 @@ async def get_mined_blocks(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_beacon_chain_withdrawals(
@@ -1316,6 +1355,7 @@ async def get_beacon_chain_withdrawals(
     retry: RetryPolicy | None = None,
     telemetry: Telemetry | None = None,
 ) -> list[dict[str, Any]]:
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -1337,7 +1377,8 @@ async def get_beacon_chain_withdrawals(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_account_balance_by_blockno(
@@ -1353,6 +1394,7 @@ async def get_account_balance_by_blockno(
     retry: RetryPolicy | None = None,
     telemetry: Telemetry | None = None,
 ) -> str:
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -1370,7 +1412,8 @@ async def get_account_balance_by_blockno(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_transaction(
@@ -1388,6 +1431,7 @@ async def get_transaction(
 ) -> dict[str, Any]:
     """Fetch transaction by hash via default adapter."""
 
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -1405,7 +1449,8 @@ async def get_transaction(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_token_balance(
@@ -1424,6 +1469,7 @@ async def get_token_balance(
 ) -> int:
     """Fetch ERC-20 token balance via default adapter."""
 
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -1442,7 +1488,8 @@ async def get_token_balance(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 # Backward-compatible alias
@@ -1463,6 +1510,7 @@ async def get_gas_oracle(
 ) -> dict[str, Any]:
     """Fetch gas oracle via default adapter."""
 
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -1479,7 +1527,8 @@ async def get_gas_oracle(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 # Backward-compatible alias
@@ -1508,6 +1557,7 @@ async def get_logs(
 
     from aiochainscan.services.logs import get_logs as get_logs_service
 
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -1530,7 +1580,8 @@ async def get_logs(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_eth_price(
@@ -1549,6 +1600,7 @@ async def get_eth_price(
 
     from aiochainscan.services.stats import get_eth_price as get_eth_price_service
 
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -1565,7 +1617,8 @@ async def get_eth_price(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_daily_transaction_count(
@@ -1588,6 +1641,7 @@ async def get_daily_transaction_count(
         get_daily_transaction_count as get_daily_transaction_count_service,
     )
 
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -1606,7 +1660,8 @@ async def get_daily_transaction_count(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_daily_new_address_count(
@@ -1629,6 +1684,7 @@ async def get_daily_new_address_count(
         get_daily_new_address_count as get_daily_new_address_count_service,
     )
 
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -1647,7 +1703,8 @@ async def get_daily_new_address_count(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_daily_network_tx_fee(
@@ -1670,6 +1727,7 @@ async def get_daily_network_tx_fee(
         get_daily_network_tx_fee as get_daily_network_tx_fee_service,
     )
 
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -1688,7 +1746,8 @@ async def get_daily_network_tx_fee(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_daily_network_utilization(
@@ -1711,6 +1770,7 @@ async def get_daily_network_utilization(
         get_daily_network_utilization as get_daily_network_utilization_service,
     )
 
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -1729,7 +1789,8 @@ async def get_daily_network_utilization(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 # Additional facade helpers for remaining daily series
@@ -1749,6 +1810,7 @@ async def get_daily_average_block_size(
 ) -> list[dict[str, Any]]:
     from aiochainscan.services.stats import get_daily_average_block_size as svc
 
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -1767,7 +1829,8 @@ async def get_daily_average_block_size(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_daily_block_rewards(
@@ -1786,6 +1849,7 @@ async def get_daily_block_rewards(
 ) -> list[dict[str, Any]]:
     from aiochainscan.services.stats import get_daily_block_rewards as svc
 
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -1804,7 +1868,8 @@ async def get_daily_block_rewards(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_daily_average_block_time(
@@ -1823,6 +1888,7 @@ async def get_daily_average_block_time(
 ) -> list[dict[str, Any]]:
     from aiochainscan.services.stats import get_daily_average_block_time as svc
 
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -1841,7 +1907,8 @@ async def get_daily_average_block_time(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_daily_uncle_block_count(
@@ -1860,6 +1927,7 @@ async def get_daily_uncle_block_count(
 ) -> list[dict[str, Any]]:
     from aiochainscan.services.stats import get_daily_uncle_block_count as svc
 
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -1878,7 +1946,8 @@ async def get_daily_uncle_block_count(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_daily_average_gas_limit(
@@ -1897,6 +1966,7 @@ async def get_daily_average_gas_limit(
 ) -> list[dict[str, Any]]:
     from aiochainscan.services.stats import get_daily_average_gas_limit as svc
 
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -1915,7 +1985,8 @@ async def get_daily_average_gas_limit(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_daily_total_gas_used(
@@ -1934,6 +2005,7 @@ async def get_daily_total_gas_used(
 ) -> list[dict[str, Any]]:
     from aiochainscan.services.stats import get_daily_total_gas_used as svc
 
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -1952,7 +2024,8 @@ async def get_daily_total_gas_used(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_daily_average_gas_price(
@@ -1971,6 +2044,7 @@ async def get_daily_average_gas_price(
 ) -> list[dict[str, Any]]:
     from aiochainscan.services.stats import get_daily_average_gas_price as svc
 
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -1989,7 +2063,8 @@ async def get_daily_average_gas_price(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_daily_block_count(
@@ -2008,6 +2083,7 @@ async def get_daily_block_count(
 ) -> list[dict[str, Any]]:
     from aiochainscan.services.stats import get_daily_block_count as svc
 
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -2026,7 +2102,8 @@ async def get_daily_block_count(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_daily_average_network_hash_rate(
@@ -2045,6 +2122,7 @@ async def get_daily_average_network_hash_rate(
 ) -> list[dict[str, Any]]:
     from aiochainscan.services.stats import get_daily_average_network_hash_rate as svc
 
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -2063,7 +2141,8 @@ async def get_daily_average_network_hash_rate(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_daily_average_network_difficulty(
@@ -2082,6 +2161,7 @@ async def get_daily_average_network_difficulty(
 ) -> list[dict[str, Any]]:
     from aiochainscan.services.stats import get_daily_average_network_difficulty as svc
 
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -2100,7 +2180,8 @@ async def get_daily_average_network_difficulty(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_ether_historical_daily_market_cap(
@@ -2119,6 +2200,7 @@ async def get_ether_historical_daily_market_cap(
 ) -> list[dict[str, Any]]:
     from aiochainscan.services.stats import get_ether_historical_daily_market_cap as svc
 
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -2137,7 +2219,8 @@ async def get_ether_historical_daily_market_cap(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_ether_historical_price(
@@ -2156,6 +2239,7 @@ async def get_ether_historical_price(
 ) -> list[dict[str, Any]]:
     from aiochainscan.services.stats import get_ether_historical_price as svc
 
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -2174,7 +2258,8 @@ async def get_ether_historical_price(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_block_number(
@@ -2186,10 +2271,12 @@ async def get_block_number(
     endpoint_builder: EndpointBuilder | None = None,
     rate_limiter: RateLimiter | None = None,
     retry: RetryPolicy | None = None,
+    cache: Cache | None = None,
     telemetry: Telemetry | None = None,
 ) -> str:
     """Fetch latest block number via default adapter."""
 
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -2200,12 +2287,14 @@ async def get_block_number(
             api_key=api_key,
             http=http,
             _endpoint_builder=endpoint,
+            _cache=cache,
             _rate_limiter=rate_limiter,
             _retry=retry,
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_gas_price(
@@ -2217,8 +2306,10 @@ async def get_gas_price(
     endpoint_builder: EndpointBuilder | None = None,
     rate_limiter: RateLimiter | None = None,
     retry: RetryPolicy | None = None,
+    cache: Cache | None = None,
     telemetry: Telemetry | None = None,
 ) -> str:
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -2229,12 +2320,57 @@ async def get_gas_price(
             api_key=api_key,
             http=http,
             _endpoint_builder=endpoint,
+            _cache=cache,
             _rate_limiter=rate_limiter,
             _retry=retry,
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
+
+
+async def get_proxy_snapshot(
+    *,
+    api_kind: str,
+    network: str,
+    api_key: str,
+    block_number: bool = True,
+    gas_price: bool = True,
+    tx_count_for: str | None = None,
+    tag: int | str = 'latest',
+    http: HttpClient | None = None,
+    endpoint_builder: EndpointBuilder | None = None,
+    rate_limiter: RateLimiter | None = None,
+    retry: RetryPolicy | None = None,
+    cache: Cache | None = None,
+    telemetry: Telemetry | None = None,
+) -> ProxySnapshot:
+    """Fetch block number, gas price and optionally an address nonce in one concurrent round."""
+
+    owns_http = http is None
+    http = http or AiohttpClient()
+    endpoint = endpoint_builder or UrlBuilderEndpoint()
+    telemetry = telemetry or StructlogTelemetry()
+    try:
+        return await get_proxy_snapshot_service(
+            api_kind=api_kind,
+            network=network,
+            api_key=api_key,
+            http=http,
+            _endpoint_builder=endpoint,
+            block_number=block_number,
+            gas_price=gas_price,
+            tx_count_for=tx_count_for,
+            tag=tag,
+            _cache=cache,
+            _rate_limiter=rate_limiter,
+            _retry=retry,
+            _telemetry=telemetry,
+        )
+    finally:
+        if owns_http:
+            await http.aclose()
 
 
 async def get_tx_count(
@@ -2250,6 +2386,7 @@ async def get_tx_count(
     retry: RetryPolicy | None = None,
     telemetry: Telemetry | None = None,
 ) -> str:
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -2267,7 +2404,8 @@ async def get_tx_count(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_code(
@@ -2283,6 +2421,7 @@ async def get_code(
     retry: RetryPolicy | None = None,
     telemetry: Telemetry | None = None,
 ) -> str:
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -2300,7 +2439,8 @@ async def get_code(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def eth_call(
@@ -2317,6 +2457,7 @@ async def eth_call(
     retry: RetryPolicy | None = None,
     telemetry: Telemetry | None = None,
 ) -> str:
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -2335,7 +2476,8 @@ async def eth_call(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_storage_at(
@@ -2352,6 +2494,7 @@ async def get_storage_at(
     retry: RetryPolicy | None = None,
     telemetry: Telemetry | None = None,
 ) -> str:
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -2370,7 +2513,8 @@ async def get_storage_at(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_block_tx_count_by_number(
@@ -2385,6 +2529,7 @@ async def get_block_tx_count_by_number(
     retry: RetryPolicy | None = None,
     telemetry: Telemetry | None = None,
 ) -> str:
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -2401,7 +2546,8 @@ async def get_block_tx_count_by_number(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_tx_by_block_number_and_index(
@@ -2417,6 +2563,7 @@ async def get_tx_by_block_number_and_index(
     retry: RetryPolicy | None = None,
     telemetry: Telemetry | None = None,
 ) -> dict[str, Any]:
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -2434,7 +2581,47 @@ async def get_tx_by_block_number_and_index(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
+
+
+async def get_txs_by_block_number_and_index(
+    *,
+    tag: int | str,
+    indices: Sequence[int | str],
+    api_kind: str,
+    network: str,
+    api_key: str,
+    max_concurrency: int = 8,
+    http: HttpClient | None = None,
+    endpoint_builder: EndpointBuilder | None = None,
+    rate_limiter: RateLimiter | None = None,
+    retry: RetryPolicy | None = None,
+    telemetry: Telemetry | None = None,
+) -> list[dict[str, Any]]:
+    """Fetch several transactions of one block concurrently, preserving index order."""
+
+    owns_http = http is None
+    http = http or AiohttpClient()
+    endpoint = endpoint_builder or UrlBuilderEndpoint()
+    telemetry = telemetry or StructlogTelemetry()
+    try:
+        return await get_txs_by_block_number_and_index_service(
+            tag=tag,
+            indices=indices,
+            api_kind=api_kind,
+            network=network,
+            api_key=api_key,
+            http=http,
+            _endpoint_builder=endpoint,
+            max_concurrency=max_concurrency,
+            _rate_limiter=rate_limiter,
+            _retry=retry,
+            _telemetry=telemetry,
+        )
+    finally:
+        if owns_http:
+            await http.aclose()
 
 
 async def get_uncle_by_block_number_and_index(
@@ -2450,6 +2637,7 @@ async def get_uncle_by_block_number_and_index(
     retry: RetryPolicy | None = None,
     telemetry: Telemetry | None = None,
 ) -> dict[str, Any]:
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -2467,7 +2655,8 @@ async def get_uncle_by_block_number_and_index(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def estimate_gas(
@@ -2485,6 +2674,7 @@ async def estimate_gas(
     retry: RetryPolicy | None = None,
     telemetry: Telemetry | None = None,
 ) -> str:
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -2504,7 +2694,8 @@ async def estimate_gas(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def send_raw_tx(
@@ -2519,6 +2710,7 @@ async def send_raw_tx(
     retry: RetryPolicy | None = None,
     telemetry: Telemetry | None = None,
 ) -> dict[str, Any]:
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -2535,7 +2727,8 @@ async def send_raw_tx(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_tx_receipt(
@@ -2550,6 +2743,7 @@ async def get_tx_receipt(
     retry: RetryPolicy | None = None,
     telemetry: Telemetry | None = None,
 ) -> dict[str, Any]:
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -2566,7 +2760,8 @@ async def get_tx_receipt(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_contract_abi(
@@ -2581,6 +2776,7 @@ async def get_contract_abi(
     retry: RetryPolicy | None = None,
     telemetry: Telemetry | None = None,
 ) -> str:
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -2597,7 +2793,8 @@ async def get_contract_abi(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_contract_source_code(
@@ -2612,6 +2809,7 @@ async def get_contract_source_code(
     retry: RetryPolicy | None = None,
     telemetry: Telemetry | None = None,
 ) -> list[dict[str, Any]]:
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -2628,7 +2826,8 @@ async def get_contract_source_code(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def verify_contract_source_code(
@@ -2647,6 +2846,7 @@ async def verify_contract_source_code(
     http: HttpClient | None = None
     endpoint: EndpointBuilder | None = None
     telemetry: Telemetry | None = None
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -2667,7 +2867,8 @@ async def verify_contract_source_code(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def check_verification_status(
@@ -2682,6 +2883,7 @@ async def check_verification_status(
     retry: RetryPolicy | None = None,
     telemetry: Telemetry | None = None,
 ) -> dict[str, Any]:
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -2698,7 +2900,8 @@ async def check_verification_status(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def verify_proxy_contract(
@@ -2714,6 +2917,7 @@ async def verify_proxy_contract(
     retry: RetryPolicy | None = None,
     telemetry: Telemetry | None = None,
 ) -> dict[str, Any]:
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -2731,7 +2935,8 @@ async def verify_proxy_contract(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def check_proxy_contract_verification(
@@ -2746,6 +2951,7 @@ async def check_proxy_contract_verification(
     retry: RetryPolicy | None = None,
     telemetry: Telemetry | None = None,
 ) -> dict[str, Any]:
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -2762,7 +2968,8 @@ async def check_proxy_contract_verification(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 async def get_contract_creation(
@@ -2777,6 +2984,7 @@ async def get_contract_creation(
     retry: RetryPolicy | None = None,
     telemetry: Telemetry | None = None,
 ) -> list[dict[str, Any]]:
+    owns_http = http is None
     http = http or AiohttpClient()
     endpoint = endpoint_builder or UrlBuilderEndpoint()
     telemetry = telemetry or StructlogTelemetry()
@@ -2793,7 +3001,8 @@ async def get_contract_creation(
             _telemetry=telemetry,
         )
     finally:
-        await http.aclose()
+        if owns_http:
+            await http.aclose()
 
 
 class _DefaultSession:
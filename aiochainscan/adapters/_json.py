@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+# Optional faster JSON parser (installed with the ``fast`` extra)
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+HAS_ORJSON: bool = orjson is not None
+
+# orjson turns integers beyond 64 bits into floats; a bare number of 20+ digits
+# (wei amounts, uint256 values) may not fit, so such bodies go to the stdlib parser
+_BIG_INT = re.compile(rb'[:\[,]\s*-?\d{20}')
+
+
+def json_loads(body: str | bytes) -> Any:
+    """Parse a JSON body, keeping integers of any size exact."""
+    if orjson is None:
+        return json.loads(body)
+    raw = body.encode() if isinstance(body, str) else body
+    if _BIG_INT.search(raw) is not None:
+        return json.loads(raw)
+    return orjson.loads(raw)
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize a request payload; aiohttp expects a str serializer."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            # orjson rejects integers above 64 bits and non-str dict keys
+            pass
+    return json.dumps(obj)
@@ -1,34 +1,65 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from functools import lru_cache
 from typing import Any
 
 import aiohttp
+from yarl import URL
 
+from aiochainscan.adapters._json import HAS_ORJSON, json_dumps, json_loads
 from aiochainscan.ports.http_client import HttpClient
 
 
+@lru_cache(maxsize=128)
+def _parse_url(url: str) -> URL:
+    # Services hit a handful of API roots; parse each once and let aiohttp add the query
+    return URL(url)
+
+
 class AiohttpClient(HttpClient):
     """HttpClient implementation backed by aiohttp."""
 
-    def __init__(self, *, timeout: float | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        timeout: float | None = None,
+        connection_limit: int = 100,
+        connection_limit_per_host: int = 0,
+        dns_cache_ttl: int | None = 300,
+    ) -> None:
         """Create aiohttp-based client.
 
         timeout: when None, do not enforce a client-level total timeout.
+        connection_limit: size of the keep-alive connection pool shared by all calls.
+        connection_limit_per_host: cap on sockets per host; 0 leaves it unbounded.
+        dns_cache_ttl: seconds to cache resolved hosts; None caches for the pool lifetime.
         """
         self._timeout: aiohttp.ClientTimeout | None
         if timeout is None:
             self._timeout = None
         else:
             self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self._connection_limit = connection_limit
+        self._connection_limit_per_host = connection_limit_per_host
+        self._dns_cache_ttl = dns_cache_ttl
         self._session: aiohttp.ClientSession | None = None
 
     async def _ensure_session(self) -> aiohttp.ClientSession:
         if self._session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self._connection_limit,
+                limit_per_host=self._connection_limit_per_host,
+                ttl_dns_cache=self._dns_cache_ttl,
+            )
             if self._timeout is None:
-                self._session = aiohttp.ClientSession()
+                self._session = aiohttp.ClientSession(
+                    connector=connector, json_serialize=json_dumps
+                )
             else:
-                self._session = aiohttp.ClientSession(timeout=self._timeout)
+                self._session = aiohttp.ClientSession(
+                    connector=connector, timeout=self._timeout, json_serialize=json_dumps
+                )
         return self._session
 
     async def aclose(self) -> None:
@@ -44,7 +75,7 @@ class AiohttpClient(HttpClient):
     ) -> Any:
         session = await self._ensure_session()
         async with session.get(
-            url, params=dict(params or {}), headers=dict(headers or {})
+            _parse_url(url), params=dict(params or {}), headers=dict(headers or {})
         ) as resp:
             resp.raise_for_status()
             return await self._maybe_json(resp)
@@ -58,7 +89,9 @@ class AiohttpClient(HttpClient):
         headers: Mapping[str, str] | None = None,
     ) -> Any:
         session = await self._ensure_session()
-        async with session.post(url, data=data, json=json, headers=dict(headers or {})) as resp:
+        async with session.post(
+            _parse_url(url), data=data, json=json, headers=dict(headers or {})
+        ) as resp:
             resp.raise_for_status()
             return await self._maybe_json(resp)
 
@@ -66,5 +99,9 @@ class AiohttpClient(HttpClient):
     async def _maybe_json(resp: aiohttp.ClientResponse) -> Any:
         ctype = resp.headers.get('Content-Type', '')
         if 'application/json' in ctype:
-            return await resp.json()
+            if not HAS_ORJSON:
+                return await resp.json()
+            # Parse the raw body directly; skips aiohttp's decode-to-str step
+            body = await resp.read()
+            return json_loads(body) if body.strip() else None
         return await resp.text()
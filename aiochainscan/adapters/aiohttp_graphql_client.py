@@ -5,6 +5,7 @@ from typing import Any
 
 import aiohttp
 
+from aiochainscan.adapters._json import json_dumps, json_loads
 from aiochainscan.exceptions import ChainscanClientError
 from aiochainscan.ports.graphql_client import GraphQLClient
 
@@ -18,7 +19,7 @@ class AiohttpGraphQLClient(GraphQLClient):
 
     async def _ensure_session(self) -> aiohttp.ClientSession:
         if self._session is None:
-            self._session = aiohttp.ClientSession(timeout=self._timeout)
+            self._session = aiohttp.ClientSession(timeout=self._timeout, json_serialize=json_dumps)
         return self._session
 
     async def aclose(self) -> None:
@@ -37,7 +38,7 @@ class AiohttpGraphQLClient(GraphQLClient):
         payload = {'query': query, 'variables': dict(variables or {})}
         async with session.post(url, json=payload, headers=dict(headers or {})) as resp:
             resp.raise_for_status()
-            data = await resp.json()
+            data = await resp.json(loads=json_loads)
         if not isinstance(data, dict):
             raise ChainscanClientError('Invalid GraphQL response: not a JSON object')
         if 'errors' in data and data['errors']:
@@ -119,7 +119,7 @@ class BlockscoutGraphQLBuilder(GraphQLQueryBuilder):
             try:
                 if v is None:
                     return None
-                if isinstance(v, str) and v.startswith('0x'):
+                if type(v) is str and v[:2] == '0x':  # noqa: E721
                     return v
                 return hex(int(v))
             except Exception:
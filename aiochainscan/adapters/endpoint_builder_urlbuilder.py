@@ -27,23 +27,15 @@ class _UrlSession(EndpointSession):
         # Header-based auth for specific providers (e.g., Moralis)
         if self._api_kind == 'moralis':
             # Do not append apikey to query params; add X-API-Key header instead
-            filtered_params: dict[str, Any] = self._builder._filter_params(dict(params or {}))
-            out_headers: dict[str, str] = {
-                str(k): str(v) for k, v in dict(headers or {}).items() if v is not None
-            }
+            filtered_params: dict[str, Any] = self._builder._filter_params(params or {})
+            out_headers: dict[str, str] = self._builder._filter_headers(headers or {})
             if self._api_key:
                 out_headers['X-API-Key'] = self._api_key
             return filtered_params, out_headers
 
-        # Default Etherscan-style: query param apikey
-        signed_params, signed_headers = self._builder.filter_and_sign(
-            dict(params or {}), dict(headers or {})
-        )
-        # Ensure header value types are strings
-        typed_headers: dict[str, str] = {
-            str(k): str(v) for k, v in signed_headers.items() if v is not None
-        }
-        return signed_params, typed_headers
+        # Default Etherscan-style: query param apikey. The builder copies and filters the
+        # inputs itself and its headers are already str -> str, so no extra copies here.
+        return self._builder.filter_and_sign(params, headers)
 
 
 class UrlBuilderEndpoint(EndpointBuilder):
@@ -19,8 +19,24 @@ class SimpleRateLimiter(RateLimiter):
         self._burst: int = max(1, int(burst))
         self._slots: dict[str, int] = {}
 
-    async def acquire(self, key: str) -> None:
+    def try_acquire_nowait(self, key: str) -> bool:
+        """Spend a slot for ``key`` if one is free right now; never waits."""
         if self._min_interval <= 0.0:
+            return True
+        now = time.monotonic()
+        last = self._last_call.get(key)
+        slots = self._slots.get(key, self._burst)
+        if last is not None:
+            elapsed = now - last
+            slots = min(self._burst, slots + int(elapsed / self._min_interval))
+            if slots <= 0 and elapsed < self._min_interval:
+                return False
+        self._slots[key] = max(0, slots - 1)
+        self._last_call[key] = now
+        return True
+
+    async def acquire(self, key: str) -> None:
+        if self.try_acquire_nowait(key):
             return
         now = time.monotonic()
         last = self._last_call.get(key)
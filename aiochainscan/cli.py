@@ -152,7 +152,7 @@ def cmd_test_scanner(args: argparse.Namespace) -> None:
     """Test a scanner configuration."""
     import asyncio
 
-    from aiochainscan import Client
+    from aiochainscan import Client, install_uvloop
 
     async def test_scanner() -> None:
         print(f'🧪 Testing {args.scanner} scanner...')
@@ -179,6 +179,7 @@ def cmd_test_scanner(args: argparse.Namespace) -> None:
             print(f'❌ Scanner test failed: {e}')
             sys.exit(1)
 
+    install_uvloop()
     asyncio.run(test_scanner())
 
 
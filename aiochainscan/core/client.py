@@ -6,7 +6,7 @@ from asyncio import AbstractEventLoop
 from contextlib import AbstractAsyncContextManager
 from typing import Any
 
-from aiohttp import ClientTimeout
+from aiohttp import ClientSession, ClientTimeout
 from aiohttp_retry import RetryOptionsBase
 
 from ..chain_registry import get_chain_info, resolve_chain_id
@@ -51,6 +51,7 @@ class ChainscanClient:
         proxy: str | None = None,
         throttler: AbstractAsyncContextManager[Any] | None = None,
         retry_options: RetryOptionsBase | None = None,
+        session: ClientSession | None = None,
     ):
         """
         Initialize the unified client.
@@ -67,6 +68,8 @@ class ChainscanClient:
             proxy: Proxy URL
             throttler: Rate limiting throttler
             retry_options: Retry configuration
+            session: Shared aiohttp session reused for every call (e.g. one session
+                across several clients); the caller owns and closes it
         """
         self.scanner_name = scanner_name
         self.scanner_version = scanner_version
@@ -88,6 +91,8 @@ class ChainscanClient:
         # Use chain_id to resolve the correct network name for this scanner
         scanner_network = self._get_scanner_network_name(scanner_name, network)
         self._scanner = scanner_class(api_key, scanner_network, self._url_builder, chain_id)
+        if session is not None:
+            self._scanner.session = session
 
         # Store additional config for potential future use
         self._loop = loop
@@ -107,6 +112,7 @@ class ChainscanClient:
         proxy: str | None = None,
         throttler: AbstractAsyncContextManager[Any] | None = None,
         retry_options: RetryOptionsBase | None = None,
+        session: ClientSession | None = None,
     ) -> 'ChainscanClient':
         """
         Create client using unified chain-based configuration.
@@ -122,6 +128,7 @@ class ChainscanClient:
             proxy: Proxy URL
             throttler: Rate limiting throttler
             retry_options: Retry configuration
+            session: Shared aiohttp session reused for every call; the caller owns and closes it
 
         Returns:
             Configured ChainscanClient instance
@@ -185,6 +192,7 @@ class ChainscanClient:
             proxy=proxy,
             throttler=throttler,
             retry_options=retry_options,
+            session=session,
         )
 
     def _get_scanner_network_name(self, scanner_name: str, network: str) -> str:
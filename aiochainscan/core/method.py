@@ -15,6 +15,7 @@ class Method(Enum):
 
     # Account operations
     ACCOUNT_BALANCE = auto()
+    ACCOUNT_BALANCE_MULTI = auto()
     ACCOUNT_TRANSACTIONS = auto()
     ACCOUNT_INTERNAL_TXS = auto()
     ACCOUNT_ERC20_TRANSFERS = auto()
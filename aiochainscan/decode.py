@@ -127,8 +127,7 @@ def _decode_transaction_input_fast(
     try:
         # Convert hex input to bytes
         input_hex = transaction['input']
-        if input_hex.startswith('0x'):
-            input_hex = input_hex[2:]
+        input_hex = input_hex.removeprefix('0x')
         input_bytes = bytes.fromhex(input_hex)
 
         # Convert ABI to JSON string
@@ -333,8 +332,7 @@ def decode_transaction_inputs_batch_zero_copy(
         for i, tx in enumerate(transactions):
             if tx.get('input') and len(tx['input']) >= FUNCTION_SELECTOR_LENGTH:
                 input_hex = tx['input']
-                if input_hex.startswith('0x'):
-                    input_hex = input_hex[2:]
+                input_hex = input_hex.removeprefix('0x')
                 calldatas.append(bytes.fromhex(input_hex))
                 valid_indices.append(i)
             else:
@@ -450,8 +448,7 @@ def decode_transaction_inputs_batch(
         for i, tx in enumerate(transactions):
             if tx.get('input') and len(tx['input']) >= FUNCTION_SELECTOR_LENGTH:
                 input_hex = tx['input']
-                if input_hex.startswith('0x'):
-                    input_hex = input_hex[2:]
+                input_hex = input_hex.removeprefix('0x')
                 calldatas.append(bytes.fromhex(input_hex))
                 valid_indices.append(i)
             else:
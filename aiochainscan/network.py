@@ -41,8 +41,11 @@ class Network:
         proxy: str | None = None,
         throttler: AbstractAsyncContextManager[Any] | None = None,
         retry_options: RetryOptionsBase | None = None,
+        session: ClientSession | None = None,
     ) -> None:
         self._url_builder = url_builder
+        # A caller-owned session is borrowed, never closed here
+        self._session = session
         if loop is not None:
             self._loop = loop
         else:
@@ -72,7 +75,8 @@ class Network:
 
     async def close(self) -> None:
         if self._retry_client is not None:
-            await self._retry_client.close()
+            if self._session is None:
+                await self._retry_client.close()
             self._retry_client = None
         self._bound_loop = None
 
@@ -113,11 +117,10 @@ class Network:
 
         if self._retry_client is not None and self._bound_loop is not loop:
             # Re-bind the transport if the active loop changed between requests.
-            await self._retry_client.close()
-            self._retry_client = None
+            await self.close()
 
         if self._retry_client is None:
-            session = ClientSession(timeout=self._timeout)
+            session = self._session or ClientSession(timeout=self._timeout)
             self._retry_client = RetryClient(
                 client_session=session, retry_options=self._retry_options
             )
@@ -165,6 +168,9 @@ class Network:
             request_kwargs['data'] = data
         if self._proxy is not None:
             request_kwargs['proxy'] = self._proxy
+        if self._session is not None:
+            # A borrowed session carries the caller's defaults; keep this client's timeout
+            request_kwargs['timeout'] = self._timeout
 
         return session_method(**request_kwargs)  # type: ignore[no-any-return]
 
@@ -5,6 +5,12 @@ from typing import Any, Protocol
 
 
 class HttpClient(Protocol):
+    """Async HTTP transport used by services.
+
+    Instances are meant to be long-lived: keep one pooled session open across calls
+    so requests reuse keep-alive connections instead of reconnecting each time.
+    """
+
     async def aclose(self) -> None:  # noqa: D401 - simple protocol
         """Close any underlying resources."""
 
@@ -7,7 +7,11 @@ T = TypeVar('T')
 
 
 class RateLimiter(Protocol):
-    """Rate limiter port supporting keyed acquisition."""
+    """Rate limiter port supporting keyed acquisition.
+
+    Implementations may also provide ``try_acquire_nowait(key) -> bool``, which takes a
+    slot only if one is free without waiting; callers then skip awaiting ``acquire``.
+    """
 
     async def acquire(self, key: str) -> None:
         """Acquire permission to perform an operation identified by key."""
@@ -0,0 +1,26 @@
+"""Opt-in event loop tuning for applications built on aiochainscan.
+
+The library never changes the event loop on import; call these helpers from the
+application entry point before ``asyncio.run``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+
+def install_uvloop() -> bool:
+    """Use uvloop's event loop policy when uvloop is installed.
+
+    Service calls are chains of small awaits (rate limiter, HTTP, telemetry), so a
+    faster loop directly lowers per-request overhead. Returns True when uvloop was
+    installed, False when it is unavailable (e.g. on Windows or without the ``fast``
+    extra) and the default loop stays in place.
+    """
+
+    try:
+        import uvloop  # type: ignore[import-not-found, unused-ignore]
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
@@ -21,6 +21,13 @@ class EtherscanLikeScanner(Scanner):
             param_map={'address': 'address'},
             parser=PARSERS['etherscan'],
         ),
+        Method.ACCOUNT_BALANCE_MULTI: EndpointSpec(
+            http_method='GET',
+            path='/api',
+            query={'module': 'account', 'action': 'balancemulti', 'tag': 'latest'},
+            param_map={'addresses': 'address'},
+            parser=PARSERS['etherscan'],
+        ),
         Method.ACCOUNT_TRANSACTIONS: EndpointSpec(
             http_method='GET',
             path='/api',
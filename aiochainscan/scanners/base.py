@@ -3,8 +3,11 @@ Base scanner class for implementing different blockchain explorer APIs.
 """
 
 from abc import ABC
+from contextlib import AbstractAsyncContextManager, nullcontext
 from typing import Any, Literal
 
+import aiohttp
+
 from ..chain_registry import resolve_chain_id
 from ..core.endpoint import EndpointSpec
 from ..core.method import Method
@@ -40,6 +43,9 @@ class Scanner(ABC):
     SPECS: dict[Method, EndpointSpec]
     """Mapping of logical methods to endpoint specifications"""
 
+    session: aiohttp.ClientSession | None = None
+    """Caller-owned aiohttp session; when set, requests reuse it instead of opening their own"""
+
     def __init__(
         self, api_key: str, network: str, url_builder: UrlBuilder, chain_id: int | None = None
     ) -> None:
@@ -94,7 +100,7 @@ class Scanner(ABC):
 
         # Create temporary Network instance for this request
         # Note: In production, this would be injected or cached
-        network = Network(self.url_builder)
+        network = Network(self.url_builder, session=self.session)
 
         try:
             if spec.http_method == 'GET':
@@ -111,6 +117,12 @@ class Scanner(ABC):
         finally:
             await network.close()
 
+    def _session_context(self) -> AbstractAsyncContextManager[aiohttp.ClientSession]:
+        """Yield the shared session if one is set, else a new session closed on exit."""
+        if self.session is not None:
+            return nullcontext(self.session)
+        return aiohttp.ClientSession()
+
     def _build_request(self, spec: EndpointSpec, **params: Any) -> dict[str, Any]:
         """
         Build request data from endpoint spec and parameters.
@@ -133,11 +133,9 @@ class BlockScoutV1(EtherscanLikeScanner):
         base_url = f'https://{self.instance_domain}'
         full_url = base_url + spec.path
 
-        # Use aiohttp directly for BlockScout requests
-        import aiohttp
-
+        # Use aiohttp directly for BlockScout requests (on the shared session if set)
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._session_context() as session:
                 if spec.http_method == 'GET':
                     async with session.get(
                         full_url,
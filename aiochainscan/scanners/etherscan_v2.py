@@ -47,6 +47,18 @@ class EtherscanV2(Scanner):
             param_map={'address': 'address'},
             parser=PARSERS['etherscan'],
         ),
+        Method.ACCOUNT_BALANCE_MULTI: EndpointSpec(
+            http_method='GET',
+            path='/api',
+            query={
+                'module': 'account',
+                'action': 'balancemulti',
+                'tag': 'latest',
+                'chainid': '{chain_id}',
+            },
+            param_map={'addresses': 'address'},
+            parser=PARSERS['etherscan'],
+        ),
         Method.ACCOUNT_TRANSACTIONS: EndpointSpec(
             http_method='GET',
             path='/api',
@@ -4,8 +4,6 @@ Moralis Web3 Data API v1 scanner implementation.
 
 from typing import Any
 
-import aiohttp
-
 from ..core.endpoint import PARSERS, EndpointSpec
 from ..core.method import Method
 from ..url_builder import UrlBuilder
@@ -104,9 +102,9 @@ class MoralisV1(Scanner):
         # Set up headers with authentication
         headers = {'Accept': 'application/json', 'X-API-Key': self.api_key}
 
-        # Use aiohttp directly for Moralis requests
+        # Use aiohttp directly for Moralis requests (on the shared session if set)
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._session_context() as session:
                 if spec.http_method == 'GET':
                     async with session.get(
                         full_url, params=query_params, headers=headers
@@ -78,11 +78,9 @@ class RoutScanV1(Scanner):
         base_url = f'https://api.routescan.io/v2/network/mainnet/evm/{self.chain_id}'
         full_url = base_url + spec.path
 
-        # Use aiohttp directly for RoutScan requests
-        import aiohttp
-
+        # Use aiohttp directly for RoutScan requests (on the shared session if set)
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._session_context() as session:
                 if spec.http_method == 'GET':
                     async with session.get(
                         full_url,
@@ -1,14 +1,31 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
-from collections.abc import Awaitable, Callable, Mapping
+from collections.abc import Awaitable, Callable, Coroutine, Mapping, Sequence
+from functools import partial
 from time import monotonic
-from typing import Any
+from typing import Any, TypeVar, overload
+from weakref import WeakKeyDictionary
 
+from aiochainscan.ports.endpoint_builder import EndpointBuilder, EndpointSession
 from aiochainscan.ports.rate_limiter import RateLimiter, RetryPolicy
 from aiochainscan.ports.telemetry import Telemetry
 
+T = TypeVar('T')
+
+_ENDPOINT_SESSIONS: WeakKeyDictionary[
+    EndpointBuilder, dict[tuple[str, str, str], EndpointSession]
+] = WeakKeyDictionary()
+
+_SIGNED_ACTIONS: WeakKeyDictionary[
+    EndpointSession, dict[tuple[str, str], tuple[dict[str, Any], dict[str, Any]]]
+] = WeakKeyDictionary()
+
+# Strong references keep fire-and-forget tasks alive until they finish
+_BACKGROUND_TASKS: set[asyncio.Task[Any]] = set()
+
 
 async def run_with_policies(
     *,
@@ -28,9 +45,13 @@ async def run_with_policies(
     """
 
     if rate_limiter is not None and rate_limiter_key is not None:
-        await rate_limiter.acquire(key=rate_limiter_key)
+        # Limiters with a synchronous fast path avoid awaiting while tokens are available
+        try_nowait = getattr(rate_limiter, 'try_acquire_nowait', None)
+        if try_nowait is None or not try_nowait(rate_limiter_key):
+            await rate_limiter.acquire(key=rate_limiter_key)
 
-    start = monotonic()
+    # Skip the clock read entirely when nobody records the duration
+    start = monotonic() if telemetry is not None else 0.0
     try:
         if retry_policy is not None:
             return await retry_policy.run(do_call)
@@ -52,14 +73,230 @@ async def run_with_policies(
             )
 
 
+def record_event_background(
+    telemetry: Telemetry, name: str, attributes: Mapping[str, Any] | None = None
+) -> None:
+    """Schedule ``telemetry.record_event`` without awaiting it on the caller's hot path.
+
+    Failures inside the telemetry backend are swallowed; error events that must keep
+    their ordering relative to the raised exception should still be awaited directly.
+    """
+
+    run_in_background(telemetry.record_event(name, attributes))
+
+
+def run_in_background(coro: Coroutine[Any, Any, Any]) -> None:
+    """Run ``coro`` as a fire-and-forget task; its result and failures are discarded."""
+
+    task = asyncio.create_task(coro)
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_finish_background_task)
+
+
+def _finish_background_task(task: asyncio.Task[Any]) -> None:
+    _BACKGROUND_TASKS.discard(task)
+    if not task.cancelled():
+        task.exception()
+
+
+async def coalesce_inflight(
+    inflight: dict[str, asyncio.Future[T]], key: str, do_call: Callable[[], Awaitable[T]]
+) -> T:
+    """Run ``do_call`` at most once per ``key`` at a time; concurrent callers share its outcome.
+
+    The call runs in its own task, so cancelling one caller does not cancel the shared
+    request for the others. The entry is dropped as soon as the call completes.
+    """
+
+    future = inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(do_call())
+        inflight[key] = future
+        future.add_done_callback(partial(_forget_inflight, inflight, key))
+    return await asyncio.shield(future)
+
+
+def inflight_key(key: str, *deps: object) -> str:
+    """Scope an in-flight ``key`` to the injected dependencies that run the shared call.
+
+    Callers with a different HTTP client, cache, limiter or telemetry must not share a
+    closure bound to someone else's. The ``id`` values stay unique while the entry lives,
+    because the in-flight call keeps those objects referenced.
+    """
+    return f'{key}@' + ':'.join(str(id(dep)) for dep in deps)
+
+
+def _forget_inflight(
+    inflight: dict[str, asyncio.Future[T]], key: str, future: asyncio.Future[T]
+) -> None:
+    if inflight.get(key) is future:
+        del inflight[key]
+    if not future.cancelled():
+        future.exception()
+
+
+def open_endpoint(
+    builder: EndpointBuilder, *, api_key: str, api_kind: str, network: str
+) -> EndpointSession:
+    """Return an endpoint session for (api_key, api_kind, network), memoized per builder.
+
+    Sessions only carry URLs and signing config, so one instance is reused across calls.
+    Builders that cannot be weakly referenced are opened on every call.
+    """
+
+    try:
+        sessions = _ENDPOINT_SESSIONS.setdefault(builder, {})
+    except TypeError:
+        return builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    key = (api_key, api_kind, network)
+    session = sessions.get(key)
+    if session is None:
+        session = sessions[key] = builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    return session
+
+
+def sign_action(
+    endpoint: EndpointSession, *, module: str, action: str
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Return signed (params, headers) for a bare ``module``/``action`` pair.
+
+    Only for calls whose complete parameter set is ``module``/``action``: the result
+    is computed once per session and shared, so callers must treat both mappings as
+    read-only. Calls with further parameters must sign them all via
+    ``filter_and_sign``, since builders may filter or sign over the whole set.
+    """
+
+    try:
+        signed_actions = _SIGNED_ACTIONS.setdefault(endpoint, {})
+    except TypeError:
+        return endpoint.filter_and_sign({'module': module, 'action': action}, headers=None)
+    key = (module, action)
+    signed = signed_actions.get(key)
+    if signed is None:
+        signed = signed_actions[key] = endpoint.filter_and_sign(
+            {'module': module, 'action': action}, headers=None
+        )
+    return signed
+
+
+def merge_extra_params(params: dict[str, Any], extra_params: Mapping[str, Any] | None) -> None:
+    """Copy caller-supplied ``extra_params`` into ``params`` in place, skipping ``None`` values."""
+
+    if extra_params:
+        for k, v in extra_params.items():
+            if v is not None:
+                params[k] = v
+
+
+def result_dict(response: Any) -> dict[str, Any]:
+    """Return the object under ``result`` (or the response itself), else an empty dict.
+
+    Decoded JSON only yields exact ``dict`` instances, so exact type checks suffice.
+    """
+
+    if type(response) is dict:  # noqa: E721
+        result = response.get('result', response)
+        if type(result) is dict:  # noqa: E721
+            return result
+    return {}
+
+
+@overload
+def parse_int(value: Any) -> int | None: ...
+
+
+@overload
+def parse_int(value: Any, default: int) -> int: ...
+
+
+def parse_int(value: Any, default: int | None = None) -> int | None:
+    """Parse a ``0x``-prefixed hex or decimal value; ``default`` when missing or unparsable.
+
+    Shared by DTO normalization (``None`` for absent fields) and sort keys (``default=0``).
+    """
+
+    if value is None:
+        return default
+    try:
+        if type(value) is str:  # noqa: E721
+            s = value.strip()
+            return int(s, 16) if s[:2] in ('0x', '0X') else int(s)
+        return int(value)
+    except (TypeError, ValueError, OverflowError):
+        return default
+
+
 def make_hashed_cache_key(*, prefix: str, payload: Mapping[str, Any], length: int = 24) -> str:
     """Build a deterministic short-hash cache key from an arbitrary payload.
 
-    - JSON-encodes with stable ordering and compact separators
+    - JSON-encodes with stable ordering and compact separators; non-JSON values via ``str()``
     - SHA-256 digest truncated to ``length`` (default 24 hex chars)
     - Returned format: ``"{prefix}:{short_hash}"``
     """
 
-    payload_str = json.dumps(dict(payload), sort_keys=True, separators=(',', ':'))
+    payload_str = json.dumps(dict(payload), sort_keys=True, separators=(',', ':'), default=str)
     digest = hashlib.sha256(payload_str.encode('utf-8')).hexdigest()
     return f'{prefix}:{digest[:length]}'
+
+
+async def race_candidates(
+    candidates: Sequence[str],
+    attempt: Callable[[str], Awaitable[T]],
+    *,
+    stagger_seconds: float,
+    on_failure: Callable[[str, BaseException], None] | None = None,
+) -> tuple[str, T]:
+    """Return ``(candidate, result)`` for the first candidate whose attempt succeeds.
+
+    Candidates are started in order. The next one is launched as soon as an in-flight
+    attempt fails, or when ``stagger_seconds`` pass without any attempt finishing, so a
+    fast first candidate costs a single request while slow/broken ones overlap.
+    Remaining attempts are cancelled once a winner is found. If every attempt fails,
+    the last exception is re-raised.
+    """
+
+    if not candidates:
+        raise ValueError('race_candidates requires at least one candidate')
+
+    queue = list(candidates)
+    owners: dict[asyncio.Future[T], str] = {}
+    last_exc: BaseException | None = None
+
+    def _launch_next() -> None:
+        if queue:
+            candidate = queue.pop(0)
+            owners[asyncio.ensure_future(attempt(candidate))] = candidate
+
+    _launch_next()
+    try:
+        while owners:
+            done, _ = await asyncio.wait(
+                owners,
+                timeout=stagger_seconds if queue else None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                _launch_next()
+                continue
+            # Prefer the earliest-launched candidate when several finish together
+            for task in sorted(done, key=list(owners).index):
+                candidate = owners.pop(task)
+                exc = task.exception()
+                if exc is None:
+                    return candidate, task.result()
+                last_exc = exc
+                if on_failure is not None:
+                    on_failure(candidate, exc)
+                _launch_next()
+    finally:
+        for task in owners:
+            if task.done():
+                # Finished alongside the winner; retrieve any failure so it is not reported
+                # as "Task exception was never retrieved"
+                if not task.cancelled():
+                    task.exception()
+            else:
+                task.cancel()
+
+    assert last_exc is not None
+    raise last_exc
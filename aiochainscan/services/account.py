@@ -18,7 +18,12 @@ from aiochainscan.ports.endpoint_builder import EndpointBuilder
 from aiochainscan.ports.http_client import HttpClient
 from aiochainscan.ports.rate_limiter import RateLimiter, RetryPolicy
 from aiochainscan.ports.telemetry import Telemetry
-from aiochainscan.services._executor import run_with_policies
+from aiochainscan.services._executor import (
+    merge_extra_params,
+    open_endpoint,
+    parse_int,
+    run_with_policies,
+)
 
 CACHE_TTL_SECONDS_BALANCE: int = 10
 
@@ -42,7 +47,9 @@ async def get_address_balance(
     This is a thin use-case wrapper. It composes URL and delegates HTTP to the provided port.
     """
 
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
     cache_key = f'balance:{api_kind}:{network}:{address}'
 
@@ -52,8 +59,7 @@ async def get_address_balance(
         'address': str(address),
         'tag': 'latest',
     }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
+    merge_extra_params(params, extra_params)
 
     signed_params, headers = endpoint.filter_and_sign(params, headers=None)
 
@@ -118,7 +124,9 @@ async def get_address_balances(
     _retry: RetryPolicy | None = None,
     _telemetry: Telemetry | None = None,
 ) -> list[dict[str, Any]]:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
     params: dict[str, Any] = {
         'module': 'account',
@@ -126,8 +134,7 @@ async def get_address_balances(
         'address': ','.join(addresses),
         'tag': tag,
     }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
+    merge_extra_params(params, extra_params)
     signed_params, headers = endpoint.filter_and_sign(params, headers=None)
 
     response: Any = await run_with_policies(
@@ -179,7 +186,9 @@ async def get_normal_transactions(
     _retry: RetryPolicy | None = None,
     _telemetry: Telemetry | None = None,
 ) -> list[dict[str, Any]]:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
     params: dict[str, Any] = {
         'module': 'account',
@@ -191,8 +200,7 @@ async def get_normal_transactions(
         'page': page,
         'offset': offset,
     }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
+    merge_extra_params(params, extra_params)
     signed_params, headers = endpoint.filter_and_sign(params, headers=None)
 
     response: Any = await run_with_policies(
@@ -246,7 +254,9 @@ async def get_internal_transactions(
     _retry: RetryPolicy | None = None,
     _telemetry: Telemetry | None = None,
 ) -> list[dict[str, Any]]:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
     params: dict[str, Any] = {
         'module': 'account',
@@ -259,8 +269,7 @@ async def get_internal_transactions(
         'offset': offset,
         'txhash': txhash,
     }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
+    merge_extra_params(params, extra_params)
     signed_params, headers = endpoint.filter_and_sign(params, headers=None)
 
     response: Any = await run_with_policies(
@@ -316,7 +325,9 @@ async def get_token_transfers(
     _telemetry: Telemetry | None = None,
     preserve_none: bool = False,
 ) -> list[dict[str, Any]]:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
     actions = {'erc20': 'tokentx', 'erc721': 'tokennfttx', 'erc1155': 'token1155tx'}
     params: dict[str, Any] = {
@@ -335,8 +346,7 @@ async def get_token_transfers(
     # Preserve or drop None-valued optional keys depending on caller needs
     if not preserve_none:
         params = {k: v for k, v in params.items() if v is not None}
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
+    merge_extra_params(params, extra_params)
     signed_params, headers = endpoint.filter_and_sign(params, headers=None)
 
     response: Any = await run_with_policies(
@@ -468,7 +478,9 @@ async def get_all_transactions_optimized(
 
     # Resolve end_block if not provided (use proxy.eth_blockNumber contract via ports)
     if end_block is None:
-        endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+        endpoint = open_endpoint(
+            _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+        )
         url: str = endpoint.api_url
         # Attempt 1: proxy.eth_blockNumber
         try:
@@ -720,21 +732,11 @@ async def get_all_transactions_optimized(
             unique.append(it)
 
         # stable sort
-        def _to_int(v: Any) -> int:
-            with _suppress(Exception):
-                if isinstance(v, str):
-                    s = v.strip()
-                    if s.startswith('0x'):
-                        return int(s, 16)
-                    return int(s)
-                return int(v)
-            return 0
-
         with _suppress(Exception):
             unique.sort(
                 key=lambda it: (
-                    _to_int(it.get('blockNumber')),
-                    _to_int(it.get('transactionIndex')),
+                    parse_int(it.get('blockNumber'), 0),
+                    parse_int(it.get('transactionIndex'), 0),
                 )
             )
 
@@ -805,19 +807,11 @@ async def get_all_transactions_optimized(
         seen2.add(h)
         unique2.append(it)
 
-    def _to_int2(v: Any) -> int:
-        try:
-            if isinstance(v, str):
-                s = v.strip()
-                if s.startswith('0x'):
-                    return int(s, 16)
-                return int(s)
-            return int(v)
-        except Exception:
-            return 0
-
     unique2.sort(
-        key=lambda it: (_to_int2(it.get('blockNumber')), _to_int2(it.get('transactionIndex')))
+        key=lambda it: (
+            parse_int(it.get('blockNumber'), 0),
+            parse_int(it.get('transactionIndex'), 0),
+        )
     )
 
     if _telemetry is not None:
@@ -867,7 +861,9 @@ async def get_all_internal_transactions_optimized(
     # Resolve latest block when needed (same as above)
 
     if end_block is None:
-        endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+        endpoint = open_endpoint(
+            _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+        )
         url: str = endpoint.api_url
         try:
             params_proxy: dict[str, Any] = {'module': 'proxy', 'action': 'eth_blockNumber'}
@@ -997,19 +993,11 @@ async def get_all_internal_transactions_optimized(
         seen.add(h)
         unique.append(it)
 
-    def _to_int2(v: Any) -> int:
-        try:
-            if isinstance(v, str):
-                s = v.strip()
-                if s.startswith('0x'):
-                    return int(s, 16)
-                return int(s)
-            return int(v)
-        except Exception:
-            return 0
-
     unique.sort(
-        key=lambda it: (_to_int2(it.get('blockNumber')), _to_int2(it.get('transactionIndex')))
+        key=lambda it: (
+            parse_int(it.get('blockNumber'), 0),
+            parse_int(it.get('transactionIndex'), 0),
+        )
     )
     if stats is not None:
         stats.update(
@@ -1034,7 +1022,9 @@ async def get_mined_blocks(
     _retry: RetryPolicy | None = None,
     _telemetry: Telemetry | None = None,
 ) -> list[dict[str, Any]]:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
     params: dict[str, Any] = {
         'module': 'account',
@@ -1044,8 +1034,7 @@ async def get_mined_blocks(
         'page': page,
         'offset': offset,
     }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
+    merge_extra_params(params, extra_params)
     signed_params, headers = endpoint.filter_and_sign(params, headers=None)
 
     response: Any = await run_with_policies(
@@ -1098,7 +1087,9 @@ async def get_beacon_chain_withdrawals(
     _retry: RetryPolicy | None = None,
     _telemetry: Telemetry | None = None,
 ) -> list[dict[str, Any]]:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
     params: dict[str, Any] = {
         'module': 'account',
@@ -1110,8 +1101,7 @@ async def get_beacon_chain_withdrawals(
         'page': page,
         'offset': offset,
     }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
+    merge_extra_params(params, extra_params)
     signed_params, headers = endpoint.filter_and_sign(params, headers=None)
 
     response: Any = await run_with_policies(
@@ -1160,7 +1150,9 @@ async def get_account_balance_by_blockno(
     _retry: RetryPolicy | None = None,
     _telemetry: Telemetry | None = None,
 ) -> str:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
     params: dict[str, Any] = {
         'module': 'account',
@@ -1168,14 +1160,13 @@ async def get_account_balance_by_blockno(
         'address': address,
         'blockno': blockno,
     }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
+    merge_extra_params(params, extra_params)
     signed_params, headers = endpoint.filter_and_sign(params, headers=None)
 
     async def _do_request() -> Any:
         if _rate_limiter is not None:
             await _rate_limiter.acquire(key=f'{api_kind}:{network}:balancehistory')
-        start = monotonic()
+        start = monotonic() if _telemetry is not None else 0.0
         try:
             return await http.get(url, params=signed_params, headers=headers)
         finally:
@@ -9,7 +9,12 @@ from aiochainscan.ports.endpoint_builder import EndpointBuilder
 from aiochainscan.ports.http_client import HttpClient
 from aiochainscan.ports.rate_limiter import RateLimiter, RetryPolicy
 from aiochainscan.ports.telemetry import Telemetry
-from aiochainscan.services._executor import run_with_policies
+from aiochainscan.services._executor import (
+    merge_extra_params,
+    open_endpoint,
+    parse_int,
+    run_with_policies,
+)
 
 CACHE_TTL_SECONDS: int = 5
 
@@ -43,7 +48,9 @@ async def get_block_by_number(
 ) -> dict[str, Any]:
     """Fetch block by number via proxy.eth_getBlockByNumber."""
 
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
     cache_key = f'block:{api_kind}:{network}:{_to_tag(tag)}:{full}'
 
@@ -53,8 +60,7 @@ async def get_block_by_number(
         'boolean': str(full).lower(),
         'tag': _to_tag(tag),
     }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
+    merge_extra_params(params, extra_params)
 
     signed_params, headers = endpoint.filter_and_sign(params, headers=None)
 
@@ -119,7 +125,9 @@ async def get_block_countdown(
     (e.g., "No transactions found").
     """
 
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
 
     params: dict[str, Any] = {
@@ -127,8 +135,7 @@ async def get_block_countdown(
         'action': 'getblockcountdown',
         'blockno': block_no,
     }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
+    merge_extra_params(params, extra_params)
 
     signed_params, headers = endpoint.filter_and_sign(params, headers=None)
 
@@ -186,15 +193,16 @@ async def get_block_reward(
     Returns provider-shaped dict or None when provider reports no reward/status=0.
     """
 
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
     params: dict[str, Any] = {
         'module': 'block',
         'action': 'getblockreward',
         'blockno': block_no,
     }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
+    merge_extra_params(params, extra_params)
     signed_params, headers = endpoint.filter_and_sign(params, headers=None)
 
     response: Any = await run_with_policies(
@@ -231,7 +239,9 @@ async def get_block_number_by_timestamp(
     _telemetry: Telemetry | None = None,
 ) -> dict[str, Any]:
     """Get Block Number by Timestamp (Etherscan-compatible)."""
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
     params: dict[str, Any] = {
         'module': 'block',
@@ -239,8 +249,7 @@ async def get_block_number_by_timestamp(
         'timestamp': ts,
         'closest': closest,
     }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
+    merge_extra_params(params, extra_params)
     signed_params, headers = endpoint.filter_and_sign(params, headers=None)
 
     response: Any = await run_with_policies(
@@ -262,25 +271,16 @@ async def get_block_number_by_timestamp(
 
 def normalize_block(raw: dict[str, Any]) -> BlockDTO:
     """Normalize provider-shaped block into BlockDTO."""
-
-    def hex_to_int(h: str | None) -> int | None:
-        if not h:
-            return None
-        try:
-            return int(h, 16) if isinstance(h, str) and h.startswith('0x') else int(h)
-        except Exception:
-            return None
-
     txs = raw.get('transactions')
     tx_count: int | None = len(txs) if isinstance(txs, list) else None
 
     return {
-        'block_number': hex_to_int(raw.get('number') or raw.get('blockNumber')),
+        'block_number': parse_int(raw.get('number') or raw.get('blockNumber')),
         'hash': raw.get('hash'),
         'parent_hash': raw.get('parentHash'),
         'miner': raw.get('miner') or raw.get('author'),
-        'timestamp': hex_to_int(raw.get('timestamp')),
-        'gas_limit': hex_to_int(raw.get('gasLimit')),
-        'gas_used': hex_to_int(raw.get('gasUsed')),
+        'timestamp': parse_int(raw.get('timestamp')),
+        'gas_limit': parse_int(raw.get('gasLimit')),
+        'gas_used': parse_int(raw.get('gasUsed')),
         'tx_count': tx_count,
     }
@@ -7,15 +7,27 @@ Conservative defaults; individual services may override via DI if needed.
 
 # Blocks / proxy derived reads
 CACHE_TTL_BLOCK_SECONDS: int = 5
+# Head block / gas price move on block time; keeps hot polling loops to ~1 request per TTL
+CACHE_TTL_BLOCK_NUMBER_SECONDS: int = 1
+CACHE_TTL_GAS_PRICE_SECONDS: int = 2
 
 # Gas oracle
 CACHE_TTL_GAS_SECONDS: int = 5
 
-# Logs queries
+# Logs queries: fresh for CACHE_TTL_LOGS_SECONDS, then served stale while a background
+# refresh runs until CACHE_STALE_TTL_LOGS_SECONDS
 CACHE_TTL_LOGS_SECONDS: int = 15
+CACHE_STALE_TTL_LOGS_SECONDS: int = 60
+# Empty logs results for block ranges safely behind the chain head never change
+CACHE_TTL_LOGS_FINAL_EMPTY_SECONDS: int = 86_400
 
-# Token balance
+# Token balance: fresh for CACHE_TTL_TOKEN_BALANCE_SECONDS, then served stale while a
+# background refresh runs until CACHE_STALE_TTL_TOKEN_BALANCE_SECONDS
 CACHE_TTL_TOKEN_BALANCE_SECONDS: int = 10
+CACHE_STALE_TTL_TOKEN_BALANCE_SECONDS: int = 60
+# Each entry's fresh window is shortened by a random fraction up to this share of the
+# TTL, so hot keys written together do not all refresh at the same instant
+CACHE_REFRESH_JITTER_TOKEN_BALANCE: float = 0.2
 
 # ETH price stats
 CACHE_TTL_ETH_PRICE_SECONDS: int = 30
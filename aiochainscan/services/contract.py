@@ -8,6 +8,7 @@ from aiochainscan.ports.endpoint_builder import EndpointBuilder
 from aiochainscan.ports.http_client import HttpClient
 from aiochainscan.ports.rate_limiter import RateLimiter, RetryPolicy
 from aiochainscan.ports.telemetry import Telemetry
+from aiochainscan.services._executor import merge_extra_params, open_endpoint
 
 
 async def get_contract_abi(
@@ -23,22 +24,23 @@ async def get_contract_abi(
     _retry: RetryPolicy | None = None,
     _telemetry: Telemetry | None = None,
 ) -> str:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
     params: dict[str, Any] = {
         'module': 'contract',
         'action': 'getabi',
         'address': address,
     }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
+    merge_extra_params(params, extra_params)
 
     signed_params, headers = endpoint.filter_and_sign(params, headers=None)
 
     async def _do_request() -> Any:
         if _rate_limiter is not None:
             await _rate_limiter.acquire(key=f'{api_kind}:{network}:contract.getabi')
-        start = monotonic()
+        start = monotonic() if _telemetry is not None else 0.0
         try:
             return await http.get(url, params=signed_params, headers=headers)
         finally:
@@ -89,18 +91,19 @@ async def get_contract_source_code(
     _retry: RetryPolicy | None = None,
     _telemetry: Telemetry | None = None,
 ) -> list[dict[str, Any]]:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
     params: dict[str, Any] = {
         'module': 'contract',
         'action': 'getsourcecode',
         'address': address,
     }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
+    merge_extra_params(params, extra_params)
 
     signed_params, headers = endpoint.filter_and_sign(params, headers=None)
-    start = monotonic()
+    start = monotonic() if _telemetry is not None else 0.0
 
     async def _do_request() -> Any:
         if _rate_limiter is not None:
@@ -160,7 +163,9 @@ async def verify_contract_source_code(
     _retry: RetryPolicy | None = None,
     _telemetry: Telemetry | None = None,
 ) -> dict[str, Any]:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
     data: dict[str, Any] = {
         'module': 'contract',
@@ -179,11 +184,10 @@ async def verify_contract_source_code(
             data[f'libraryname{idx}'] = name
             data[f'libraryaddress{idx}'] = addr
             idx += 1
-    if extra_params:
-        data.update({k: v for k, v in extra_params.items() if v is not None})
+    merge_extra_params(data, extra_params)
 
     signed_data, headers = endpoint.filter_and_sign(data, headers=None)
-    start = monotonic()
+    start = monotonic() if _telemetry is not None else 0.0
 
     async def _do_request() -> Any:
         if _rate_limiter is not None:
@@ -224,11 +228,13 @@ async def check_verification_status(
     _retry: RetryPolicy | None = None,
     _telemetry: Telemetry | None = None,
 ) -> dict[str, Any]:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
     params = {'module': 'contract', 'action': 'checkverifystatus', 'guid': guid}
     signed_params, headers = endpoint.filter_and_sign(params, headers=None)
-    start = monotonic()
+    start = monotonic() if _telemetry is not None else 0.0
 
     async def _do_request() -> Any:
         if _rate_limiter is not None:
@@ -270,7 +276,9 @@ async def verify_proxy_contract(
     _retry: RetryPolicy | None = None,
     _telemetry: Telemetry | None = None,
 ) -> dict[str, Any]:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
     data: dict[str, Any] = {
         'module': 'contract',
@@ -279,7 +287,7 @@ async def verify_proxy_contract(
         'expectedimplementation': expected_implementation,
     }
     signed_data, headers = endpoint.filter_and_sign(data, headers=None)
-    start = monotonic()
+    start = monotonic() if _telemetry is not None else 0.0
 
     async def _do_request() -> Any:
         if _rate_limiter is not None:
@@ -320,7 +328,9 @@ async def check_proxy_contract_verification(
     _retry: RetryPolicy | None = None,
     _telemetry: Telemetry | None = None,
 ) -> dict[str, Any]:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
     params = {'module': 'contract', 'action': 'checkproxyverification', 'guid': guid}
     signed_params, headers = endpoint.filter_and_sign(params, headers=None)
@@ -344,7 +354,9 @@ async def get_contract_creation(
     _retry: RetryPolicy | None = None,
     _telemetry: Telemetry | None = None,
 ) -> list[dict[str, Any]]:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
     params: dict[str, Any] = {
         'module': 'contract',
@@ -352,7 +364,7 @@ async def get_contract_creation(
         'contractaddresses': ','.join(contract_addresses),
     }
     signed_params, headers = endpoint.filter_and_sign(params, headers=None)
-    start = monotonic()
+    start = monotonic() if _telemetry is not None else 0.0
 
     async def _do_request() -> Any:
         if _rate_limiter is not None:
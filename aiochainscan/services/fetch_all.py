@@ -6,6 +6,7 @@ from aiochainscan.ports.endpoint_builder import EndpointBuilder
 from aiochainscan.ports.http_client import HttpClient
 from aiochainscan.ports.rate_limiter import RateLimiter, RetryPolicy
 from aiochainscan.ports.telemetry import Telemetry
+from aiochainscan.services._executor import open_endpoint, parse_int
 from aiochainscan.services.account import (
     get_internal_transactions,
     get_normal_transactions,
@@ -21,18 +22,6 @@ from aiochainscan.services.paging_engine import (
 )
 
 
-def _to_int(value: Any) -> int:
-    try:
-        if isinstance(value, str):
-            s = value.strip()
-            if s.startswith('0x'):
-                return int(s, 16)
-            return int(s)
-        return int(value)
-    except Exception:
-        return 0
-
-
 def _resolve_end_block_factory(
     *,
     api_kind: str,
@@ -44,7 +33,9 @@ def _resolve_end_block_factory(
     retry: RetryPolicy | None,
 ) -> ResolveEndBlock:
     async def _resolve() -> int:
-        endpoint = endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+        endpoint = open_endpoint(
+            endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+        )
         url: str = endpoint.api_url
         params_proxy: dict[str, Any] = {'module': 'proxy', 'action': 'eth_blockNumber'}
         signed_params, headers = endpoint.filter_and_sign(params_proxy, headers=None)
@@ -107,7 +98,10 @@ async def fetch_all_transactions_basic(
         name='account.txs',
         fetch_page=_fetch_page,
         key_fn=lambda it: it.get('hash') if isinstance(it.get('hash'), str) else None,
-        order_fn=lambda it: (_to_int(it.get('blockNumber')), _to_int(it.get('transactionIndex'))),
+        order_fn=lambda it: (
+            parse_int(it.get('blockNumber'), 0),
+            parse_int(it.get('transactionIndex'), 0),
+        ),
         max_offset=max_offset,
         resolve_end_block=(
             None
@@ -122,6 +116,7 @@ async def fetch_all_transactions_basic(
                 retry=retry,
             )
         ),
+        trusted=True,
     )
     policy = ProviderPolicy(
         mode='paged', prefetch=1, window_cap=None, rps_key=f'{api_kind}:{network}:paging'
@@ -181,7 +176,10 @@ async def fetch_all_transactions_fast(
         name='account.txs',
         fetch_page=_fetch_page,
         key_fn=lambda it: it.get('hash') if isinstance(it.get('hash'), str) else None,
-        order_fn=lambda it: (_to_int(it.get('blockNumber')), _to_int(it.get('transactionIndex'))),
+        order_fn=lambda it: (
+            parse_int(it.get('blockNumber'), 0),
+            parse_int(it.get('transactionIndex'), 0),
+        ),
         max_offset=max_offset,
         resolve_end_block=(
             None
@@ -196,6 +194,7 @@ async def fetch_all_transactions_fast(
                 retry=retry,
             )
         ),
+        trusted=True,
     )
     policy = resolve_policy_for_provider(
         api_kind=api_kind, network=network, max_concurrent=max_concurrent
@@ -272,7 +271,10 @@ async def fetch_all_internal_basic(
         name='account.internal',
         fetch_page=_fetch_page,
         key_fn=lambda it: it.get('hash') if isinstance(it.get('hash'), str) else None,
-        order_fn=lambda it: (_to_int(it.get('blockNumber')), _to_int(it.get('transactionIndex'))),
+        order_fn=lambda it: (
+            parse_int(it.get('blockNumber'), 0),
+            parse_int(it.get('transactionIndex'), 0),
+        ),
         max_offset=max_offset,
         resolve_end_block=(
             None
@@ -287,6 +289,7 @@ async def fetch_all_internal_basic(
                 retry=retry,
             )
         ),
+        trusted=True,
     )
     policy = ProviderPolicy(
         mode='paged', prefetch=1, window_cap=None, rps_key=f'{api_kind}:{network}:paging'
@@ -346,7 +349,10 @@ async def fetch_all_internal_fast(
         name='account.internal',
         fetch_page=_fetch_page,
         key_fn=lambda it: it.get('hash') if isinstance(it.get('hash'), str) else None,
-        order_fn=lambda it: (_to_int(it.get('blockNumber')), _to_int(it.get('transactionIndex'))),
+        order_fn=lambda it: (
+            parse_int(it.get('blockNumber'), 0),
+            parse_int(it.get('transactionIndex'), 0),
+        ),
         max_offset=max_offset,
         resolve_end_block=_resolve_end_block_factory(
             api_kind=api_kind,
@@ -357,6 +363,7 @@ async def fetch_all_internal_fast(
             rate_limiter=rate_limiter,
             retry=retry,
         ),
+        trusted=True,
     )
     policy = resolve_policy_for_provider(
         api_kind=api_kind, network=network, max_concurrent=max_concurrent
@@ -429,7 +436,10 @@ async def fetch_all_token_transfers_basic(
         name='account.erc20',
         fetch_page=_fetch_page,
         key_fn=_key_fn,
-        order_fn=lambda it: (_to_int(it.get('blockNumber')), _to_int(it.get('transactionIndex'))),
+        order_fn=lambda it: (
+            parse_int(it.get('blockNumber'), 0),
+            parse_int(it.get('transactionIndex'), 0),
+        ),
         max_offset=max_offset,
         resolve_end_block=(
             None
@@ -444,6 +454,7 @@ async def fetch_all_token_transfers_basic(
                 retry=retry,
             )
         ),
+        trusted=True,
     )
     policy = ProviderPolicy(
         mode='paged', prefetch=1, window_cap=None, rps_key=f'{api_kind}:{network}:paging'
@@ -514,7 +525,10 @@ async def fetch_all_token_transfers_fast(
         name='account.erc20',
         fetch_page=_fetch_page,
         key_fn=_key_fn,
-        order_fn=lambda it: (_to_int(it.get('blockNumber')), _to_int(it.get('transactionIndex'))),
+        order_fn=lambda it: (
+            parse_int(it.get('blockNumber'), 0),
+            parse_int(it.get('transactionIndex'), 0),
+        ),
         max_offset=max_offset,
         resolve_end_block=_resolve_end_block_factory(
             api_kind=api_kind,
@@ -525,6 +539,7 @@ async def fetch_all_token_transfers_fast(
             rate_limiter=rate_limiter,
             retry=retry,
         ),
+        trusted=True,
     )
     policy = resolve_policy_for_provider(
         api_kind=api_kind, network=network, max_concurrent=max_concurrent
@@ -593,7 +608,10 @@ async def fetch_all_logs_basic(
             and isinstance(it.get('logIndex'), str | int)
             else None
         ),
-        order_fn=lambda it: (_to_int(it.get('blockNumber')), _to_int(it.get('logIndex'))),
+        order_fn=lambda it: (
+            parse_int(it.get('blockNumber'), 0),
+            parse_int(it.get('logIndex'), 0),
+        ),
         max_offset=max_offset,
         resolve_end_block=(
             None
@@ -608,6 +626,7 @@ async def fetch_all_logs_basic(
                 retry=retry,
             )
         ),
+        trusted=True,
     )
     policy = ProviderPolicy(
         mode='paged', prefetch=1, window_cap=None, rps_key=f'{api_kind}:{network}:paging'
@@ -677,7 +696,10 @@ async def fetch_all_logs_fast(
             and isinstance(it.get('logIndex'), str | int)
             else None
         ),
-        order_fn=lambda it: (_to_int(it.get('blockNumber')), _to_int(it.get('logIndex'))),
+        order_fn=lambda it: (
+            parse_int(it.get('blockNumber'), 0),
+            parse_int(it.get('logIndex'), 0),
+        ),
         max_offset=max_offset,
         resolve_end_block=_resolve_end_block_factory(
             api_kind=api_kind,
@@ -688,6 +710,7 @@ async def fetch_all_logs_fast(
             rate_limiter=rate_limiter,
             retry=retry,
         ),
+        trusted=True,
     )
     policy = resolve_policy_for_provider(
         api_kind=api_kind, network=network, max_concurrent=max_concurrent
@@ -763,7 +786,10 @@ async def fetch_all_transactions_eth_sliding(
             _telemetry=telemetry,
         ),
         key_fn=lambda it: it.get('hash') if isinstance(it.get('hash'), str) else None,
-        order_fn=lambda it: (_to_int(it.get('blockNumber')), _to_int(it.get('transactionIndex'))),
+        order_fn=lambda it: (
+            parse_int(it.get('blockNumber'), 0),
+            parse_int(it.get('transactionIndex'), 0),
+        ),
         max_offset=min(10_000, int(max_offset)),
         resolve_end_block=_resolve_end_block_factory(
             api_kind=api_kind,
@@ -774,6 +800,7 @@ async def fetch_all_transactions_eth_sliding(
             rate_limiter=rate_limiter,
             retry=retry,
         ),
+        trusted=True,
     )
     policy = ProviderPolicy(
         mode='sliding', prefetch=1, window_cap=10_000, rps_key=f'{api_kind}:{network}:txlist'
@@ -846,7 +873,10 @@ async def fetch_all_transactions_eth_sliding_fast(
             _telemetry=telemetry,
         ),
         key_fn=lambda it: it.get('hash') if isinstance(it.get('hash'), str) else None,
-        order_fn=lambda it: (_to_int(it.get('blockNumber')), _to_int(it.get('transactionIndex'))),
+        order_fn=lambda it: (
+            parse_int(it.get('blockNumber'), 0),
+            parse_int(it.get('transactionIndex'), 0),
+        ),
         max_offset=min(10_000, int(max_offset)),
         resolve_end_block=_resolve_end_block_factory(
             api_kind=api_kind,
@@ -857,6 +887,7 @@ async def fetch_all_transactions_eth_sliding_fast(
             rate_limiter=rate_limiter,
             retry=retry,
         ),
+        trusted=True,
     )
     policy = ProviderPolicy(
         mode='sliding_bi', prefetch=1, window_cap=10_000, rps_key=f'{api_kind}:{network}:txlist'
@@ -9,7 +9,7 @@ from aiochainscan.ports.endpoint_builder import EndpointBuilder
 from aiochainscan.ports.http_client import HttpClient
 from aiochainscan.ports.rate_limiter import RateLimiter, RetryPolicy
 from aiochainscan.ports.telemetry import Telemetry
-from aiochainscan.services._executor import run_with_policies
+from aiochainscan.services._executor import merge_extra_params, open_endpoint, run_with_policies
 from aiochainscan.services.constants import CACHE_TTL_GAS_SECONDS as CACHE_TTL_SECONDS
 
 
@@ -31,15 +31,16 @@ async def get_gas_oracle(
     Returns a provider-specific mapping. No normalization is performed at this layer.
     """
 
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
 
     params: dict[str, Any] = {
         'module': 'gastracker',
         'action': 'gasoracle',
     }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
+    merge_extra_params(params, extra_params)
 
     signed_params, headers = endpoint.filter_and_sign(params, headers=None)
 
@@ -88,7 +89,9 @@ async def get_gas_estimate(
     _telemetry: Telemetry | None = None,
 ) -> dict[str, Any]:
     """Get gas estimate via gastracker.gasestimate (provider-shaped)."""
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
 
     params: dict[str, Any] = {
@@ -96,8 +99,7 @@ async def get_gas_estimate(
         'action': 'gasestimate',
         'gasprice': gasprice_wei,
     }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
+    merge_extra_params(params, extra_params)
     signed_params, headers = endpoint.filter_and_sign(params, headers=None)
 
     response: Any = await run_with_policies(
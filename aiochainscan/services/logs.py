@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Mapping
-from time import monotonic
+from functools import partial
+from operator import itemgetter
+from time import monotonic, time
 from typing import Any
 
 from aiochainscan.domain.dto import LogEntryDTO
@@ -14,10 +17,42 @@ from aiochainscan.ports.http_client import HttpClient
 from aiochainscan.ports.provider_federator import ProviderFederator
 from aiochainscan.ports.rate_limiter import RateLimiter, RetryPolicy
 from aiochainscan.ports.telemetry import Telemetry
-from aiochainscan.services._executor import make_hashed_cache_key, run_with_policies
+from aiochainscan.services._executor import (
+    coalesce_inflight,
+    inflight_key,
+    merge_extra_params,
+    open_endpoint,
+    parse_int,
+    race_candidates,
+    record_event_background,
+    run_in_background,
+    run_with_policies,
+)
+from aiochainscan.services.constants import CACHE_STALE_TTL_LOGS_SECONDS as CACHE_STALE_TTL_SECONDS
+from aiochainscan.services.constants import (
+    CACHE_TTL_LOGS_FINAL_EMPTY_SECONDS as CACHE_TTL_FINAL_EMPTY_SECONDS,
+)
 from aiochainscan.services.constants import CACHE_TTL_LOGS_SECONDS as CACHE_TTL_SECONDS
 from aiochainscan.services.pagination import encode_rest_cursor
 
+# Delay before overlapping the next GraphQL candidate URL while earlier ones are in flight
+GQL_PROBE_STAGGER_SECONDS: float = 0.25
+
+# Last GraphQL URL that answered per (api_kind, network); per-process only
+_GQL_URL_CACHE: dict[tuple[str, str], str] = {}
+
+# Blocks behind the latest observed head treated as final (reorg-safe) for negative caching
+REORG_DEPTH_BLOCKS: int = 64
+
+# Latest block number observed per (api_kind, network); per-process only
+_LATEST_BLOCKS: dict[tuple[str, str], int] = {}
+
+# In-flight get_logs requests keyed by cache key and the injected dependencies
+_INFLIGHT: dict[str, asyncio.Future[list[dict[str, Any]]]] = {}
+
+_TOPIC_KEYS: tuple[str, ...] = ('topic0', 'topic1', 'topic2', 'topic3')
+_TOPIC_OPR_KEYS: tuple[str, ...] = ('topic0_1_opr', 'topic1_2_opr', 'topic2_3_opr')
+
 
 async def get_logs(
     *,
@@ -38,95 +73,169 @@ async def get_logs(
     _rate_limiter: RateLimiter | None = None,
     _retry: RetryPolicy | None = None,
     _telemetry: Telemetry | None = None,
+    _filter_params: Mapping[str, Any] | None = None,
 ) -> list[dict[str, Any]]:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    # The cache key only depends on the query, so hits skip endpoint setup and signing
+    cache_key = _logs_cache_key(
+        api_kind=api_kind,
+        network=network,
+        address=address,
+        start_block=start_block,
+        end_block=end_block,
+        topics=topics,
+        topic_operators=topic_operators,
+        page=page,
+        offset=offset,
+    )
+    # Entries are {'items': [...], 'stored_at': epoch}; past the fresh TTL they are still
+    # served while a single background refresh replaces them (stale-while-revalidate)
+    stale: list[dict[str, Any]] | None = None
+    if _cache is not None:
+        cached = await _cache.get(cache_key)
+        if isinstance(cached, dict) and isinstance(cached.get('items'), list):
+            cached_items: list[dict[str, Any]] = cached['items']
+            stored_at = cached.get('stored_at')
+            if (
+                cached.get('final')
+                or not isinstance(stored_at, int | float)
+                or time() - stored_at < CACHE_TTL_SECONDS
+            ):
+                return cached_items
+            stale = cached_items
+
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
 
+    # Callers paging over one filter pass the prebuilt address/topic params once
+    # page/offset stay even when None: the signer drops None values itself
     params: dict[str, Any] = {
-        'module': 'logs',
-        'action': 'getLogs',
+        **(
+            _filter_params
+            if _filter_params is not None
+            else _log_filter_params(address, topics, topic_operators)
+        ),
         'fromBlock': start_block,
         'toBlock': end_block,
-        'address': address,
         'page': page,
         'offset': offset,
     }
 
-    if topics:
-        # topics[0..3]
-        for idx, topic in enumerate(topics[:4]):
-            params[f'topic{idx}'] = topic
-    if topic_operators:
-        for idx, op in enumerate(topic_operators[:3]):
-            params[f'topic{idx}_{idx + 1}_opr'] = op
+    merge_extra_params(params, extra_params)
+
+    signed_params, headers = endpoint.filter_and_sign(params, headers=None)
+
+    async def _fetch() -> list[dict[str, Any]]:
+        try:
+            response: Any = await run_with_policies(
+                do_call=partial(http.get, url, params=signed_params, headers=headers),
+                telemetry=_telemetry,
+                telemetry_name='logs.get_logs',
+                api_kind=api_kind,
+                network=network,
+                rate_limiter=_rate_limiter,
+                rate_limiter_key=f'{api_kind}:{network}:logs',
+                retry_policy=_retry,
+            )
+        except ChainscanClientApiError as exc:
+            if not _is_no_log_payload(exc):
+                raise
+            response = None
+
+        out: list[dict[str, Any]] = []
+        if isinstance(response, dict):
+            candidates: tuple[list[dict[str, Any]] | list[Any] | None, ...] = (
+                response.get('result'),
+                response.get('items'),
+                response.get('data'),
+            )
+            for candidate in candidates:
+                if isinstance(candidate, list):
+                    # JSON decoding yields plain dicts; the exact type check skips subclass lookups
+                    out = [entry for entry in candidate if type(entry) is dict]  # noqa: E721
+                    if out:
+                        break
+
+        if _telemetry is not None:
+            record_event_background(
+                _telemetry,
+                'logs.get_logs.ok',
+                {'api_kind': api_kind, 'network': network, 'items': len(out)},
+            )
+
+        if _cache is not None:
+            # Empty results are cached too; for finalized ranges they are kept much longer
+            final = not out and _is_final_range(api_kind, network, end_block)
+            await _cache.set(
+                cache_key,
+                {'items': out, 'stored_at': time(), 'final': final},
+                ttl_seconds=CACHE_TTL_FINAL_EMPTY_SECONDS if final else CACHE_STALE_TTL_SECONDS,
+            )
+
+        return out
 
+    shared_key = inflight_key(cache_key, http, _cache, _rate_limiter, _telemetry)
+    if stale is not None:
+        if shared_key not in _INFLIGHT:
+            run_in_background(coalesce_inflight(_INFLIGHT, shared_key, _fetch))
+        return stale
     if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
+        return await _fetch()
+    # Concurrent identical requests share a single upstream call
+    return await coalesce_inflight(_INFLIGHT, shared_key, _fetch)
 
-    signed_params, headers = endpoint.filter_and_sign(params, headers=None)
 
-    # Build deterministic cache key using hashed payload to avoid huge keys and non-determinism
-    payload = {
-        'api_kind': str(api_kind),
-        'network': str(network),
-        'address': str(address),
-        'start_block': str(start_block),
-        'end_block': str(end_block),
-        'topics': [str(t) for t in (topics or [])],
-        'topic_operators': [str(op) for op in (topic_operators or [])],
-        'page': None if page is None else str(page),
-        'offset': None if offset is None else str(offset),
-    }
-    cache_key = make_hashed_cache_key(prefix='logs', payload=payload, length=24)
-    if _cache is not None:
-        cached = await _cache.get(cache_key)
-        if isinstance(cached, list):
-            return cached
+def _log_filter_params(
+    address: str, topics: list[str] | None, topic_operators: list[str] | None
+) -> dict[str, Any]:
+    """Build the block-independent part of a getLogs query (module/action/address/topics)."""
+    params: dict[str, Any] = {'module': 'logs', 'action': 'getLogs', 'address': address}
+    if topics:
+        # topics[0..3]; zip stops at the shorter side
+        params.update(zip(_TOPIC_KEYS, topics, strict=False))
+    if topic_operators:
+        params.update(zip(_TOPIC_OPR_KEYS, topic_operators, strict=False))
+    return params
 
-    try:
-        response: Any = await run_with_policies(
-            do_call=lambda: http.get(url, params=signed_params, headers=headers),
-            telemetry=_telemetry,
-            telemetry_name='logs.get_logs',
-            api_kind=api_kind,
-            network=network,
-            rate_limiter=_rate_limiter,
-            rate_limiter_key=f'{api_kind}:{network}:logs',
-            retry_policy=_retry,
-        )
-    except ChainscanClientApiError as exc:
-        if _is_no_log_payload(exc):
-            if _telemetry is not None:
-                await _telemetry.record_event(
-                    'logs.get_logs.ok',
-                    {'api_kind': api_kind, 'network': network, 'items': 0},
-                )
-            return []
-        raise
-
-    out: list[dict[str, Any]] = []
-    if isinstance(response, dict):
-        candidates: tuple[list[dict[str, Any]] | list[Any] | None, ...] = (
-            response.get('result'),
-            response.get('items'),
-            response.get('data'),
-        )
-        for candidate in candidates:
-            if isinstance(candidate, list):
-                out = [entry for entry in candidate if isinstance(entry, dict)]
-                if out:
-                    break
 
-    if _telemetry is not None:
-        await _telemetry.record_event(
-            'logs.get_logs.ok',
-            {'api_kind': api_kind, 'network': network, 'items': len(out)},
-        )
+def _logs_cache_key(
+    *,
+    api_kind: str,
+    network: str,
+    address: str,
+    start_block: int | str,
+    end_block: int | str,
+    topics: list[str] | None,
+    topic_operators: list[str] | None,
+    page: int | str | None,
+    offset: int | str | None,
+) -> str:
+    """Build a deterministic cache key for a getLogs query.
+
+    Plain colon-joined key like the other services: cheaper to build and hash than a
+    JSON+SHA-256 digest on the hot path. Blocks and paging values are formatted with
+    ``str`` so ``1`` and ``'1'`` share a key. Topic lists use their tuple ``repr`` so
+    ``None`` slots are allowed and ``['a,b']`` cannot collide with ``['a', 'b']``.
+    """
+    topic_part = repr(tuple(topics)) if topics else ''
+    operator_part = repr(tuple(topic_operators)) if topic_operators else ''
+    return (
+        f'logs:{api_kind}:{network}:{address}:{start_block}:{end_block}:'
+        f'{topic_part}:{operator_part}:{page}:{offset}'
+    )
 
-    if _cache is not None and out:
-        await _cache.set(cache_key, out, ttl_seconds=CACHE_TTL_SECONDS)
 
-    return out
+def _is_final_range(api_kind: str, network: str, end_block: int | str) -> bool:
+    """Return True when ``end_block`` is at least REORG_DEPTH_BLOCKS behind the known head."""
+    head = _LATEST_BLOCKS.get((api_kind, network))
+    if head is None:
+        return False
+    try:
+        end = int(end_block, 0) if isinstance(end_block, str) else int(end_block)
+    except ValueError:
+        return False  # tags such as 'latest'
+    return end <= head - REORG_DEPTH_BLOCKS
 
 
 def _is_no_log_payload(exc: ChainscanClientApiError) -> bool:
@@ -179,7 +288,9 @@ async def get_logs_page(
         and _gql_builder is not None
         and _federator.should_use_graphql('logs', api_kind=api_kind, network=network)
     ):
-        endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+        endpoint = open_endpoint(
+            _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+        )
         base = endpoint.base_url.rstrip('/')
         candidate_urls = [
             f'{base}/graphql',
@@ -208,13 +319,14 @@ async def get_logs_page(
         async def _do_gql(gql_url: str) -> Any:
             if _rate_limiter is not None:
                 await _rate_limiter.acquire(key=f'{api_kind}:{network}:logs:gql')
-            start = monotonic()
+            start = monotonic() if _telemetry is not None else 0.0
             try:
                 return await _gql.execute(gql_url, query, variables, headers=headers)
             finally:
                 if _telemetry is not None:
                     duration_ms = int((monotonic() - start) * 1000)
-                    await _telemetry.record_event(
+                    record_event_background(
+                        _telemetry,
                         'logs.get_logs.duration',
                         {
                             'api_kind': api_kind,
@@ -224,44 +336,56 @@ async def get_logs_page(
                         },
                     )
 
-        last_exc: Exception | None = None
-        for _gql_url in candidate_urls:
-            try:
-                data: Any
-                if _retry is not None:
+        # Probe the last known-good URL first; other candidates overlap only when it stalls
+        cache_key = (api_kind, network)
+        known_url = _GQL_URL_CACHE.get(cache_key)
+        if known_url in candidate_urls:
+            candidate_urls.remove(known_url)
+            candidate_urls.insert(0, known_url)
+
+        async def _attempt(gql_url: str) -> tuple[list[dict[str, Any]], str | None]:
+            data: Any
+            if _retry is not None:
+                data = await _retry.run(partial(_do_gql, gql_url))
+            else:
+                data = await _do_gql(gql_url)
+            return _gql_builder.map_logs_response(data)
 
-                    async def _runner(url: str = _gql_url) -> Any:
-                        return await _do_gql(url)
+        def _on_failure(gql_url: str, exc: BaseException) -> None:  # noqa: ARG001
+            if _GQL_URL_CACHE.get(cache_key) == gql_url:
+                del _GQL_URL_CACHE[cache_key]
+            _federator.report_failure('logs', api_kind=api_kind, network=network)
 
-                    data = await _retry.run(_runner)
-                else:
-                    data = await _do_gql(_gql_url)
-                items, next_cursor = _gql_builder.map_logs_response(data)
-                if _telemetry is not None:
-                    await _telemetry.record_event(
-                        'logs.get_logs.ok',
-                        {
-                            'api_kind': api_kind,
-                            'network': network,
-                            'items': len(items),
-                            'provider_type': 'graphql',
-                        },
-                    )
-                if _federator is not None:
-                    _federator.report_success('logs', api_kind=api_kind, network=network)
-                return items, next_cursor
-            except Exception as exc:  # noqa: BLE001
-                last_exc = exc
-                if _federator is not None:
-                    _federator.report_failure('logs', api_kind=api_kind, network=network)
-                continue
-        # If all candidates failed, record and raise
-        if _telemetry is not None and last_exc is not None:
-            await _telemetry.record_error(
-                'logs.get_logs.error',
-                last_exc,
-                {'api_kind': api_kind, 'network': network, 'provider_type': 'graphql'},
+        try:
+            won_url, (items, next_cursor) = await race_candidates(
+                candidate_urls,
+                _attempt,
+                stagger_seconds=GQL_PROBE_STAGGER_SECONDS,
+                on_failure=_on_failure,
             )
+        except Exception as exc:  # noqa: BLE001
+            # All candidates failed; record and fall through to REST
+            if _telemetry is not None:
+                await _telemetry.record_error(
+                    'logs.get_logs.error',
+                    exc,
+                    {'api_kind': api_kind, 'network': network, 'provider_type': 'graphql'},
+                )
+        else:
+            _GQL_URL_CACHE[cache_key] = won_url
+            if _telemetry is not None:
+                record_event_background(
+                    _telemetry,
+                    'logs.get_logs.ok',
+                    {
+                        'api_kind': api_kind,
+                        'network': network,
+                        'items': len(items),
+                        'provider_type': 'graphql',
+                    },
+                )
+            _federator.report_success('logs', api_kind=api_kind, network=network)
+            return items, next_cursor
         # fall through to REST path
 
     # Fallback to REST path
@@ -292,32 +416,25 @@ async def get_logs_page(
 
 
 def normalize_log_entry(raw: dict[str, Any]) -> LogEntryDTO:
-    def hex_to_int(h: str | None) -> int | None:
-        if not h:
-            return None
-        try:
-            return int(h, 16) if isinstance(h, str) and h.startswith('0x') else int(h)
-        except Exception:
-            return None
-
-    topics_value = raw.get('topics')
-    topics: list[Any] = topics_value if isinstance(topics_value, list) else []
+    topics = raw.get('topics')
     return {
         'address': raw.get('address', ''),
-        'block_number': hex_to_int(raw.get('blockNumber')),
+        'block_number': parse_int(raw.get('blockNumber')),
         'tx_hash': raw.get('transactionHash'),
         'data': raw.get('data'),
-        'topics': [str(t) for t in topics],
+        'topics': list(map(str, topics)) if isinstance(topics, list) else [],
     }
 
 
-def normalize_logs(items: list[dict[str, Any]]) -> list[LogEntryDTO]:
-    """Normalize a list of raw log entries using `normalize_log_entry`."""
-    out: list[LogEntryDTO] = []
-    for item in items:
-        if isinstance(item, dict):
-            out.append(normalize_log_entry(item))
-    return out
+def normalize_logs(items: list[dict[str, Any]], *, trusted: bool = False) -> list[LogEntryDTO]:
+    """Normalize a list of raw log entries using `normalize_log_entry`.
+
+    Pass ``trusted=True`` for lists returned by `get_logs`, which already contain
+    only dicts, to skip the per-item type check.
+    """
+    if trusted:
+        return [normalize_log_entry(item) for item in items]
+    return [normalize_log_entry(item) for item in items if isinstance(item, dict)]
 
 
 async def get_all_logs_optimized(
@@ -336,23 +453,35 @@ async def get_all_logs_optimized(
     _endpoint_builder: EndpointBuilder,
     topics: list[str] | None = None,
     topic_operators: list[str] | None = None,
+    _cache: Cache | None = None,
     _rate_limiter: RateLimiter | None = None,
     _retry: RetryPolicy | None = None,
     _telemetry: Telemetry | None = None,
     stats: dict[str, int] | None = None,
 ) -> list[dict[str, Any]]:
-    """Fetch all logs using page-based strategy (provider-aware)."""
+    """Fetch all logs using page-based strategy (provider-aware).
+
+    Etherscan ('eth') slides ``start_block`` with page=1 (sequential by nature);
+    other providers fetch up to ``max_concurrent`` pages in parallel per window.
+    """
     # Determine latest end_block
     if end_block is None:
-        endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+        endpoint = open_endpoint(
+            _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+        )
         url: str = endpoint.api_url
         try:
             params_proxy: dict[str, Any] = {'module': 'proxy', 'action': 'eth_blockNumber'}
             signed_params, headers = endpoint.filter_and_sign(params_proxy, headers=None)
-            response: Any = await (
-                _retry.run(lambda: http.get(url, params=signed_params, headers=headers))
-                if _retry is not None
-                else http.get(url, params=signed_params, headers=headers)
+            response: Any = await run_with_policies(
+                do_call=partial(http.get, url, params=signed_params, headers=headers),
+                telemetry=_telemetry,
+                telemetry_name='logs.eth_blockNumber',
+                api_kind=api_kind,
+                network=network,
+                rate_limiter=_rate_limiter,
+                rate_limiter_key=f'{api_kind}:{network}:proxy.blockNumber',
+                retry_policy=_retry,
             )
             latest_hex = response.get('result') if isinstance(response, dict) else None
             if isinstance(latest_hex, str):
@@ -364,6 +493,8 @@ async def get_all_logs_optimized(
                     end_block = 99_999_999
             else:
                 end_block = 99_999_999
+            if end_block != 99_999_999:
+                _LATEST_BLOCKS[(api_kind, network)] = end_block
         except Exception:
             end_block = 99_999_999
 
@@ -374,13 +505,19 @@ async def get_all_logs_optimized(
 
     all_items: list[dict[str, Any]] = []
     pages_processed = 0
+    filter_params = _log_filter_params(address, topics, topic_operators)
 
     if api_kind == 'eth':
+        # Slide start_block with page=1. After a saturated page, cap toBlock at the block
+        # span that filled it so the provider scans a narrower range; after a short capped
+        # page, query the remainder up to end_block again.
         current_start = start_block
-        while True:
+        span: int | None = None
+        while current_start <= end_block:
+            current_end = end_block if span is None else min(end_block, current_start + span)
             items = await get_logs(
                 start_block=current_start,
-                end_block=end_block,
+                end_block=current_end,
                 address=address,
                 api_kind=api_kind,
                 network=network,
@@ -394,13 +531,18 @@ async def get_all_logs_optimized(
                 _rate_limiter=_rate_limiter,
                 _retry=_retry,
                 _telemetry=_telemetry,
+                _filter_params=filter_params,
+                _cache=_cache,
             )
             pages_processed += 1
-            if not items:
-                break
             all_items.extend(items)
             if len(items) < max_offset:
-                break
+                if span is None or current_end >= end_block:
+                    break
+                # Narrowed window exhausted; scan the remainder unbounded again
+                current_start = current_end + 1
+                span = None
+                continue
             try:
                 last_block_str = items[-1].get('blockNumber')
                 last_block = (
@@ -410,13 +552,18 @@ async def get_all_logs_optimized(
                 )
             except Exception:
                 break
+            span = max(1, last_block - current_start)
             current_start = max(current_start, last_block + 1)
     else:
-        page = 1
-        while True:
-            items = await get_logs(
-                start_block=start_block,
-                end_block=end_block,
+        # Up to `max_concurrent` pages in flight; RL provides backpressure
+        window: int = max(1, int(max_concurrent))
+        paged_start: int = start_block
+        paged_end: int = end_block
+
+        async def _fetch_page(p: int) -> list[dict[str, Any]]:
+            return await get_logs(
+                start_block=paged_start,
+                end_block=paged_end,
                 address=address,
                 api_kind=api_kind,
                 network=network,
@@ -425,43 +572,70 @@ async def get_all_logs_optimized(
                 _endpoint_builder=_endpoint_builder,
                 topics=topics,
                 topic_operators=topic_operators,
-                page=page,
+                page=p,
                 offset=max_offset,
                 _rate_limiter=_rate_limiter,
                 _retry=_retry,
                 _telemetry=_telemetry,
+                _filter_params=filter_params,
+                _cache=_cache,
             )
-            pages_processed += 1
-            if not items:
-                break
-            all_items.extend(items)
-            if len(items) < max_offset:
-                break
-            page += 1
 
-    # Dedup by (txHash, logIndex) and sort
-    seen: set[str] = set()
-    unique: list[dict[str, Any]] = []
+        # Sliding window like fetch_all_generic: a page is launched as soon as the oldest
+        # one is consumed, and scanning stops at the first short or empty page in order
+        in_flight: dict[int, asyncio.Future[list[dict[str, Any]]]] = {}
+        next_page = 1
+        next_launch = 1
+        try:
+            while True:
+                while next_launch < next_page + window:
+                    in_flight[next_launch] = asyncio.ensure_future(_fetch_page(next_launch))
+                    next_launch += 1
+                items = await in_flight.pop(next_page)
+                pages_processed += 1
+                if not items:
+                    break
+                all_items.extend(items)
+                if len(items) < max_offset:
+                    break
+                next_page += 1
+        finally:
+            for pending in in_flight.values():
+                # Speculative pages past the stop point: drop their outcome, errors included
+                if not pending.cancel() and not pending.cancelled():
+                    pending.exception()
+
+    # Dedup by normalized (txHash, logIndex), decorating each kept entry with its sort key
+    # once; providers mix hash case and decimal/hex/int log indexes for the same entry
+    seen: set[tuple[str, str | int]] = set()
+    # Many logs share a block; parse each distinct blockNumber string once
+    block_numbers: dict[str, int] = {}
+    decorated: list[tuple[int, int, dict[str, Any]]] = []
     for it in all_items:
-        if not isinstance(it, dict):
+        # get_logs only hands back plain JSON dicts; an exact type check is enough here
+        if type(it) is not dict:  # noqa: E721
             continue
         txh = it.get('transactionHash') or it.get('hash')
         idx = it.get('logIndex')
-        key = f'{txh}:{idx}' if isinstance(txh, str) and isinstance(idx, str | int) else None
-        if key is None or key in seen:
+        if not isinstance(txh, str) or not isinstance(idx, str | int):
+            continue
+        log_index = parse_int(idx)
+        key = (txh.lower(), idx if log_index is None else log_index)
+        if key in seen:
             continue
         seen.add(key)
-        unique.append(it)
-
-    def to_int(v: Any) -> int:
-        try:
-            if isinstance(v, str) and v.startswith('0x'):
-                return int(v, 16)
-            return int(v)
-        except Exception:
-            return 0
-
-    unique.sort(key=lambda it: (to_int(it.get('blockNumber')), to_int(it.get('logIndex'))))
+        raw_block = it.get('blockNumber')
+        if isinstance(raw_block, str):
+            block = block_numbers.get(raw_block)
+            if block is None:
+                block = block_numbers[raw_block] = parse_int(raw_block, 0)
+        else:
+            block = parse_int(raw_block, 0)
+        decorated.append((block, log_index or 0, it))
+
+    # Stable sort on the precomputed ints only; dicts are never compared
+    decorated.sort(key=itemgetter(0, 1))
+    unique = [entry for _, _, entry in decorated]
     if stats is not None:
         stats.update(
             {'pages_processed': pages_processed, 'items_total': len(all_items), 'paging_used': 1}
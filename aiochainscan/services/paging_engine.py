@@ -4,11 +4,13 @@ import asyncio
 from collections.abc import Awaitable, Callable
 from contextlib import suppress
 from dataclasses import dataclass
+from functools import partial
 from time import monotonic
 from typing import Any, Literal, Protocol
 
 from aiochainscan.ports.rate_limiter import RateLimiter, RetryPolicy
 from aiochainscan.ports.telemetry import Telemetry
+from aiochainscan.services._executor import record_event_background
 
 Item = dict[str, Any]
 
@@ -35,6 +37,8 @@ class FetchSpec:
         order_fn: Stable ordering key extractor; first element MUST be block number.
         max_offset: Page size to request from the provider.
         resolve_end_block: Optional async supplier of an end_block snapshot.
+        trusted: Set when fetch_page only ever returns plain dicts (e.g. service calls
+            that already filter provider payloads); dedup then skips per-item type checks.
     """
 
     name: str
@@ -45,6 +49,7 @@ class FetchSpec:
     # Optional alternative page fetcher using reverse order (e.g., sort='desc')
     fetch_page_desc: FetchPage | None = None
     resolve_end_block: ResolveEndBlock | None = None
+    trusted: bool = False
 
 
 @dataclass(slots=True)
@@ -64,13 +69,19 @@ class ProviderPolicy:
     rps_key: str | None
 
 
+# Upper bound on parallel page prefetch; beyond this, extra in-flight requests mostly
+# deepen the provider-side queue (higher p99) and trip rate limits
+MAX_PAGED_PREFETCH: int = 8
+
+
 def resolve_policy_for_provider(
     *, api_kind: str, network: str, max_concurrent: int
 ) -> ProviderPolicy:
     """Return a reasonable default paging policy for a given provider string.
 
     - Etherscan family ('eth'): sliding window, window_cap=10_000, prefetch=1
-    - Blockscout (api_kind startswith 'blockscout_'): paged, prefetch=max_concurrent
+    - Blockscout (api_kind startswith 'blockscout_'): paged,
+      prefetch=max_concurrent clamped to MAX_PAGED_PREFETCH
     - Others: paged, prefetch=1
     """
 
@@ -79,7 +90,7 @@ def resolve_policy_for_provider(
             mode='sliding', prefetch=1, window_cap=10_000, rps_key=f'{api_kind}:{network}:fetch'
         )
     if isinstance(api_kind, str) and api_kind.startswith('blockscout_'):
-        prefetch = max(1, int(max_concurrent))
+        prefetch = max(1, min(int(max_concurrent), MAX_PAGED_PREFETCH))
         return ProviderPolicy(
             mode='paged', prefetch=prefetch, window_cap=None, rps_key=f'{api_kind}:{network}:fetch'
         )
@@ -136,17 +147,17 @@ async def fetch_all_generic(
         min(base_offset, int(policy.window_cap)) if policy.window_cap is not None else base_offset
     )
 
-    async def _call_fetch_page(*, page: int, s: int, e: int) -> list[Item]:
-        async def _inner() -> list[Item]:
-            if rate_limiter is not None and policy.rps_key is not None:
-                await rate_limiter.acquire(policy.rps_key)
-            return await fetch_spec.fetch_page(
-                page=page, start_block=s, end_block=e, offset=effective_offset_for_provider
-            )
+    async def _fetch_page_once(page: int, s: int, e: int) -> list[Item]:
+        if rate_limiter is not None and policy.rps_key is not None:
+            await rate_limiter.acquire(policy.rps_key)
+        return await fetch_spec.fetch_page(
+            page=page, start_block=s, end_block=e, offset=effective_offset_for_provider
+        )
 
+    async def _call_fetch_page(*, page: int, s: int, e: int) -> list[Item]:
         if retry is not None:
-            return await retry.run(lambda: _inner())
-        return await _inner()
+            return await retry.run(partial(_fetch_page_once, page, s, e))
+        return await _fetch_page_once(page, s, e)
 
     start_ts = monotonic() if telemetry is not None else 0.0
 
@@ -190,7 +201,8 @@ async def fetch_all_generic(
                     # ASC bookkeeping
                     pages_processed += 1
                     if telemetry is not None:
-                        await telemetry.record_event(
+                        record_event_background(
+                            telemetry,
                             'paging.page_ok',
                             {'mode': 'sliding_bi_asc', 'page': 1, 'items': len(items_asc)},
                         )
@@ -211,7 +223,8 @@ async def fetch_all_generic(
                     # DESC bookkeeping
                     pages_processed += 1
                     if telemetry is not None:
-                        await telemetry.record_event(
+                        record_event_background(
+                            telemetry,
                             'paging.page_ok',
                             {'mode': 'sliding_bi_desc', 'page': 1, 'items': len(items_desc)},
                         )
@@ -238,15 +251,17 @@ async def fetch_all_generic(
             while True:
                 items = await _call_fetch_page(page=1, s=current_start, e=effective_end_block)
                 pages_processed += 1
+                n_items = len(items)
                 if telemetry is not None:
-                    await telemetry.record_event(
+                    record_event_background(
+                        telemetry,
                         'paging.page_ok',
-                        {'mode': 'sliding', 'page': 1, 'items': len(items)},
+                        {'mode': 'sliding', 'page': 1, 'items': n_items},
                     )
-                if not items:
+                if n_items == 0:
                     break
                 all_items.extend(items)
-                if len(items) < effective_offset_for_provider:
+                if n_items < effective_offset_for_provider:
                     break
                 # Advance to the next block after last item; order_fn's first element must be block number
                 try:
@@ -256,36 +271,44 @@ async def fetch_all_generic(
                     break
                 current_start = max(current_start, last_block + 1)
         else:  # paged
-            next_page: int = 1
             prefetch: int = max(1, min(int(policy.prefetch), int(max_concurrent)))
-            while True:
-                batch_pages = [next_page + i for i in range(prefetch)]
-                # Fire in parallel; RPS limiter will provide backpressure
-                results = await _gather_pages(
-                    [
-                        _call_fetch_page(page=p, s=effective_start_block, e=effective_end_block)
-                        for p in batch_pages
-                    ]
-                )
-                # Maintain order by page
-                for page_index, items in zip(batch_pages, results, strict=False):
+            # Sliding window of pages [next_page, next_page + prefetch): a page is launched
+            # as soon as the oldest one is consumed instead of waiting for a whole batch.
+            # RPS limiter provides backpressure.
+            in_flight: dict[int, asyncio.Future[list[Item]]] = {}
+            next_page: int = 1
+            next_launch: int = 1
+            try:
+                while True:
+                    while next_launch < next_page + prefetch:
+                        in_flight[next_launch] = asyncio.ensure_future(
+                            _call_fetch_page(
+                                page=next_launch, s=effective_start_block, e=effective_end_block
+                            )
+                        )
+                        next_launch += 1
+                    # Consume strictly in page order; later pages that finish first wait here
+                    items = await in_flight.pop(next_page)
                     pages_processed += 1
+                    n_items = len(items)
                     if telemetry is not None:
-                        await telemetry.record_event(
+                        record_event_background(
+                            telemetry,
                             'paging.page_ok',
-                            {'mode': 'paged', 'page': int(page_index), 'items': len(items)},
+                            {'mode': 'paged', 'page': next_page, 'items': n_items},
                         )
-                    if not items:
-                        # Stop at the first empty page in sequence
-                        next_page = 0  # sentinel to exit outer loop
+                    # Stop at the first empty or short page in sequence
+                    if n_items == 0:
                         break
                     all_items.extend(items)
-                    if len(items) < effective_offset_for_provider:
-                        next_page = 0
+                    if n_items < effective_offset_for_provider:
                         break
-                if next_page <= 0:
-                    break
-                next_page += prefetch
+                    next_page += 1
+            finally:
+                for pending in in_flight.values():
+                    # Finished-but-unconsumed pages past the stop point: drop their outcome
+                    if not pending.cancel() and not pending.cancelled():
+                        pending.exception()
     except Exception as exc:  # noqa: BLE001
         if telemetry is not None:
             await telemetry.record_error('paging.error', exc, {'mode': policy.mode})
@@ -305,16 +328,7 @@ async def fetch_all_generic(
             )
 
     # Deduplicate and stable sort
-    seen: set[str] = set()
-    unique: list[Item] = []
-    for it in all_items:
-        if not isinstance(it, dict):
-            continue
-        key = fetch_spec.key_fn(it)
-        if key is None or key in seen:
-            continue
-        seen.add(key)
-        unique.append(it)
+    unique = _dedupe_by_key(all_items, fetch_spec.key_fn, trusted=fetch_spec.trusted)
 
     with suppress(Exception):
         unique.sort(key=fetch_spec.order_fn)
@@ -343,8 +357,28 @@ async def fetch_all_generic(
     return unique
 
 
+def _dedupe_by_key(items: list[Item], key_fn: KeyFn, *, trusted: bool = False) -> list[Item]:
+    """Keep the first item per non-None key, preserving first-seen order."""
+    if not trusted:
+        items = [it for it in items if isinstance(it, dict)]
+    by_key: dict[str, Item] = {}
+    for it in items:
+        key = key_fn(it)
+        if key is not None:
+            # setdefault keeps the first-seen item with a single hash lookup
+            by_key.setdefault(key, it)
+    return list(by_key.values())
+
+
 async def _gather_pages(coros: list[Awaitable[list[Item]]]) -> list[list[Item]]:
-    return await asyncio.gather(*coros)
+    """Await pages concurrently; the first failure cancels the sibling fetches."""
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
 
 
 async def fetch_all_sliding_bi(
@@ -420,8 +454,10 @@ async def fetch_all_sliding_bi(
         asc_items = await _call(fetch_spec.fetch_page, s=low, e=up)
         pages_processed += 1
         if telemetry is not None:
-            await telemetry.record_event(
-                'paging.page_ok', {'mode': 'sliding_bi_asc', 'page': 1, 'items': len(asc_items)}
+            record_event_background(
+                telemetry,
+                'paging.page_ok',
+                {'mode': 'sliding_bi_asc', 'page': 1, 'items': len(asc_items)},
             )
         if not asc_items:
             break
@@ -443,8 +479,10 @@ async def fetch_all_sliding_bi(
         desc_items = await _call(desc_fetcher, s=low, e=up)
         pages_processed += 1
         if telemetry is not None:
-            await telemetry.record_event(
-                'paging.page_ok', {'mode': 'sliding_bi_desc', 'page': 1, 'items': len(desc_items)}
+            record_event_background(
+                telemetry,
+                'paging.page_ok',
+                {'mode': 'sliding_bi_desc', 'page': 1, 'items': len(desc_items)},
             )
         if not desc_items:
             break
@@ -469,16 +507,7 @@ async def fetch_all_sliding_bi(
         )
 
     # Dedup and stable sort
-    seen: set[str] = set()
-    unique: list[Item] = []
-    for it in all_items:
-        if not isinstance(it, dict):
-            continue
-        key = fetch_spec.key_fn(it)
-        if key is None or key in seen:
-            continue
-        seen.add(key)
-        unique.append(it)
+    unique = _dedupe_by_key(all_items, fetch_spec.key_fn, trusted=fetch_spec.trusted)
     with suppress(Exception):
         unique.sort(key=fetch_spec.order_fn)
 
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
-from time import monotonic
+import asyncio
+from collections.abc import Awaitable, Mapping, Sequence
+from dataclasses import dataclass
+from functools import lru_cache, partial
 from typing import Any
 
 from aiochainscan.domain.dto import ProxyTxDTO
@@ -10,14 +12,117 @@ from aiochainscan.ports.endpoint_builder import EndpointBuilder
 from aiochainscan.ports.http_client import HttpClient
 from aiochainscan.ports.rate_limiter import RateLimiter, RetryPolicy
 from aiochainscan.ports.telemetry import Telemetry
-from aiochainscan.services._executor import run_with_policies
+from aiochainscan.services._executor import (
+    coalesce_inflight,
+    merge_extra_params,
+    open_endpoint,
+    parse_int,
+    result_dict,
+    run_with_policies,
+    sign_action,
+)
+from aiochainscan.services.constants import (
+    CACHE_TTL_BLOCK_NUMBER_SECONDS,
+    CACHE_TTL_GAS_PRICE_SECONDS,
+)
+
+# Identical concurrent read requests share one round-trip (and one rate-limit token)
+_INFLIGHT: dict[str, asyncio.Future[Any]] = {}
 
 
 def _to_tag(value: int | str) -> str:
+    if isinstance(value, int | str):
+        return _to_tag_cached(value)
+    return str(value).strip().lower()
+
+
+@lru_cache(maxsize=256)
+def _to_tag_cached(value: int | str) -> str:
+    # Polling callers repeat the same few tags ('latest', small block numbers)
     if isinstance(value, int):
         return hex(value)
-    s = str(value).strip().lower()
-    return s
+    return value.strip().lower()
+
+
+async def _proxy_rpc(
+    *,
+    action: str,
+    params: Mapping[str, Any] | None,
+    telemetry_name: str,
+    key_suffix: str,
+    api_kind: str,
+    network: str,
+    api_key: str,
+    http: HttpClient,
+    endpoint_builder: EndpointBuilder,
+    extra_params: Mapping[str, Any] | None,
+    rate_limiter: RateLimiter | None,
+    retry: RetryPolicy | None,
+    telemetry: Telemetry | None,
+    http_method: str = 'get',
+) -> Any:
+    """Sign and send one ``module=proxy`` request; returns the raw provider response.
+
+    Shared by every wrapper below so endpoint lookup, signing and the
+    rate-limit/retry/telemetry policies live in a single place.
+    """
+    endpoint = open_endpoint(endpoint_builder, api_key=api_key, api_kind=api_kind, network=network)
+    url: str = endpoint.api_url
+
+    if params or extra_params:
+        payload: dict[str, Any] = (
+            {'module': 'proxy', 'action': action, **params}
+            if params
+            else {'module': 'proxy', 'action': action}
+        )
+        merge_extra_params(payload, extra_params)
+        signed, headers = endpoint.filter_and_sign(payload, headers=None)
+    else:
+        signed, headers = sign_action(endpoint, module='proxy', action=action)
+
+    if http_method == 'post':
+        do_call = partial(http.post, url, data=signed, headers=headers)
+    else:
+        do_call = partial(http.get, url, params=signed, headers=headers)
+
+    run = partial(
+        run_with_policies,
+        do_call=do_call,
+        telemetry=telemetry,
+        telemetry_name=telemetry_name,
+        api_kind=api_kind,
+        network=network,
+        rate_limiter=rate_limiter,
+        rate_limiter_key=(
+            _rate_limiter_key(api_kind, network, key_suffix) if rate_limiter is not None else None
+        ),
+        retry_policy=retry,
+    )
+    if http_method == 'post':
+        # Writes (eth_sendRawTransaction) must never be shared between callers
+        return await run()
+    inflight_key = f'{url}?{sorted(signed.items())!r}{sorted(headers.items())!r}'
+    return await coalesce_inflight(_INFLIGHT, inflight_key, run)
+
+
+@lru_cache(maxsize=512)
+def _rate_limiter_key(api_kind: str, network: str, key_suffix: str) -> str:
+    # One shared string per (provider, network, action) instead of a new f-string per call
+    return f'{api_kind}:{network}:proxy.{key_suffix}'
+
+
+# Decoded JSON only yields exact dict/str instances, so exact type checks suffice here
+def _str_result(response: Any) -> str | None:
+    if type(response) is dict:  # noqa: E721
+        result = response.get('result')
+        if type(result) is str:  # noqa: E721
+            return result
+    return None
+
+
+def _result_str(response: Any) -> str:
+    result = _str_result(response)
+    return result if result is not None else str(response)
 
 
 async def get_balance(
@@ -35,36 +140,25 @@ async def get_balance(
     _retry: RetryPolicy | None = None,
     _telemetry: Telemetry | None = None,
 ) -> str:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
-    url: str = endpoint.api_url
-
-    params: dict[str, Any] = {
-        'module': 'proxy',
-        'action': 'eth_getBalance',
-        'address': address,
-        'tag': _to_tag(tag),
-    }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
-
-    signed_params, headers = endpoint.filter_and_sign(params, headers=None)
-
-    response: Any = await run_with_policies(
-        do_call=lambda: http.get(url, params=signed_params, headers=headers),
-        telemetry=_telemetry,
+    response: Any = await _proxy_rpc(
+        action='eth_getBalance',
+        params={
+            'address': address,
+            'tag': _to_tag(tag),
+        },
         telemetry_name='proxy.get_balance',
+        key_suffix='getBalance',
         api_kind=api_kind,
         network=network,
+        api_key=api_key,
+        http=http,
+        endpoint_builder=_endpoint_builder,
+        extra_params=extra_params,
         rate_limiter=_rate_limiter,
-        rate_limiter_key=f'{api_kind}:{network}:proxy.getBalance',
-        retry_policy=_retry,
+        retry=_retry,
+        telemetry=_telemetry,
     )
-
-    if isinstance(response, dict):
-        result = response.get('result', response)
-        if isinstance(result, str):
-            return result
-    return str(response)
+    return _result_str(response)
 
 
 async def get_block_number(
@@ -80,44 +174,45 @@ async def get_block_number(
     _retry: RetryPolicy | None = None,
     _telemetry: Telemetry | None = None,
 ) -> str:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
-    url: str = endpoint.api_url
-
-    params: dict[str, Any] = {
-        'module': 'proxy',
-        'action': 'eth_blockNumber',
-    }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
-
-    signed_params, headers = endpoint.filter_and_sign(params, headers=None)
-
-    response: Any = await run_with_policies(
-        do_call=lambda: http.get(url, params=signed_params, headers=headers),
-        telemetry=_telemetry,
+    # Provider-specific extra params may change the answer, so they bypass the cache
+    cache = None if extra_params else _cache
+    cache_key = f'proxy.blockNumber:{api_kind}:{network}'
+    if cache is not None:
+        cached = await cache.get(cache_key)
+        if isinstance(cached, str):
+            return cached
+
+    response: Any = await _proxy_rpc(
+        action='eth_blockNumber',
+        params=None,
         telemetry_name='proxy.get_block_number',
+        key_suffix='blockNumber',
         api_kind=api_kind,
         network=network,
+        api_key=api_key,
+        http=http,
+        endpoint_builder=_endpoint_builder,
+        extra_params=extra_params,
         rate_limiter=_rate_limiter,
-        rate_limiter_key=f'{api_kind}:{network}:proxy.blockNumber',
-        retry_policy=_retry,
+        retry=_retry,
+        telemetry=_telemetry,
     )
-
-    if isinstance(response, dict):
-        result = response.get('result', response)
-        if isinstance(result, str):
-            if _telemetry is not None:
-                await _telemetry.record_event(
-                    'proxy.get_block_number.ok',
-                    {'api_kind': api_kind, 'network': network},
-                )
-            return result
+    result = _str_result(response)
+    if result is None:
+        if _telemetry is not None:
+            await _telemetry.record_event(
+                'proxy.get_block_number.unexpected',
+                {'api_kind': api_kind, 'network': network},
+            )
+        return str(response)
     if _telemetry is not None:
         await _telemetry.record_event(
-            'proxy.get_block_number.unexpected',
+            'proxy.get_block_number.ok',
             {'api_kind': api_kind, 'network': network},
         )
-    return str(response)
+    if cache is not None:
+        await cache.set(cache_key, result, ttl_seconds=CACHE_TTL_BLOCK_NUMBER_SECONDS)
+    return result
 
 
 async def get_tx_by_hash(
@@ -134,80 +229,45 @@ async def get_tx_by_hash(
     _retry: RetryPolicy | None = None,
     _telemetry: Telemetry | None = None,
 ) -> dict[str, Any]:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
-    url: str = endpoint.api_url
-
-    params: dict[str, Any] = {
-        'module': 'proxy',
-        'action': 'eth_getTransactionByHash',
-        'txhash': txhash,
-    }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
-
-    signed_params, headers = endpoint.filter_and_sign(params, headers=None)
-
-    async def _do_request() -> Any:
-        if _rate_limiter is not None:
-            await _rate_limiter.acquire(key=f'{api_kind}:{network}:proxy.txByHash')
-        start = monotonic()
-        try:
-            return await http.get(url, params=signed_params, headers=headers)
-        finally:
-            if _telemetry is not None:
-                duration_ms = int((monotonic() - start) * 1000)
-                await _telemetry.record_event(
-                    'proxy.get_tx_by_hash.duration',
-                    {'api_kind': api_kind, 'network': network, 'duration_ms': duration_ms},
-                )
-
-    try:
-        if _retry is not None:
-            response: Any = await _retry.run(_do_request)
-        else:
-            response = await _do_request()
-    except Exception as exc:  # noqa: BLE001
-        if _telemetry is not None:
-            await _telemetry.record_error(
-                'proxy.get_tx_by_hash.error',
-                exc,
-                {'api_kind': api_kind, 'network': network},
-            )
-        raise
-
-    if isinstance(response, dict):
-        result = response.get('result', response)
-        if isinstance(result, dict):
-            if _telemetry is not None:
-                await _telemetry.record_event(
-                    'proxy.get_tx_by_hash.ok',
-                    {'api_kind': api_kind, 'network': network},
-                )
-            return result
-    return {}
+    response: Any = await _proxy_rpc(
+        action='eth_getTransactionByHash',
+        params={
+            'txhash': txhash,
+        },
+        telemetry_name='proxy.get_tx_by_hash',
+        key_suffix='txByHash',
+        api_kind=api_kind,
+        network=network,
+        api_key=api_key,
+        http=http,
+        endpoint_builder=_endpoint_builder,
+        extra_params=extra_params,
+        rate_limiter=_rate_limiter,
+        retry=_retry,
+        telemetry=_telemetry,
+    )
+    result = result_dict(response)
+    if result and _telemetry is not None:
+        await _telemetry.record_event(
+            'proxy.get_tx_by_hash.ok',
+            {'api_kind': api_kind, 'network': network},
+        )
+    return result
 
 
 def normalize_proxy_tx(raw: dict[str, Any]) -> ProxyTxDTO:
     """Normalize proxy.eth_getTransactionByHash result into ProxyTxDTO."""
-
-    def hex_to_int(v: Any) -> int | None:
-        try:
-            if isinstance(v, str) and v.startswith('0x'):
-                return int(v, 16)
-            return int(v)
-        except Exception:
-            return None
-
+    get = raw.get
     return {
-        'tx_hash': raw.get('hash'),
-        'block_number': hex_to_int(raw.get('blockNumber')),
-        'from_address': raw.get('from'),
-        'to_address': raw.get('to'),
-        'value_wei': hex_to_int(raw.get('value')),
-        'gas': hex_to_int(raw.get('gas')),
-        'gas_price_wei': hex_to_int(raw.get('gasPrice')),
-        'nonce': hex_to_int(raw.get('nonce')),
-        'input': raw.get('input'),
+        'tx_hash': get('hash'),
+        'block_number': parse_int(get('blockNumber')),
+        'from_address': get('from'),
+        'to_address': get('to'),
+        'value_wei': parse_int(get('value')),
+        'gas': parse_int(get('gas')),
+        'gas_price_wei': parse_int(get('gasPrice')),
+        'nonce': parse_int(get('nonce')),
+        'input': get('input'),
     }
 
 
@@ -219,38 +279,40 @@ async def get_gas_price(
     http: HttpClient,
     _endpoint_builder: EndpointBuilder,
     extra_params: Mapping[str, Any] | None = None,
+    _cache: Cache | None = None,
     _rate_limiter: RateLimiter | None = None,
     _retry: RetryPolicy | None = None,
     _telemetry: Telemetry | None = None,
 ) -> str:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
-    url: str = endpoint.api_url
-
-    params: dict[str, Any] = {
-        'module': 'proxy',
-        'action': 'eth_gasPrice',
-    }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
-
-    signed_params, headers = endpoint.filter_and_sign(params, headers=None)
-
-    response: Any = await run_with_policies(
-        do_call=lambda: http.get(url, params=signed_params, headers=headers),
-        telemetry=_telemetry,
+    # Provider-specific extra params may change the answer, so they bypass the cache
+    cache = None if extra_params else _cache
+    cache_key = f'proxy.gasPrice:{api_kind}:{network}'
+    if cache is not None:
+        cached = await cache.get(cache_key)
+        if isinstance(cached, str):
+            return cached
+
+    response: Any = await _proxy_rpc(
+        action='eth_gasPrice',
+        params=None,
         telemetry_name='proxy.get_gas_price',
+        key_suffix='gasPrice',
         api_kind=api_kind,
         network=network,
+        api_key=api_key,
+        http=http,
+        endpoint_builder=_endpoint_builder,
+        extra_params=extra_params,
         rate_limiter=_rate_limiter,
-        rate_limiter_key=f'{api_kind}:{network}:proxy.gasPrice',
-        retry_policy=_retry,
+        retry=_retry,
+        telemetry=_telemetry,
     )
-
-    if isinstance(response, dict):
-        result = response.get('result', response)
-        if isinstance(result, str):
-            return result
-    return str(response)
+    result = _str_result(response)
+    if result is None:
+        return str(response)
+    if cache is not None:
+        await cache.set(cache_key, result, ttl_seconds=CACHE_TTL_GAS_PRICE_SECONDS)
+    return result
 
 
 async def get_tx_count(
@@ -267,36 +329,25 @@ async def get_tx_count(
     _retry: RetryPolicy | None = None,
     _telemetry: Telemetry | None = None,
 ) -> str:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
-    url: str = endpoint.api_url
-
-    params: dict[str, Any] = {
-        'module': 'proxy',
-        'action': 'eth_getTransactionCount',
-        'address': address,
-        'tag': _to_tag(tag),
-    }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
-
-    signed_params, headers = endpoint.filter_and_sign(params, headers=None)
-
-    response: Any = await run_with_policies(
-        do_call=lambda: http.get(url, params=signed_params, headers=headers),
-        telemetry=_telemetry,
+    response: Any = await _proxy_rpc(
+        action='eth_getTransactionCount',
+        params={
+            'address': address,
+            'tag': _to_tag(tag),
+        },
         telemetry_name='proxy.get_tx_count',
+        key_suffix='txCount',
         api_kind=api_kind,
         network=network,
+        api_key=api_key,
+        http=http,
+        endpoint_builder=_endpoint_builder,
+        extra_params=extra_params,
         rate_limiter=_rate_limiter,
-        rate_limiter_key=f'{api_kind}:{network}:proxy.txCount',
-        retry_policy=_retry,
+        retry=_retry,
+        telemetry=_telemetry,
     )
-
-    if isinstance(response, dict):
-        result = response.get('result', response)
-        if isinstance(result, str):
-            return result
-    return str(response)
+    return _result_str(response)
 
 
 async def get_code(
@@ -313,36 +364,25 @@ async def get_code(
     _retry: RetryPolicy | None = None,
     _telemetry: Telemetry | None = None,
 ) -> str:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
-    url: str = endpoint.api_url
-
-    params: dict[str, Any] = {
-        'module': 'proxy',
-        'action': 'eth_getCode',
-        'address': address,
-        'tag': _to_tag(tag),
-    }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
-
-    signed_params, headers = endpoint.filter_and_sign(params, headers=None)
-
-    response: Any = await run_with_policies(
-        do_call=lambda: http.get(url, params=signed_params, headers=headers),
-        telemetry=_telemetry,
+    response: Any = await _proxy_rpc(
+        action='eth_getCode',
+        params={
+            'address': address,
+            'tag': _to_tag(tag),
+        },
         telemetry_name='proxy.get_code',
+        key_suffix='getCode',
         api_kind=api_kind,
         network=network,
+        api_key=api_key,
+        http=http,
+        endpoint_builder=_endpoint_builder,
+        extra_params=extra_params,
         rate_limiter=_rate_limiter,
-        rate_limiter_key=f'{api_kind}:{network}:proxy.getCode',
-        retry_policy=_retry,
+        retry=_retry,
+        telemetry=_telemetry,
     )
-
-    if isinstance(response, dict):
-        result = response.get('result', response)
-        if isinstance(result, str):
-            return result
-    return str(response)
+    return _result_str(response)
 
 
 async def eth_call(
@@ -360,37 +400,26 @@ async def eth_call(
     _retry: RetryPolicy | None = None,
     _telemetry: Telemetry | None = None,
 ) -> str:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
-    url: str = endpoint.api_url
-
-    params: dict[str, Any] = {
-        'module': 'proxy',
-        'action': 'eth_call',
-        'to': to,
-        'data': data,
-        'tag': _to_tag(tag),
-    }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
-
-    signed_params, headers = endpoint.filter_and_sign(params, headers=None)
-
-    response: Any = await run_with_policies(
-        do_call=lambda: http.get(url, params=signed_params, headers=headers),
-        telemetry=_telemetry,
+    response: Any = await _proxy_rpc(
+        action='eth_call',
+        params={
+            'to': to,
+            'data': data,
+            'tag': _to_tag(tag),
+        },
         telemetry_name='proxy.eth_call',
+        key_suffix='ethCall',
         api_kind=api_kind,
         network=network,
+        api_key=api_key,
+        http=http,
+        endpoint_builder=_endpoint_builder,
+        extra_params=extra_params,
         rate_limiter=_rate_limiter,
-        rate_limiter_key=f'{api_kind}:{network}:proxy.ethCall',
-        retry_policy=_retry,
+        retry=_retry,
+        telemetry=_telemetry,
     )
-
-    if isinstance(response, dict):
-        result = response.get('result', response)
-        if isinstance(result, str):
-            return result
-    return str(response)
+    return _result_str(response)
 
 
 async def get_storage_at(
@@ -408,37 +437,26 @@ async def get_storage_at(
     _retry: RetryPolicy | None = None,
     _telemetry: Telemetry | None = None,
 ) -> str:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
-    url: str = endpoint.api_url
-
-    params: dict[str, Any] = {
-        'module': 'proxy',
-        'action': 'eth_getStorageAt',
-        'address': address,
-        'position': position,
-        'tag': _to_tag(tag),
-    }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
-
-    signed_params, headers = endpoint.filter_and_sign(params, headers=None)
-
-    response: Any = await run_with_policies(
-        do_call=lambda: http.get(url, params=signed_params, headers=headers),
-        telemetry=_telemetry,
+    response: Any = await _proxy_rpc(
+        action='eth_getStorageAt',
+        params={
+            'address': address,
+            'position': position,
+            'tag': _to_tag(tag),
+        },
         telemetry_name='proxy.get_storage_at',
+        key_suffix='getStorageAt',
         api_kind=api_kind,
         network=network,
+        api_key=api_key,
+        http=http,
+        endpoint_builder=_endpoint_builder,
+        extra_params=extra_params,
         rate_limiter=_rate_limiter,
-        rate_limiter_key=f'{api_kind}:{network}:proxy.getStorageAt',
-        retry_policy=_retry,
+        retry=_retry,
+        telemetry=_telemetry,
     )
-
-    if isinstance(response, dict):
-        result = response.get('result', response)
-        if isinstance(result, str):
-            return result
-    return str(response)
+    return _result_str(response)
 
 
 async def get_block_tx_count_by_number(
@@ -454,34 +472,24 @@ async def get_block_tx_count_by_number(
     _retry: RetryPolicy | None = None,
     _telemetry: Telemetry | None = None,
 ) -> str:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
-    url: str = endpoint.api_url
-    params: dict[str, Any] = {
-        'module': 'proxy',
-        'action': 'eth_getBlockTransactionCountByNumber',
-        'tag': _to_tag(tag),
-    }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
-
-    signed_params, headers = endpoint.filter_and_sign(params, headers=None)
-
-    response: Any = await run_with_policies(
-        do_call=lambda: http.get(url, params=signed_params, headers=headers),
-        telemetry=_telemetry,
+    response: Any = await _proxy_rpc(
+        action='eth_getBlockTransactionCountByNumber',
+        params={
+            'tag': _to_tag(tag),
+        },
         telemetry_name='proxy.get_block_tx_count_by_number',
+        key_suffix='blockTxCount',
         api_kind=api_kind,
         network=network,
+        api_key=api_key,
+        http=http,
+        endpoint_builder=_endpoint_builder,
+        extra_params=extra_params,
         rate_limiter=_rate_limiter,
-        rate_limiter_key=f'{api_kind}:{network}:proxy.blockTxCount',
-        retry_policy=_retry,
+        retry=_retry,
+        telemetry=_telemetry,
     )
-
-    if isinstance(response, dict):
-        result = response.get('result', response)
-        if isinstance(result, str):
-            return result
-    return str(response)
+    return _result_str(response)
 
 
 async def get_tx_by_block_number_and_index(
@@ -498,35 +506,66 @@ async def get_tx_by_block_number_and_index(
     _retry: RetryPolicy | None = None,
     _telemetry: Telemetry | None = None,
 ) -> dict[str, Any]:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
-    url: str = endpoint.api_url
-    params: dict[str, Any] = {
-        'module': 'proxy',
-        'action': 'eth_getTransactionByBlockNumberAndIndex',
-        'tag': _to_tag(tag),
-        'index': _to_tag(index),
-    }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
-
-    signed_params, headers = endpoint.filter_and_sign(params, headers=None)
-
-    response: Any = await run_with_policies(
-        do_call=lambda: http.get(url, params=signed_params, headers=headers),
-        telemetry=_telemetry,
+    response: Any = await _proxy_rpc(
+        action='eth_getTransactionByBlockNumberAndIndex',
+        params={
+            'tag': _to_tag(tag),
+            'index': _to_tag(index),
+        },
         telemetry_name='proxy.get_tx_by_block_number_and_index',
+        key_suffix='txByBlockIndex',
         api_kind=api_kind,
         network=network,
+        api_key=api_key,
+        http=http,
+        endpoint_builder=_endpoint_builder,
+        extra_params=extra_params,
         rate_limiter=_rate_limiter,
-        rate_limiter_key=f'{api_kind}:{network}:proxy.txByBlockIndex',
-        retry_policy=_retry,
+        retry=_retry,
+        telemetry=_telemetry,
     )
+    return result_dict(response)
 
-    if isinstance(response, dict):
-        result = response.get('result', response)
-        if isinstance(result, dict):
-            return result
-    return {}
+
+async def get_txs_by_block_number_and_index(
+    *,
+    tag: int | str,
+    indices: Sequence[int | str],
+    api_kind: str,
+    network: str,
+    api_key: str,
+    http: HttpClient,
+    _endpoint_builder: EndpointBuilder,
+    extra_params: Mapping[str, Any] | None = None,
+    max_concurrency: int = 8,
+    _rate_limiter: RateLimiter | None = None,
+    _retry: RetryPolicy | None = None,
+    _telemetry: Telemetry | None = None,
+) -> list[dict[str, Any]]:
+    """Fetch several transactions of one block, returned in the order of ``indices``.
+
+    The proxy module has no JSON-RPC batch endpoint, so requests are issued
+    concurrently (at most ``max_concurrency`` at a time) over the shared client.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _one(index: int | str) -> dict[str, Any]:
+        async with semaphore:
+            return await get_tx_by_block_number_and_index(
+                tag=tag,
+                index=index,
+                api_kind=api_kind,
+                network=network,
+                api_key=api_key,
+                http=http,
+                _endpoint_builder=_endpoint_builder,
+                extra_params=extra_params,
+                _rate_limiter=_rate_limiter,
+                _retry=_retry,
+                _telemetry=_telemetry,
+            )
+
+    return list(await asyncio.gather(*(_one(index) for index in indices)))
 
 
 async def get_uncle_by_block_number_and_index(
@@ -543,35 +582,25 @@ async def get_uncle_by_block_number_and_index(
     _retry: RetryPolicy | None = None,
     _telemetry: Telemetry | None = None,
 ) -> dict[str, Any]:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
-    url: str = endpoint.api_url
-    params: dict[str, Any] = {
-        'module': 'proxy',
-        'action': 'eth_getUncleByBlockNumberAndIndex',
-        'tag': _to_tag(tag),
-        'index': _to_tag(index),
-    }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
-
-    signed_params, headers = endpoint.filter_and_sign(params, headers=None)
-
-    response: Any = await run_with_policies(
-        do_call=lambda: http.get(url, params=signed_params, headers=headers),
-        telemetry=_telemetry,
+    response: Any = await _proxy_rpc(
+        action='eth_getUncleByBlockNumberAndIndex',
+        params={
+            'tag': _to_tag(tag),
+            'index': _to_tag(index),
+        },
         telemetry_name='proxy.get_uncle_by_block_number_and_index',
+        key_suffix='uncleByBlockIndex',
         api_kind=api_kind,
         network=network,
+        api_key=api_key,
+        http=http,
+        endpoint_builder=_endpoint_builder,
+        extra_params=extra_params,
         rate_limiter=_rate_limiter,
-        rate_limiter_key=f'{api_kind}:{network}:proxy.uncleByBlockIndex',
-        retry_policy=_retry,
+        retry=_retry,
+        telemetry=_telemetry,
     )
-
-    if isinstance(response, dict):
-        result = response.get('result', response)
-        if isinstance(result, dict):
-            return result
-    return {}
+    return result_dict(response)
 
 
 async def estimate_gas(
@@ -590,37 +619,27 @@ async def estimate_gas(
     _retry: RetryPolicy | None = None,
     _telemetry: Telemetry | None = None,
 ) -> str:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
-    url: str = endpoint.api_url
-    params: dict[str, Any] = {
-        'module': 'proxy',
-        'action': 'eth_estimateGas',
-        'to': to,
-        'value': value,
-        'gasPrice': gas_price,
-        'gas': gas,
-    }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
-
-    signed_params, headers = endpoint.filter_and_sign(params, headers=None)
-
-    response: Any = await run_with_policies(
-        do_call=lambda: http.get(url, params=signed_params, headers=headers),
-        telemetry=_telemetry,
+    response: Any = await _proxy_rpc(
+        action='eth_estimateGas',
+        params={
+            'to': to,
+            'value': value,
+            'gasPrice': gas_price,
+            'gas': gas,
+        },
         telemetry_name='proxy.estimate_gas',
+        key_suffix='estimateGas',
         api_kind=api_kind,
         network=network,
+        api_key=api_key,
+        http=http,
+        endpoint_builder=_endpoint_builder,
+        extra_params=extra_params,
         rate_limiter=_rate_limiter,
-        rate_limiter_key=f'{api_kind}:{network}:proxy.estimateGas',
-        retry_policy=_retry,
+        retry=_retry,
+        telemetry=_telemetry,
     )
-
-    if isinstance(response, dict):
-        result = response.get('result', response)
-        if isinstance(result, str):
-            return result
-    return str(response)
+    return _result_str(response)
 
 
 async def send_raw_tx(
@@ -636,32 +655,25 @@ async def send_raw_tx(
     _retry: RetryPolicy | None = None,
     _telemetry: Telemetry | None = None,
 ) -> dict[str, Any]:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
-    url: str = endpoint.api_url
-    data: dict[str, Any] = {
-        'module': 'proxy',
-        'action': 'eth_sendRawTransaction',
-        'hex': raw_hex,
-    }
-    if extra_params:
-        data.update({k: v for k, v in extra_params.items() if v is not None})
-
-    signed_data, headers = endpoint.filter_and_sign(data, headers=None)
-
-    response: Any = await run_with_policies(
-        do_call=lambda: http.post(url, data=signed_data, headers=headers),
-        telemetry=_telemetry,
+    response: Any = await _proxy_rpc(
+        action='eth_sendRawTransaction',
+        params={
+            'hex': raw_hex,
+        },
         telemetry_name='proxy.send_raw_tx',
+        key_suffix='sendRawTx',
         api_kind=api_kind,
         network=network,
+        api_key=api_key,
+        http=http,
+        endpoint_builder=_endpoint_builder,
+        extra_params=extra_params,
         rate_limiter=_rate_limiter,
-        rate_limiter_key=f'{api_kind}:{network}:proxy.sendRawTx',
-        retry_policy=_retry,
+        retry=_retry,
+        telemetry=_telemetry,
+        http_method='post',
     )
-
-    if isinstance(response, dict):
-        return response
-    return {'result': response}
+    return response if isinstance(response, dict) else {'result': response}
 
 
 async def get_tx_receipt(
@@ -677,31 +689,79 @@ async def get_tx_receipt(
     _retry: RetryPolicy | None = None,
     _telemetry: Telemetry | None = None,
 ) -> dict[str, Any]:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
-    url: str = endpoint.api_url
-    params: dict[str, Any] = {
-        'module': 'proxy',
-        'action': 'eth_getTransactionReceipt',
-        'txhash': txhash,
-    }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
-
-    signed_params, headers = endpoint.filter_and_sign(params, headers=None)
-
-    response: Any = await run_with_policies(
-        do_call=lambda: http.get(url, params=signed_params, headers=headers),
-        telemetry=_telemetry,
+    response: Any = await _proxy_rpc(
+        action='eth_getTransactionReceipt',
+        params={
+            'txhash': txhash,
+        },
         telemetry_name='proxy.get_tx_receipt',
+        key_suffix='txReceipt',
         api_kind=api_kind,
         network=network,
+        api_key=api_key,
+        http=http,
+        endpoint_builder=_endpoint_builder,
+        extra_params=extra_params,
         rate_limiter=_rate_limiter,
-        rate_limiter_key=f'{api_kind}:{network}:proxy.txReceipt',
-        retry_policy=_retry,
+        retry=_retry,
+        telemetry=_telemetry,
     )
+    return result_dict(response)
 
-    if isinstance(response, dict):
-        result = response.get('result', response)
-        if isinstance(result, dict):
-            return result
-    return {}
+
+@dataclass(slots=True)
+class ProxySnapshot:
+    """Chain-head readings fetched together by ``get_proxy_snapshot``.
+
+    Values are provider-shaped hex strings; fields that were not requested stay None.
+    """
+
+    block_number: str | None = None
+    gas_price: str | None = None
+    tx_count: str | None = None
+
+
+async def get_proxy_snapshot(
+    *,
+    api_kind: str,
+    network: str,
+    api_key: str,
+    http: HttpClient,
+    _endpoint_builder: EndpointBuilder,
+    block_number: bool = True,
+    gas_price: bool = True,
+    tx_count_for: str | None = None,
+    tag: int | str = 'latest',
+    _cache: Cache | None = None,
+    _rate_limiter: RateLimiter | None = None,
+    _retry: RetryPolicy | None = None,
+    _telemetry: Telemetry | None = None,
+) -> ProxySnapshot:
+    """Fetch head block number, gas price and an address nonce concurrently.
+
+    The requests overlap instead of running back to back; the first failure is raised.
+    """
+    common: dict[str, Any] = {
+        'api_kind': api_kind,
+        'network': network,
+        'api_key': api_key,
+        'http': http,
+        '_endpoint_builder': _endpoint_builder,
+        '_rate_limiter': _rate_limiter,
+        '_retry': _retry,
+        '_telemetry': _telemetry,
+    }
+    fields: list[str] = []
+    calls: list[Awaitable[str]] = []
+    if block_number:
+        fields.append('block_number')
+        calls.append(get_block_number(_cache=_cache, **common))
+    if gas_price:
+        fields.append('gas_price')
+        calls.append(get_gas_price(_cache=_cache, **common))
+    if tx_count_for is not None:
+        fields.append('tx_count')
+        calls.append(get_tx_count(address=tx_count_for, tag=tag, **common))
+
+    values = await asyncio.gather(*calls)
+    return ProxySnapshot(**dict(zip(fields, values, strict=True)))
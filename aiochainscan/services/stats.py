@@ -11,7 +11,7 @@ from aiochainscan.ports.endpoint_builder import EndpointBuilder
 from aiochainscan.ports.http_client import HttpClient
 from aiochainscan.ports.rate_limiter import RateLimiter, RetryPolicy
 from aiochainscan.ports.telemetry import Telemetry
-from aiochainscan.services._executor import run_with_policies
+from aiochainscan.services._executor import merge_extra_params, open_endpoint, run_with_policies
 from aiochainscan.services.constants import CACHE_TTL_ETH_PRICE_SECONDS
 
 
@@ -32,15 +32,16 @@ async def get_eth_price(
 
     Returns a provider-shaped mapping with keys like 'ethusd', 'ethbtc', etc.
     """
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
 
     params: dict[str, Any] = {
         'module': 'stats',
         'action': 'ethprice',
     }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
+    merge_extra_params(params, extra_params)
 
     # Preserve explicit None for sort in tests: keep the key present
     signed_params, headers = endpoint.filter_and_sign(params, headers=None)
@@ -90,11 +91,12 @@ async def get_eth_supply(
     _telemetry: Telemetry | None = None,
 ) -> str:
     """Get Total Supply of Ether (ethsupply)."""
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
     params: dict[str, Any] = {'module': 'stats', 'action': 'ethsupply'}
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
+    merge_extra_params(params, extra_params)
     signed_params, headers = endpoint.filter_and_sign(params, headers=None)
     response: Any = await run_with_policies(
         do_call=lambda: http.get(url, params=signed_params, headers=headers),
@@ -125,11 +127,12 @@ async def get_eth2_supply(
     _telemetry: Telemetry | None = None,
 ) -> str:
     """Get Total Supply of Ether (ethsupply2)."""
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
     params: dict[str, Any] = {'module': 'stats', 'action': 'ethsupply2'}
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
+    merge_extra_params(params, extra_params)
     signed_params, headers = endpoint.filter_and_sign(params, headers=None)
     response: Any = await run_with_policies(
         do_call=lambda: http.get(url, params=signed_params, headers=headers),
@@ -160,11 +163,12 @@ async def get_total_nodes_count(
     _telemetry: Telemetry | None = None,
 ) -> dict[str, Any]:
     """Get Total Nodes Count (nodecount)."""
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
     params: dict[str, Any] = {'module': 'stats', 'action': 'nodecount'}
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
+    merge_extra_params(params, extra_params)
     signed_params, headers = endpoint.filter_and_sign(params, headers=None)
     response: Any = await run_with_policies(
         do_call=lambda: http.get(url, params=signed_params, headers=headers),
@@ -199,7 +203,9 @@ async def get_chain_size(
     _telemetry: Telemetry | None = None,
 ) -> dict[str, Any] | None:
     """Get chain size (provider-shaped). Returns None when provider returns empty list."""
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
     params: dict[str, Any] = {
         'module': 'stats',
@@ -272,7 +278,9 @@ async def _get_daily_series(
     _telemetry: Telemetry | None = None,
 ) -> list[dict[str, Any]]:
     """Fetch a daily time-series from stats endpoints (raw provider shape)."""
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
 
     params: dict[str, Any] = {
@@ -287,7 +295,7 @@ async def _get_daily_series(
     async def _do_request() -> Any:
         if _rate_limiter is not None:
             await _rate_limiter.acquire(key=f'{api_kind}:{network}:{action}')
-        start = monotonic()
+        start = monotonic() if _telemetry is not None else 0.0
         try:
             return await http.get(url, params=signed_params, headers=headers)
         finally:
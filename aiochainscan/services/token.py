@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Mapping
-from time import monotonic
+from math import isfinite
+from random import random
+from time import monotonic, time
 from typing import Any, TypedDict
 
 from aiochainscan.domain.models import Address
@@ -10,10 +13,23 @@ from aiochainscan.ports.endpoint_builder import EndpointBuilder
 from aiochainscan.ports.http_client import HttpClient
 from aiochainscan.ports.rate_limiter import RateLimiter, RetryPolicy
 from aiochainscan.ports.telemetry import Telemetry
+from aiochainscan.services._executor import (
+    coalesce_inflight,
+    inflight_key,
+    merge_extra_params,
+    open_endpoint,
+    run_in_background,
+)
+from aiochainscan.services.constants import CACHE_REFRESH_JITTER_TOKEN_BALANCE
+from aiochainscan.services.constants import (
+    CACHE_STALE_TTL_TOKEN_BALANCE_SECONDS as CACHE_STALE_TTL_SECONDS_TOKEN_BALANCE,
+)
 from aiochainscan.services.constants import (
     CACHE_TTL_TOKEN_BALANCE_SECONDS as CACHE_TTL_SECONDS_TOKEN_BALANCE,
 )
 
+_INFLIGHT: dict[str, asyncio.Future[int]] = {}
+
 
 async def get_token_balance(
     *,
@@ -35,9 +51,27 @@ async def get_token_balance(
     Uses the common Etherscan-compatible endpoint: module=account&action=tokenbalance.
     """
 
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
-    url: str = endpoint.api_url
     cache_key = f'token_balance:{api_kind}:{network}:{holder}:{token_contract}'
+    # Entries are {'value': int, 'stored_at': epoch, 'fresh_for': seconds}; past the
+    # jittered fresh window the old value is still served while one background refresh
+    # replaces it (stale-while-revalidate)
+    stale: int | None = None
+    if _cache is not None:
+        cached = await _cache.get(cache_key)
+        if isinstance(cached, int):
+            return cached
+        if isinstance(cached, dict) and isinstance(cached.get('value'), int):
+            cached_value: int = cached['value']
+            stored_at = cached.get('stored_at')
+            fresh_for = cached.get('fresh_for', CACHE_TTL_SECONDS_TOKEN_BALANCE)
+            if not isinstance(stored_at, int | float) or time() - stored_at < fresh_for:
+                return cached_value
+            stale = cached_value
+
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
+    url: str = endpoint.api_url
 
     params: dict[str, Any] = {
         'module': 'account',
@@ -46,21 +80,14 @@ async def get_token_balance(
         'address': str(holder),
         'tag': 'latest',
     }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
+    merge_extra_params(params, extra_params)
 
     signed_params, headers = endpoint.filter_and_sign(params, headers=None)
 
-    # Try cache first
-    if _cache is not None:
-        cached = await _cache.get(cache_key)
-        if isinstance(cached, int):
-            return cached
-
     async def _do_request() -> Any:
         if _rate_limiter is not None:
             await _rate_limiter.acquire(key=f'{api_kind}:{network}:token_balance')
-        start = monotonic()
+        start = monotonic() if _telemetry is not None else 0.0
         try:
             return await http.get(url, params=signed_params, headers=headers)
         finally:
@@ -71,49 +98,75 @@ async def get_token_balance(
                     {'api_kind': api_kind, 'network': network, 'duration_ms': duration_ms},
                 )
 
-    try:
-        if _retry is not None:
-            response: Any = await _retry.run(_do_request)
-        else:
-            response = await _do_request()
-    except Exception as exc:  # noqa: BLE001
+    async def _fetch() -> int:
+        try:
+            if _retry is not None:
+                response: Any = await _retry.run(_do_request)
+            else:
+                response = await _do_request()
+        except Exception as exc:  # noqa: BLE001
+            if _telemetry is not None:
+                await _telemetry.record_error(
+                    'get_token_balance.error',
+                    exc,
+                    {
+                        'api_kind': api_kind,
+                        'network': network,
+                    },
+                )
+            raise
+
+        value: int = 0
+        if isinstance(response, dict):
+            result = response.get('result', response)
+            if (
+                (isinstance(result, str) and result.isdecimal())
+                or isinstance(result, int)
+                or (isinstance(result, float) and isfinite(result))
+            ):
+                value = int(result)
+        elif isinstance(response, int):
+            # int() also turns a bool payload into a plain 0/1
+            value = int(response)
+        elif isinstance(response, float):
+            value = int(response) if isfinite(response) else 0
+        elif isinstance(response, str):
+            # Validate up front instead of paying for a raised ValueError on bad payloads
+            text = response.strip()
+            value = int(text) if text.removeprefix('-').isdecimal() else 0
+
         if _telemetry is not None:
-            await _telemetry.record_error(
-                'get_token_balance.error',
-                exc,
+            await _telemetry.record_event(
+                'token.get_token_balance.ok',
                 {
                     'api_kind': api_kind,
                     'network': network,
                 },
             )
-        raise
-
-    value: int = 0
-    if isinstance(response, dict):
-        result = response.get('result', response)
-        if (isinstance(result, str) and result.isdigit()) or isinstance(result, int | float):
-            value = int(result)
-    elif isinstance(response, str) and response.isdigit():
-        value = int(response)
-    else:
-        try:
-            value = int(response)  # best-effort coercion
-        except Exception:
-            value = 0
 
-    if _telemetry is not None:
-        await _telemetry.record_event(
-            'token.get_token_balance.ok',
-            {
-                'api_kind': api_kind,
-                'network': network,
-            },
-        )
+        if _cache is not None and value >= 0:
+            await _cache.set(
+                cache_key,
+                {
+                    'value': value,
+                    'stored_at': time(),
+                    'fresh_for': CACHE_TTL_SECONDS_TOKEN_BALANCE
+                    * (1 - CACHE_REFRESH_JITTER_TOKEN_BALANCE * random()),
+                },
+                ttl_seconds=CACHE_STALE_TTL_SECONDS_TOKEN_BALANCE,
+            )
 
-    if _cache is not None and value >= 0:
-        await _cache.set(cache_key, value, ttl_seconds=CACHE_TTL_SECONDS_TOKEN_BALANCE)
+        return value
 
-    return value
+    shared_key = inflight_key(cache_key, http, _cache, _rate_limiter, _telemetry)
+    if stale is not None:
+        if shared_key not in _INFLIGHT:
+            run_in_background(coalesce_inflight(_INFLIGHT, shared_key, _fetch))
+        return stale
+    if extra_params:
+        return await _fetch()
+    # Concurrent lookups of the same holder/contract share a single upstream call
+    return await coalesce_inflight(_INFLIGHT, shared_key, _fetch)
 
 
 class TokenBalanceDTO(TypedDict):
@@ -150,15 +203,16 @@ async def get_token_total_supply(
     _telemetry: Telemetry | None = None,
 ) -> str:
     """Get ERC20-Token TotalSupply by ContractAddress."""
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
     params: dict[str, Any] = {
         'module': 'stats',
         'action': 'tokensupply',
         'contractaddress': str(contract),
     }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
+    merge_extra_params(params, extra_params)
     signed_params, headers = endpoint.filter_and_sign(params, headers=None)
     response: Any = await http.get(url, params=signed_params, headers=headers)
     if isinstance(response, dict):
@@ -182,7 +236,9 @@ async def get_token_total_supply_by_block(
     _telemetry: Telemetry | None = None,
 ) -> str:
     """Get Historical ERC20-Token TotalSupply by ContractAddress & BlockNo."""
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
     params: dict[str, Any] = {
         'module': 'stats',
@@ -190,8 +246,7 @@ async def get_token_total_supply_by_block(
         'contractaddress': str(contract),
         'blockno': block_no,
     }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
+    merge_extra_params(params, extra_params)
     signed_params, headers = endpoint.filter_and_sign(params, headers=None)
     response: Any = await http.get(url, params=signed_params, headers=headers)
     if isinstance(response, dict):
@@ -216,7 +271,9 @@ async def get_token_balance_history(
     _telemetry: Telemetry | None = None,
 ) -> str:
     """Get Historical ERC20-Token Account Balance by BlockNo."""
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
     params: dict[str, Any] = {
         'module': 'account',
@@ -225,8 +282,7 @@ async def get_token_balance_history(
         'address': str(address),
         'blockno': block_no,
     }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
+    merge_extra_params(params, extra_params)
     signed_params, headers = endpoint.filter_and_sign(params, headers=None)
     response: Any = await http.get(url, params=signed_params, headers=headers)
     if isinstance(response, dict):
@@ -250,7 +306,9 @@ async def get_token_holder_list(
     _retry: RetryPolicy | None = None,
     _telemetry: Telemetry | None = None,
 ) -> list[dict[str, Any]]:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
     params: dict[str, Any] = {
         'module': 'token',
@@ -259,8 +317,7 @@ async def get_token_holder_list(
         'page': page,
         'offset': offset,
     }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
+    merge_extra_params(params, extra_params)
     signed_params, headers = endpoint.filter_and_sign(params, headers=None)
     response: Any = await http.get(url, params=signed_params, headers=headers)
     if isinstance(response, dict):
@@ -282,15 +339,16 @@ async def get_token_info(
     _endpoint_builder: EndpointBuilder,
     extra_params: Mapping[str, Any] | None = None,
 ) -> list[dict[str, Any]]:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
     params: dict[str, Any] = {
         'module': 'token',
         'action': 'tokeninfo',
         'contractaddress': None if contract_address is None else str(contract_address),
     }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
+    merge_extra_params(params, extra_params)
     signed_params, headers = endpoint.filter_and_sign(params, headers=None)
     response: Any = await http.get(url, params=signed_params, headers=headers)
     if isinstance(response, dict):
@@ -313,7 +371,9 @@ async def get_address_token_balance(
     http: HttpClient,
     _endpoint_builder: EndpointBuilder,
 ) -> list[dict[str, Any]]:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
     params: dict[str, Any] = {
         'module': 'account',
@@ -344,7 +404,9 @@ async def get_address_token_nft_balance(
     http: HttpClient,
     _endpoint_builder: EndpointBuilder,
 ) -> list[dict[str, Any]]:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
     params: dict[str, Any] = {
         'module': 'account',
@@ -376,7 +438,9 @@ async def get_address_token_nft_inventory(
     http: HttpClient,
     _endpoint_builder: EndpointBuilder,
 ) -> list[dict[str, Any]]:
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
     url: str = endpoint.api_url
     params: dict[str, Any] = {
         'module': 'account',
@@ -1,20 +1,27 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
+from functools import partial
 from time import monotonic
 from typing import Any
 
 from aiochainscan.domain.dto import TransactionDTO
 from aiochainscan.domain.models import TxHash
 from aiochainscan.ports.cache import Cache
-from aiochainscan.ports.endpoint_builder import EndpointBuilder
+from aiochainscan.ports.endpoint_builder import EndpointBuilder, EndpointSession
 from aiochainscan.ports.graphql_client import GraphQLClient
 from aiochainscan.ports.graphql_query_builder import GraphQLQueryBuilder
 from aiochainscan.ports.http_client import HttpClient
 from aiochainscan.ports.provider_federator import ProviderFederator
 from aiochainscan.ports.rate_limiter import RateLimiter, RetryPolicy
 from aiochainscan.ports.telemetry import Telemetry
-from aiochainscan.services._executor import run_with_policies
+from aiochainscan.services._executor import (
+    merge_extra_params,
+    open_endpoint,
+    parse_int,
+    result_dict,
+    run_with_policies,
+)
 
 CACHE_TTL_SECONDS: int = 10
 
@@ -40,9 +47,17 @@ async def get_transaction_by_hash(
 
     Tries GraphQL first when available; falls back to REST proxy otherwise.
     """
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
-    url: str = endpoint.api_url
+    # Cache hits need neither the endpoint nor any signing, on either transport
     cache_key = f'tx:{api_kind}:{network}:{txhash}'
+    if _cache is not None:
+        cached = await _cache.get(cache_key)
+        if isinstance(cached, dict):
+            return cached
+
+    endpoint = open_endpoint(
+        _endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+    )
+    url: str = endpoint.api_url
 
     # GraphQL path (if supported and DI provided)
     if (
@@ -66,7 +81,7 @@ async def get_transaction_by_hash(
         async def _do_gql(gql_url: str) -> Any:
             if _rate_limiter is not None:
                 await _rate_limiter.acquire(key=f'{api_kind}:{network}:tx:gql')
-            start = monotonic()
+            start = monotonic() if _telemetry is not None else 0.0
             try:
                 return await _gql.execute(gql_url, query, variables, headers=headers)
             finally:
@@ -123,23 +138,12 @@ async def get_transaction_by_hash(
             )
         # fall through to REST
 
-    params: dict[str, Any] = {
-        'module': 'proxy',
-        'action': 'eth_getTransactionByHash',
-        'txhash': str(txhash),
-    }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
-
-    signed_params, headers = endpoint.filter_and_sign(params, headers=None)
-
-    if _cache is not None:
-        cached = await _cache.get(cache_key)
-        if isinstance(cached, dict):
-            return cached
+    signed_params, headers = _sign_txhash(
+        endpoint, 'proxy', 'eth_getTransactionByHash', txhash, extra_params
+    )
 
     response: Any = await run_with_policies(
-        do_call=lambda: http.get(url, params=signed_params, headers=headers),
+        do_call=partial(http.get, url, params=signed_params, headers=headers),
         telemetry=_telemetry,
         telemetry_name='transaction.get_transaction_by_hash',
         api_kind=api_kind,
@@ -149,11 +153,7 @@ async def get_transaction_by_hash(
         retry_policy=_retry,
     )
 
-    out: dict[str, Any] = {}
-    if isinstance(response, dict):
-        result = response.get('result', response)
-        if isinstance(result, dict):
-            out = result
+    out = result_dict(response)
 
     if _telemetry is not None:
         await _telemetry.record_event(
@@ -170,28 +170,66 @@ async def get_transaction_by_hash(
     return out
 
 
+_HASH_KEYS: tuple[str, ...] = ('hash', 'tx_hash', 'txhash')
+_BLOCK_NUMBER_KEYS: tuple[str, ...] = ('blockNumber', 'block_number')
+
+
 def normalize_transaction(raw: dict[str, Any]) -> TransactionDTO:
     """Normalize provider-shaped transaction into TransactionDTO."""
+    get = raw.get
+    tx_hash_value = get('hash') or get('tx_hash') or get('txhash')
+    return _to_dto(raw, tx_hash_value, get('blockNumber') or get('block_number'))
 
-    def hex_to_int(h: str | None) -> int | None:
-        if not h:
-            return None
-        try:
-            return int(h, 16) if isinstance(h, str) and h.startswith('0x') else int(h)
-        except Exception:
-            return None
 
-    tx_hash_value = raw.get('hash') or raw.get('tx_hash') or raw.get('txhash')
+def normalize_transactions(raws: Iterable[dict[str, Any]]) -> list[TransactionDTO]:
+    """Normalize a batch of provider-shaped transactions (e.g. a block's worth).
+
+    Records in one page share a schema, so the hash and block-number keys are
+    resolved from the first record and reused. A record takes the per-record
+    fallback chain whenever that shortcut could disagree with
+    :func:`normalize_transaction`: a resolved value is missing or falsy, or a key
+    earlier in the chain holds a value.
+    """
+    out: list[TransactionDTO] = []
+    hash_key = block_key = ''
+    # Keys ahead of the resolved ones in the fallback chain; normally empty
+    hash_ahead: tuple[str, ...] = ()
+    block_ahead: tuple[str, ...] = ()
+    for raw in raws:
+        if not out:
+            hash_key = next((k for k in _HASH_KEYS if k in raw), '')
+            block_key = next((k for k in _BLOCK_NUMBER_KEYS if k in raw), '')
+            hash_ahead = _HASH_KEYS[: _HASH_KEYS.index(hash_key)] if hash_key else ()
+            block_ahead = (
+                _BLOCK_NUMBER_KEYS[: _BLOCK_NUMBER_KEYS.index(block_key)] if block_key else ()
+            )
+        get = raw.get
+        tx_hash_value = get(hash_key)
+        block_number = get(block_key)
+        if (
+            tx_hash_value
+            and block_number
+            and not any(get(k) for k in hash_ahead)
+            and not any(get(k) for k in block_ahead)
+        ):
+            out.append(_to_dto(raw, tx_hash_value, block_number))
+        else:
+            out.append(normalize_transaction(raw))
+    return out
+
+
+def _to_dto(raw: dict[str, Any], tx_hash_value: Any, block_number: Any) -> TransactionDTO:
+    get = raw.get
     return {
         'tx_hash': str(tx_hash_value) if tx_hash_value is not None else '',
-        'block_number': hex_to_int(raw.get('blockNumber') or raw.get('block_number')),
-        'from_address': raw.get('from'),
-        'to_address': raw.get('to'),
-        'value_wei': hex_to_int(raw.get('value')),
-        'gas': hex_to_int(raw.get('gas')),
-        'gas_price_wei': hex_to_int(raw.get('gasPrice')),
-        'nonce': hex_to_int(raw.get('nonce')),
-        'input': raw.get('input'),
+        'block_number': parse_int(block_number),
+        'from_address': get('from'),
+        'to_address': get('to'),
+        'value_wei': parse_int(get('value')),
+        'gas': parse_int(get('gas')),
+        'gas_price_wei': parse_int(get('gasPrice')),
+        'nonce': parse_int(get('nonce')),
+        'input': get('input'),
     }
 
 
@@ -209,27 +247,20 @@ async def get_tx_receipt_status(
     _telemetry: Telemetry | None = None,
 ) -> dict[str, Any]:
     """[BETA] Check Transaction Receipt Status (post-Byzantium)."""
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
-    url: str = endpoint.api_url
-    params: dict[str, Any] = {
-        'module': 'transaction',
-        'action': 'gettxreceiptstatus',
-        'txhash': str(txhash),
-    }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
-    signed_params, headers = endpoint.filter_and_sign(params, headers=None)
-    response: Any = await run_with_policies(
-        do_call=lambda: http.get(url, params=signed_params, headers=headers),
-        telemetry=_telemetry,
+    return await _get_status(
+        action='gettxreceiptstatus',
         telemetry_name='transaction.get_tx_receipt_status',
+        txhash=txhash,
         api_kind=api_kind,
         network=network,
+        api_key=api_key,
+        http=http,
+        endpoint_builder=_endpoint_builder,
+        extra_params=extra_params,
         rate_limiter=_rate_limiter,
-        rate_limiter_key=f'{api_kind}:{network}:gettxreceiptstatus',
-        retry_policy=_retry,
+        retry=_retry,
+        telemetry=_telemetry,
     )
-    return response if isinstance(response, dict) else {'result': response}
 
 
 async def get_contract_execution_status(
@@ -246,24 +277,62 @@ async def get_contract_execution_status(
     _telemetry: Telemetry | None = None,
 ) -> dict[str, Any]:
     """[BETA] Check Contract Execution Status (provider-shaped)."""
-    endpoint = _endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
-    url: str = endpoint.api_url
-    params: dict[str, Any] = {
-        'module': 'transaction',
-        'action': 'getstatus',
-        'txhash': str(txhash),
-    }
-    if extra_params:
-        params.update({k: v for k, v in extra_params.items() if v is not None})
-    signed_params, headers = endpoint.filter_and_sign(params, headers=None)
-    response: Any = await run_with_policies(
-        do_call=lambda: http.get(url, params=signed_params, headers=headers),
-        telemetry=_telemetry,
+    return await _get_status(
+        action='getstatus',
         telemetry_name='transaction.get_contract_execution_status',
+        txhash=txhash,
         api_kind=api_kind,
         network=network,
+        api_key=api_key,
+        http=http,
+        endpoint_builder=_endpoint_builder,
+        extra_params=extra_params,
         rate_limiter=_rate_limiter,
-        rate_limiter_key=f'{api_kind}:{network}:getstatus',
-        retry_policy=_retry,
+        retry=_retry,
+        telemetry=_telemetry,
+    )
+
+
+async def _get_status(
+    *,
+    action: str,
+    telemetry_name: str,
+    txhash: TxHash,
+    api_kind: str,
+    network: str,
+    api_key: str,
+    http: HttpClient,
+    endpoint_builder: EndpointBuilder,
+    extra_params: Mapping[str, Any] | None,
+    rate_limiter: RateLimiter | None,
+    retry: RetryPolicy | None,
+    telemetry: Telemetry | None,
+) -> dict[str, Any]:
+    """Shared request path for the ``module=transaction`` status actions."""
+    endpoint = open_endpoint(endpoint_builder, api_key=api_key, api_kind=api_kind, network=network)
+    url: str = endpoint.api_url
+    signed_params, headers = _sign_txhash(endpoint, 'transaction', action, txhash, extra_params)
+    response: Any = await run_with_policies(
+        do_call=partial(http.get, url, params=signed_params, headers=headers),
+        telemetry=telemetry,
+        telemetry_name=telemetry_name,
+        api_kind=api_kind,
+        network=network,
+        rate_limiter=rate_limiter,
+        rate_limiter_key=f'{api_kind}:{network}:{action}',
+        retry_policy=retry,
     )
     return response if isinstance(response, dict) else {'result': response}
+
+
+def _sign_txhash(
+    endpoint: EndpointSession,
+    module: str,
+    action: str,
+    txhash: TxHash,
+    extra_params: Mapping[str, Any] | None,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    # Sign the full parameter set: builders may filter or sign over every parameter
+    params: dict[str, Any] = {'module': module, 'action': action, 'txhash': str(txhash)}
+    merge_extra_params(params, extra_params)
+    return endpoint.filter_and_sign(params, headers=None)
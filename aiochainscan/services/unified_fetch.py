@@ -7,6 +7,7 @@ from aiochainscan.ports.endpoint_builder import EndpointBuilder
 from aiochainscan.ports.http_client import HttpClient
 from aiochainscan.ports.rate_limiter import RateLimiter, RetryPolicy
 from aiochainscan.ports.telemetry import Telemetry
+from aiochainscan.services._executor import open_endpoint, parse_int
 from aiochainscan.services.account import (
     get_internal_transactions,
     get_normal_transactions,
@@ -31,18 +32,6 @@ DataType = Literal[
 Strategy = Literal['basic', 'fast']
 
 
-def _to_int(value: Any) -> int:
-    try:
-        if isinstance(value, str):
-            s = value.strip()
-            if s.startswith('0x'):
-                return int(s, 16)
-            return int(s)
-        return int(value)
-    except Exception:  # noqa: BLE001
-        return 0
-
-
 def _resolve_end_block_factory(
     *,
     api_kind: str,
@@ -54,7 +43,9 @@ def _resolve_end_block_factory(
     retry: RetryPolicy | None,
 ) -> ResolveEndBlock:
     async def _resolve() -> int:
-        endpoint = endpoint_builder.open(api_key=api_key, api_kind=api_kind, network=network)
+        endpoint = open_endpoint(
+            endpoint_builder, api_key=api_key, api_kind=api_kind, network=network
+        )
         url: str = endpoint.api_url
         params_proxy: dict[str, Any] = {'module': 'proxy', 'action': 'eth_blockNumber'}
         signed_params, headers = endpoint.filter_and_sign(params_proxy, headers=None)
@@ -180,7 +171,7 @@ async def fetch_all(
             return it.get('hash') if isinstance(it.get('hash'), str) else None
 
         def order_fn(it: dict[str, Any]) -> tuple[int, int]:
-            return _to_int(it.get('blockNumber')), _to_int(it.get('transactionIndex'))
+            return parse_int(it.get('blockNumber'), 0), parse_int(it.get('transactionIndex'), 0)
     elif data_type == 'token_transfers':
 
         def _key_fn_token(it: dict[str, Any]) -> str | None:
@@ -195,7 +186,7 @@ async def fetch_all(
         key_fn = _key_fn_token
 
         def order_fn(it: dict[str, Any]) -> tuple[int, int]:
-            return _to_int(it.get('blockNumber')), _to_int(it.get('transactionIndex'))
+            return parse_int(it.get('blockNumber'), 0), parse_int(it.get('transactionIndex'), 0)
     else:  # logs
 
         def _key_fn_logs(it: dict[str, Any]) -> str | None:
@@ -208,7 +199,7 @@ async def fetch_all(
         key_fn = _key_fn_logs
 
         def order_fn(it: dict[str, Any]) -> tuple[int, int]:
-            return _to_int(it.get('blockNumber')), _to_int(it.get('logIndex'))
+            return parse_int(it.get('blockNumber'), 0), parse_int(it.get('logIndex'), 0)
 
     # Page fetchers per data type
     fetch_page_desc: Callable[..., Any] | None
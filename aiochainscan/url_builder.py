@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 from urllib.parse import urljoin, urlunsplit
 
@@ -70,6 +71,8 @@ class UrlBuilder:
         ('blast', 'sepolia'): '168587773',
     }
 
+    _NETWORK_EXCEPTIONS = {('polygon', 'testnet'): 'mumbai'}
+
     BASE_URL: str
     API_URL: str
 
@@ -79,6 +82,16 @@ class UrlBuilder:
         self._set_api_kind(api_kind)
         self._network = network.lower().strip()
 
+        # Everything below depends only on (api_kind, network); resolve it once so URL
+        # building and per-request signing do plain attribute reads
+        netloc, self._currency = self._API_KINDS[self._api_kind]
+        self._is_main = self._network == 'main'
+        self._header_auth = self._api_kind in self._HEADER_AUTH_API_KINDS
+        # Etherscan V2 API Migration: All V2 APIs (header auth) use etherscan.io domain
+        # Reference: https://docs.etherscan.io/v2-migration
+        self._base_netloc = 'etherscan.io' if self._header_auth else netloc
+        self._chain_id = self._CHAIN_ID_MAP.get((self._api_kind, self._network))
+
         self.API_URL = self._get_api_url()
         self.BASE_URL = self._get_base_url()
 
@@ -91,23 +104,9 @@ class UrlBuilder:
         else:
             self._api_kind = api_kind
 
-    @property
-    def _is_main(self) -> bool:
-        return self._network == 'main'
-
-    @property
-    def _base_netloc(self) -> str:
-        # Etherscan V2 API Migration: All V2 APIs (header auth) use etherscan.io domain
-        # Reference: https://docs.etherscan.io/v2-migration
-        if self._api_kind in self._HEADER_AUTH_API_KINDS:
-            return 'etherscan.io'
-        netloc, _ = self._API_KINDS[self._api_kind]
-        return netloc
-
     @property
     def currency(self) -> str:
-        _, currency = self._API_KINDS[self._api_kind]
-        return currency
+        return self._currency
 
     def get_link(self, path: str) -> str:
         return urljoin(self.BASE_URL, path)
@@ -140,7 +139,7 @@ class UrlBuilder:
 
         # Etherscan V2 header-auth APIs use unified domain api.etherscan.io
         # and fixed 'api' prefix regardless of network, with path 'v2/api'.
-        if self._api_kind in self._HEADER_AUTH_API_KINDS:
+        if self._header_auth:
             prefix = 'api'  # force unified api prefix
             path = 'v2/api'
 
@@ -148,11 +147,10 @@ class UrlBuilder:
 
     def _get_base_url(self) -> str:
         # Etherscan V2 API uses unified domain etherscan.io for all networks
-        if self._api_kind in self._HEADER_AUTH_API_KINDS:
+        if self._header_auth:
             return 'https://etherscan.io'
 
-        network_exceptions = {('polygon', 'testnet'): 'mumbai'}
-        network = network_exceptions.get((self._api_kind, self._network), self._network)
+        network = self._NETWORK_EXCEPTIONS.get((self._api_kind, self._network), self._network)
 
         prefix_exceptions = {
             ('optimism', True): 'optimistic',
@@ -167,26 +165,30 @@ class UrlBuilder:
         return self._build_url(prefix)
 
     def filter_and_sign(
-        self, params: dict[str, Any] | None, headers: dict[str, Any] | None
+        self, params: Mapping[str, Any] | None, headers: Mapping[str, Any] | None
     ) -> tuple[dict[str, Any], dict[str, Any]]:
-        filtered_params = self._filter_params(dict(params or {}))
-        filtered_headers = self._filter_headers(dict(headers or {}))
+        # The filters build fresh dicts, so the caller's mappings are never mutated
+        filtered_params = self._filter_params(params) if params else {}
+        filtered_headers = self._filter_headers(headers) if headers else {}
 
         params_with_chain = self._apply_chain_id(filtered_params)
         signed_params, signed_headers = self._apply_auth(params_with_chain, filtered_headers)
         return signed_params, signed_headers
 
     @staticmethod
-    def _filter_params(params: dict[str, Any]) -> dict[str, Any]:
+    def _filter_params(params: Mapping[str, Any]) -> dict[str, Any]:
+        # Most callers pass no None values; a plain copy is cheaper than filtering
+        if None not in params.values():
+            return dict(params)
         return {k: v for k, v in params.items() if v is not None}
 
     @staticmethod
-    def _filter_headers(headers: dict[str, Any]) -> dict[str, str]:
+    def _filter_headers(headers: Mapping[str, Any]) -> dict[str, str]:
         return {str(k): str(v) for k, v in headers.items() if v is not None}
 
     def _apply_chain_id(self, params: dict[str, Any]) -> dict[str, Any]:
-        if (self._api_kind, self._network) in self._CHAIN_ID_MAP:
-            params.setdefault('chainid', self._CHAIN_ID_MAP[(self._api_kind, self._network)])
+        if self._chain_id is not None:
+            params.setdefault('chainid', self._chain_id)
         return params
 
     def _apply_auth(
@@ -195,7 +197,7 @@ class UrlBuilder:
         if not self._API_KEY:
             return params, headers
 
-        if self._api_kind in self._HEADER_AUTH_API_KINDS or self._api_kind == 'moralis':
+        if self._header_auth or self._api_kind == 'moralis':
             headers.setdefault('X-API-Key', self._API_KEY)
         else:
             params.setdefault('apikey', self._API_KEY)
@@ -204,6 +206,6 @@ class UrlBuilder:
 
     # Legacy compatibility shim for code that still calls the old private helper.
     def _sign(
-        self, params: dict[str, Any] | None, headers: dict[str, Any] | None
+        self, params: Mapping[str, Any] | None, headers: Mapping[str, Any] | None
     ) -> tuple[dict[str, Any], dict[str, Any]]:
         return self.filter_and_sign(params, headers)
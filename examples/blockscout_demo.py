@@ -8,13 +8,56 @@ BlockScout provides Etherscan-compatible API without requiring API keys.
 """
 
 import asyncio
+import time
+from typing import Any
+
+import aiohttp
 
 from aiochainscan.core.client import ChainscanClient
 from aiochainscan.core.method import Method
 
 
-async def test_blockscout_network(network_name: str, api_kind: str, test_address: str):
-    """Test a specific BlockScout network."""
+class CachedCalls:
+    """Short-lived memo for identical ``client.call`` requests across the demo phases.
+
+    Entries are keyed by (api_kind, network, method, params) and hold the request task,
+    so concurrent duplicates share one HTTP call and later ones within ``ttl_seconds``
+    are answered from memory. Failed calls are not cached.
+    """
+
+    def __init__(self, *, ttl_seconds: float = 30.0) -> None:
+        self._ttl = ttl_seconds
+        self._entries: dict[tuple[Any, ...], tuple[float, asyncio.Task[Any]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def call(self, client: ChainscanClient, method: Method, **params: Any) -> Any:
+        key = (client.api_kind, client.network, method, tuple(sorted(params.items())))
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            self.hits += 1
+            return await entry[1]
+
+        self.misses += 1
+        task = asyncio.ensure_future(client.call(method, **params))
+        self._entries[key] = (time.monotonic() + self._ttl, task)
+        task.add_done_callback(lambda t: self._forget_failed(key, t))
+        return await task
+
+    def _forget_failed(self, key: tuple[Any, ...], task: asyncio.Task[Any]) -> None:
+        if task.cancelled() or task.exception() is not None:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] is task:
+                del self._entries[key]
+
+
+CALL_CACHE = CachedCalls(ttl_seconds=30.0)
+
+
+async def test_blockscout_network(
+    network_name: str, api_kind: str, test_address: str, session: aiohttp.ClientSession
+):
+    """Test a specific BlockScout network over the shared aiohttp session."""
 
     print(f'\n📍 Testing {network_name}:')
 
@@ -26,6 +69,7 @@ async def test_blockscout_network(network_name: str, api_kind: str, test_address
             api_kind=api_kind,
             network=network_name.lower(),
             api_key='',  # BlockScout works without API key
+            session=session,
         )
 
         print(f'   ✅ Client: {client}')
@@ -38,7 +82,7 @@ async def test_blockscout_network(network_name: str, api_kind: str, test_address
         print(f'   📡 Testing ACCOUNT_BALANCE for {test_address[:12]}...')
 
         # Test account balance
-        balance = await client.call(Method.ACCOUNT_BALANCE, address=test_address)
+        balance = await CALL_CACHE.call(client, Method.ACCOUNT_BALANCE, address=test_address)
 
         # Proper error checking!
         if balance is None:
@@ -56,7 +100,6 @@ async def test_blockscout_network(network_name: str, api_kind: str, test_address
             print(f'   ⚠️  Unexpected response: {type(balance)} = {balance}')
             result = False
 
-        await client.close()
         return result
 
     except Exception as e:
@@ -64,7 +107,7 @@ async def test_blockscout_network(network_name: str, api_kind: str, test_address
         return False
 
 
-async def test_blockscout_ethereum_mainnet():
+async def test_blockscout_ethereum_mainnet(session: aiohttp.ClientSession):
     """Test BlockScout with Ethereum mainnet using Vitalik's address."""
 
     print("\n🔥 Testing Ethereum Mainnet with Vitalik Buterin's Address")
@@ -88,14 +131,18 @@ async def test_blockscout_ethereum_mainnet():
 
         # Test if 'eth' or 'main' network exists
         if 'eth' in BlockScoutV1.supported_networks:
-            result = await test_blockscout_network('eth', 'blockscout_eth', vitalik_address)
+            result = await test_blockscout_network(
+                'eth', 'blockscout_eth', vitalik_address, session
+            )
         elif 'main' in BlockScoutV1.supported_networks:
-            result = await test_blockscout_network('main', 'blockscout_main', vitalik_address)
+            result = await test_blockscout_network(
+                'main', 'blockscout_main', vitalik_address, session
+            )
         else:
             print("\n❌ BlockScout doesn't support Ethereum mainnet directly")
             print('🔍 Testing Sepolia testnet instead...')
             result = await test_blockscout_network(
-                'sepolia', 'blockscout_sepolia', vitalik_address
+                'sepolia', 'blockscout_sepolia', vitalik_address, session
             )
 
         return result
@@ -105,7 +152,7 @@ async def test_blockscout_ethereum_mainnet():
         return False
 
 
-async def test_blockscout_comprehensive():
+async def test_blockscout_comprehensive(session: aiohttp.ClientSession):
     """Comprehensive test of BlockScout functionality."""
 
     print('\n🧪 Comprehensive BlockScout Testing')
@@ -121,16 +168,21 @@ async def test_blockscout_comprehensive():
         ('polygon', 'blockscout_polygon'),
     ]
 
-    results = []
+    # Probe networks concurrently (capped like max_concurrent=5 elsewhere); wall time is
+    # the slowest instance rather than the sum of all of them
+    semaphore = asyncio.Semaphore(5)
 
-    for network, api_kind in networks_to_test:
-        result = await test_blockscout_network(network, api_kind, vitalik_address)
-        results.append((network, result))
+    async def probe(network: str, api_kind: str) -> bool:
+        async with semaphore:
+            return await test_blockscout_network(network, api_kind, vitalik_address, session)
 
-    return results
+    outcomes = await asyncio.gather(*(probe(n, k) for n, k in networks_to_test))
+    return [
+        (network, result) for (network, _), result in zip(networks_to_test, outcomes, strict=True)
+    ]
 
 
-async def test_blockscout_methods():
+async def test_blockscout_methods(session: aiohttp.ClientSession):
     """Test different BlockScout methods."""
 
     print('\n🔧 Testing BlockScout Methods')
@@ -146,6 +198,7 @@ async def test_blockscout_methods():
             api_kind='blockscout_sepolia',
             network='sepolia',
             api_key='',
+            session=session,
         )
 
         print(f'🧪 Testing on Sepolia with {vitalik_address[:12]}...')
@@ -157,44 +210,45 @@ async def test_blockscout_methods():
             Method.ACCOUNT_ERC20_TRANSFERS,
         ]
 
+        paged_methods = {
+            Method.ACCOUNT_TRANSACTIONS,
+            Method.ACCOUNT_INTERNAL_TXS,
+            Method.ACCOUNT_ERC20_TRANSFERS,
+        }
+
+        def call_method(method: Method):
+            if method in paged_methods:
+                return CALL_CACHE.call(client, method, address=vitalik_address, page=1, offset=5)
+            return CALL_CACHE.call(client, method, address=vitalik_address)
+
+        # The calls are independent and share one connection pool, so issue them together
+        print(f'\n📡 Testing {len(methods_to_test)} methods concurrently...')
+        responses = await asyncio.gather(
+            *(call_method(method) for method in methods_to_test), return_exceptions=True
+        )
+
         results = {}
 
-        for method in methods_to_test:
-            try:
-                print(f'\n📡 Testing {method}...')
-
-                if method == Method.ACCOUNT_BALANCE:
-                    response = await client.call(method, address=vitalik_address)
-                elif method in [
-                    Method.ACCOUNT_TRANSACTIONS,
-                    Method.ACCOUNT_INTERNAL_TXS,
-                    Method.ACCOUNT_ERC20_TRANSFERS,
-                ]:
-                    response = await client.call(method, address=vitalik_address, page=1, offset=5)
-                else:
-                    response = await client.call(method, address=vitalik_address)
-
-                if response is None:
-                    print('   ❌ Got None response')
-                    results[method] = False
-                elif isinstance(response, dict) and 'error' in response:
-                    print(f'   ❌ Error: {response["error"]}')
-                    results[method] = False
-                elif isinstance(response, list):
-                    print(f'   ✅ Got list with {len(response)} items')
-                    results[method] = True
-                elif isinstance(response, str | int):
-                    print(f'   ✅ Got value: {response}')
-                    results[method] = True
-                else:
-                    print(f'   ⚠️  Unexpected: {type(response)}')
-                    results[method] = False
-
-            except Exception as e:
-                print(f'   ❌ Exception: {e}')
+        for method, response in zip(methods_to_test, responses, strict=True):
+            print(f'\n📡 {method}:')
+            if isinstance(response, Exception):
+                print(f'   ❌ Exception: {response}')
+                results[method] = False
+            elif response is None:
+                print('   ❌ Got None response')
+                results[method] = False
+            elif isinstance(response, dict) and 'error' in response:
+                print(f'   ❌ Error: {response["error"]}')
+                results[method] = False
+            elif isinstance(response, list):
+                print(f'   ✅ Got list with {len(response)} items')
+                results[method] = True
+            elif isinstance(response, str | int):
+                print(f'   ✅ Got value: {response}')
+                results[method] = True
+            else:
+                print(f'   ⚠️  Unexpected: {type(response)}')
                 results[method] = False
-
-        await client.close()
 
         # Summary
         successful = sum(results.values())
@@ -250,18 +304,23 @@ async def main():
     # Run tests
     print('\n' + '=' * 60)
 
-    # Test 1: Ethereum mainnet (or best available)
-    mainnet_result = await test_blockscout_ethereum_mainnet()
-
-    # Test 2: Comprehensive network testing
-    network_results = await test_blockscout_comprehensive()
-
-    # Test 3: Method testing
-    method_results = await test_blockscout_methods()
+    # One pooled session for every probe: each network costs a request, not a new handshake
+    session = aiohttp.ClientSession()
+    try:
+        # The three phases are independent, so they run side by side:
+        # Ethereum mainnet (or best available), per-network probes and per-method probes
+        mainnet_result, network_results, method_results = await asyncio.gather(
+            test_blockscout_ethereum_mainnet(session),
+            test_blockscout_comprehensive(session),
+            test_blockscout_methods(session),
+        )
+    finally:
+        await session.close()
 
     # Final summary
     print('\n' + '=' * 60)
     print('📊 FIXED BlockScout Demo Results:')
+    print(f'\n🗄️  Call cache: {CALL_CACHE.hits} hits, {CALL_CACHE.misses} misses')
 
     print(f'\n🔥 Ethereum Test: {"✅ PASSED" if mainnet_result else "❌ FAILED"}')
 
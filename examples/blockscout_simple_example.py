@@ -1,12 +1,15 @@
 #!/usr/bin/env python3
 """
 Blockscout fetch-all example (technical, minimal output)
+
+Large pages are JSON-heavy: with the ``fast`` extra installed, AiohttpClient
+parses them with orjson automatically, no extra wiring needed here.
 """
 
 import asyncio
 import sys
 import time
-from contextlib import suppress
+from decimal import Decimal
 from pathlib import Path
 
 # Allow running directly from the repo without installation
@@ -32,8 +35,9 @@ async def fetch_all_transactions_optimized_demo(*, address: str) -> list[dict]:
     # api_key = ''
 
     # DI: default adapters
-    # Use aggressive but bounded timeout to prevent long hangs
-    http = AiohttpClient()
+    # Size the socket pool to the intended parallelism (max_concurrent=5 plus headroom)
+    # instead of aiohttp's default 100 sockets
+    http = AiohttpClient(connection_limit=7, connection_limit_per_host=7)
     endpoint = UrlBuilderEndpoint()
     telemetry = StructlogTelemetry()
     # rate_limiter = SimpleRateLimiter(min_interval_seconds=0.0, burst=16)  # unthrottled for benchmark
@@ -191,69 +195,105 @@ async def fetch_all_transactions_optimized_demo(*, address: str) -> list[dict]:
         await http.aclose()
 
 
+def _safe_int(value):
+    """Parse a decimal or 0x-hex amount, returning 0 for malformed rows.
+
+    Decimal strings are validated up front, so the common path never raises.
+    """
+    if type(value) is int:  # noqa: E721
+        return value
+    if type(value) is not str:  # noqa: E721
+        return 0
+    text = value.strip()
+    if text[:2] in ('0x', '0X'):
+        try:
+            return int(text, 16)
+        except ValueError:
+            return 0
+    # Accept what int() accepts for decimals: surrounding whitespace and one sign
+    digits = text[1:] if text[:1] in ('-', '+') else text
+    return int(text) if digits.isdecimal() else 0
+
+
+class TransactionSummary:
+    """Running totals over transaction batches.
+
+    Only the aggregates plus the first/last transaction are kept, so a caller that
+    receives pages incrementally can summarize them without holding the full history.
+    """
+
+    def __init__(self):
+        self.total_txs = 0
+        self.total_value = 0
+        self.total_gas = 0
+        self.unique_from = set()
+        self.unique_to = set()
+        self.simple_transfers = 0
+        self.contract_calls = 0
+        self.first_tx = None
+        self.last_tx = None
+
+    def add_batch(self, batch):
+        if not batch:
+            return
+        # Column-wise passes: each aggregate is one C-level sum/set build instead of a
+        # chain of per-transaction branches. (NumPy object arrays would still box every
+        # int, so plain builtins are used and the example stays dependency-free.)
+        self.total_txs += len(batch)
+        self.total_value += sum(_safe_int(tx['value']) for tx in batch if 'value' in tx)
+        self.total_gas += sum(_safe_int(tx['gasUsed']) for tx in batch if 'gasUsed' in tx)
+        self.unique_from.update(tx['from'] for tx in batch if 'from' in tx)
+        self.unique_to.update(tx['to'] for tx in batch if 'to' in tx)
+        inputs = [tx['input'] for tx in batch if 'input' in tx]
+        simple = sum(1 for data in inputs if data in ('0x', ''))
+        self.simple_transfers += simple
+        self.contract_calls += len(inputs) - simple
+        if self.first_tx is None:
+            self.first_tx = batch[0]
+        self.last_tx = batch[-1]
+
+    def report(self):
+        # Exact wei -> ETH scaling; float division loses precision on large totals
+        total_eth = Decimal(self.total_value).scaleb(-18)
+
+        print('\nResult summary')
+        print(f'total_txs={self.total_txs}')
+        print(f'total_value_eth={total_eth:.6f}')
+        print(f'total_gas={self.total_gas}')
+        print(f'unique_from={len(self.unique_from)}')
+        print(f'unique_to={len(self.unique_to)}')
+        print(f'simple_transfers={self.simple_transfers}')
+        print(f'contract_calls={self.contract_calls}')
+
+        # Первая/последняя транзакции
+        if self.first_tx is not None:
+            _print_tx('first_tx', self.first_tx)
+            if self.total_txs > 1:
+                _print_tx('last_tx', self.last_tx)
+
+
+def _print_tx(label, tx):
+    value_eth = _safe_int(tx.get('value')) / 10**18
+    print(f'{label}:')
+    print(f'  hash={tx.get("hash", "N/A")}')
+    print(f'  block={tx.get("blockNumber", "N/A")}')
+    print(f'  value_eth={value_eth:.6f}')
+
+
 async def analyze_all_transactions(transactions):
-    """Minimal technical summary over fetched transactions."""
-    if not transactions:
-        return
-
-    total_value = 0
-    total_gas = 0
-    unique_from = set()
-    unique_to = set()
-    contract_calls = 0
-    simple_transfers = 0
-
-    for tx in transactions:
-        # Values
-        if 'value' in tx:
-            with suppress(ValueError, TypeError):
-                total_value += int(tx['value'])
-
-        # Gas
-        if 'gasUsed' in tx:
-            with suppress(ValueError, TypeError):
-                total_gas += int(tx['gasUsed'])
-
-        # Unique addresses
-        if 'from' in tx:
-            unique_from.add(tx['from'])
-        if 'to' in tx:
-            unique_to.add(tx['to'])
-
-        # Transaction type
-        if 'input' in tx:
-            if tx['input'] == '0x' or tx['input'] == '':
-                simple_transfers += 1
-            else:
-                contract_calls += 1
-
-    total_eth = total_value / 10**18
-
-    print('\nResult summary')
-    print(f'total_txs={len(transactions)}')
-    print(f'total_value_eth={total_eth:.6f}')
-    print(f'total_gas={total_gas}')
-    print(f'unique_from={len(unique_from)}')
-    print(f'unique_to={len(unique_to)}')
-    print(f'simple_transfers={simple_transfers}')
-    print(f'contract_calls={contract_calls}')
-
-    # Первая/последняя транзакции
-    if len(transactions) > 0:
-        first_tx = transactions[0]
-        value_eth = int(first_tx.get('value', 0)) / 10**18
-        print('first_tx:')
-        print(f'  hash={first_tx.get("hash", "N/A")}')
-        print(f'  block={first_tx.get("blockNumber", "N/A")}')
-        print(f'  value_eth={value_eth:.6f}')
-
-        if len(transactions) > 1:
-            last_tx = transactions[-1]
-            value_eth = int(last_tx.get('value', 0)) / 10**18
-            print('last_tx:')
-            print(f'  hash={last_tx.get("hash", "N/A")}')
-            print(f'  block={last_tx.get("blockNumber", "N/A")}')
-            print(f'  value_eth={value_eth:.6f}')
+    """Minimal technical summary over fetched transactions.
+
+    Accepts a list, or an async iterable of batches (pages) that is aggregated as it
+    arrives instead of being buffered first.
+    """
+    summary = TransactionSummary()
+    if hasattr(transactions, '__aiter__'):
+        async for batch in transactions:
+            summary.add_batch(batch)
+    else:
+        summary.add_batch(transactions)
+    if summary.total_txs:
+        summary.report()
 
 
 async def main():
@@ -0,0 +1,72 @@
+import pytest
+
+BIG = 123456789012345678901234567890
+
+
+class _FakeResponse:
+    def __init__(self, body: bytes) -> None:
+        self.headers = {'Content-Type': 'application/json'}
+        self._body = body
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def json(self) -> object:
+        import json
+
+        return json.loads(self._body)
+
+
+@pytest.mark.asyncio
+async def test_maybe_json_keeps_big_integers_exact():
+    from aiochainscan.adapters.aiohttp_client import AiohttpClient
+
+    body = b'{"a": %d, "b": [1, %d], "c": "%d"}' % (BIG, -BIG, BIG)
+    data = await AiohttpClient._maybe_json(_FakeResponse(body))  # type: ignore[arg-type]
+
+    assert data == {'a': BIG, 'b': [1, -BIG], 'c': str(BIG)}
+    assert isinstance(data['a'], int)
+
+
+@pytest.mark.asyncio
+async def test_graphql_execute_keeps_big_integers_exact():
+    from aiochainscan.adapters.aiohttp_graphql_client import AiohttpGraphQLClient
+
+    body = '{"data": {"transaction": {"value": %d}}}' % BIG
+
+    class _Resp:
+        async def __aenter__(self) -> '_Resp':
+            return self
+
+        async def __aexit__(self, *exc: object) -> None:
+            return None
+
+        def raise_for_status(self) -> None:
+            return None
+
+        async def json(self, *, loads):  # type: ignore[no-untyped-def]
+            return loads(body)
+
+    class _Session:
+        def post(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+            return _Resp()
+
+    client = AiohttpGraphQLClient()
+    client._session = _Session()  # type: ignore[assignment]
+    data = await client.execute('https://example.test/graphql', 'query { x }')
+
+    assert data == {'transaction': {'value': BIG}}
+    assert isinstance(data['transaction']['value'], int)
+
+
+def test_json_dumps_falls_back_for_payloads_orjson_rejects():
+    import json
+
+    from aiochainscan.adapters._json import json_dumps
+
+    payload = {'variables': {'value': 2**80}, 'by_id': {1: 'a'}}
+    assert json.loads(json_dumps(payload)) == {
+        'variables': {'value': 2**80},
+        'by_id': {'1': 'a'},
+    }
+    assert json.loads(json_dumps({'a': [1, 'b']})) == {'a': [1, 'b']}
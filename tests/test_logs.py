@@ -257,3 +257,527 @@ async def test_get_token_transfers_page_typed_graphql(monkeypatch):
     assert isinstance(page, Page)
     assert page.next_cursor == 'tok_cursor'
     assert len(page.items) == 1
+
+
+class _PagedLogsHttp:
+    """Minimal HttpClient stub serving `total` logs split by page/offset."""
+
+    def __init__(self, total: int) -> None:
+        self.total = total
+        self.pages: list[int] = []
+
+    async def get(self, url, params=None, headers=None):  # noqa: ARG002
+        page, offset = int(params['page']), int(params['offset'])
+        self.pages.append(page)
+        start = (page - 1) * offset
+        stop = min(self.total, start + offset)
+        return {
+            'status': '1',
+            'result': [
+                {'transactionHash': f'0x{i:x}', 'logIndex': '0x0', 'blockNumber': hex(i)}
+                for i in range(start, stop)
+            ],
+        }
+
+    async def aclose(self) -> None:
+        return None
+
+
+@pytest.mark.asyncio
+async def test_get_all_logs_optimized_paged_windows():
+    from aiochainscan.adapters.endpoint_builder_urlbuilder import UrlBuilderEndpoint
+    from aiochainscan.services.logs import get_all_logs_optimized
+
+    http = _PagedLogsHttp(total=25)
+    stats: dict[str, int] = {}
+    items = await get_all_logs_optimized(
+        address='0xabc',
+        start_block=0,
+        end_block=100,
+        max_concurrent=3,
+        max_offset=10,
+        api_kind='blockscout_sepolia',
+        network='sepolia',
+        api_key='',
+        http=http,
+        _endpoint_builder=UrlBuilderEndpoint(),
+        stats=stats,
+    )
+
+    assert [it['blockNumber'] for it in items] == [hex(i) for i in range(25)]
+    # One window of three concurrent pages covers the range; page 3 is short
+    assert sorted(http.pages) == [1, 2, 3]
+    assert stats['pages_processed'] == 3
+
+
+class _ShortThenFailingLogsHttp(_PagedLogsHttp):
+    """Serves a short first page; any later page fails like an out-of-range window."""
+
+    async def get(self, url, params=None, headers=None):  # noqa: ARG002
+        if int(params['page']) > 1:
+            self.pages.append(int(params['page']))
+            raise RuntimeError('Result window is too large')
+        return await super().get(url, params=params, headers=headers)
+
+
+@pytest.mark.asyncio
+async def test_get_all_logs_optimized_ignores_failures_past_short_page():
+    from aiochainscan.adapters.endpoint_builder_urlbuilder import UrlBuilderEndpoint
+    from aiochainscan.services.logs import get_all_logs_optimized
+
+    http = _ShortThenFailingLogsHttp(total=4)
+    stats: dict[str, int] = {}
+    items = await get_all_logs_optimized(
+        address='0xabc',
+        start_block=0,
+        end_block=100,
+        max_concurrent=5,
+        max_offset=10,
+        api_kind='blockscout_sepolia',
+        network='sepolia',
+        api_key='',
+        http=http,
+        _endpoint_builder=UrlBuilderEndpoint(),
+        stats=stats,
+    )
+
+    # Page 1 is short and ends the scan; speculative page errors are dropped
+    assert [it['blockNumber'] for it in items] == [hex(i) for i in range(4)]
+    assert stats['pages_processed'] == 1
+
+
+@pytest.mark.asyncio
+async def test_race_candidates_staggers_and_skips_failures():
+    import asyncio
+
+    from aiochainscan.services._executor import race_candidates
+
+    started: list[str] = []
+    failed: list[str] = []
+
+    async def attempt(url: str) -> str:
+        started.append(url)
+        if url == 'broken':
+            raise RuntimeError('404')
+        if url == 'stalled':
+            await asyncio.sleep(10)
+        return f'data:{url}'
+
+    won, data = await race_candidates(
+        ['broken', 'stalled', 'ok', 'unused'],
+        attempt,
+        stagger_seconds=0.01,
+        on_failure=lambda url, exc: failed.append(url),  # noqa: ARG005
+    )
+
+    assert (won, data) == ('ok', 'data:ok')
+    assert failed == ['broken']
+    assert 'unused' not in started
+
+    # A fast first candidate costs exactly one attempt
+    started.clear()
+    assert await race_candidates(['ok', 'other'], attempt, stagger_seconds=1.0) == (
+        'ok',
+        'data:ok',
+    )
+    assert started == ['ok']
+
+
+@pytest.mark.asyncio
+async def test_race_candidates_retrieves_failures_finishing_with_winner():
+    import asyncio
+    import gc
+
+    from aiochainscan.services._executor import race_candidates
+
+    release = asyncio.Event()
+
+    async def attempt(url: str) -> str:
+        await release.wait()
+        if url == 'bad':
+            raise RuntimeError('502')
+        return f'data:{url}'
+
+    unretrieved: list[dict] = []
+    loop = asyncio.get_running_loop()
+    loop.set_exception_handler(lambda _loop, context: unretrieved.append(context))
+    try:
+        race = asyncio.ensure_future(
+            race_candidates(['ok', 'bad'], attempt, stagger_seconds=0.001)
+        )
+        await asyncio.sleep(0.01)  # both attempts are now in flight
+        release.set()
+        # Both finish in the same wakeup; the earlier-launched winner returns first
+        assert await race == ('ok', 'data:ok')
+        del race
+        gc.collect()
+        await asyncio.sleep(0)
+    finally:
+        loop.set_exception_handler(None)
+    assert unretrieved == []
+
+
+def test_open_endpoint_memoizes_sessions_per_builder():
+    from aiochainscan.adapters.endpoint_builder_urlbuilder import UrlBuilderEndpoint
+    from aiochainscan.services._executor import open_endpoint
+
+    builder = UrlBuilderEndpoint()
+    first = open_endpoint(builder, api_key='k', api_kind='eth', network='main')
+    assert open_endpoint(builder, api_key='k', api_kind='eth', network='main') is first
+    assert open_endpoint(builder, api_key='other', api_kind='eth', network='main') is not first
+    assert (
+        open_endpoint(UrlBuilderEndpoint(), api_key='k', api_kind='eth', network='main')
+        is not first
+    )
+
+
+class _BlockRangeLogsHttp:
+    """HttpClient stub serving one log per block, honouring fromBlock/toBlock/offset."""
+
+    def __init__(self, last_block: int) -> None:
+        self.last_block = last_block
+        self.ranges: list[tuple[int, int]] = []
+
+    async def get(self, url, params=None, headers=None):  # noqa: ARG002
+        lo, hi, offset = int(params['fromBlock']), int(params['toBlock']), int(params['offset'])
+        self.ranges.append((lo, hi))
+        blocks = range(lo, min(hi, self.last_block) + 1)
+        return {
+            'status': '1',
+            'result': [
+                {'transactionHash': f'0x{b:x}', 'logIndex': '0x0', 'blockNumber': hex(b)}
+                for b in list(blocks)[:offset]
+            ],
+        }
+
+    async def aclose(self) -> None:
+        return None
+
+
+@pytest.mark.asyncio
+async def test_get_all_logs_optimized_dedups_normalized_keys():
+    from aiochainscan.adapters.endpoint_builder_urlbuilder import UrlBuilderEndpoint
+    from aiochainscan.services.logs import get_all_logs_optimized
+
+    class _Http:
+        async def get(self, url, params=None, headers=None):  # noqa: ARG002
+            # The same two logs as reported with differing index and hash spellings
+            return {
+                'status': '1',
+                'result': [
+                    {'transactionHash': '0xAB', 'logIndex': '1', 'blockNumber': '0x2'},
+                    {'transactionHash': '0xab', 'logIndex': 1, 'blockNumber': '2'},
+                    {'transactionHash': '0xab', 'logIndex': '0x1', 'blockNumber': '0x2'},
+                    {'transactionHash': '0xab', 'logIndex': '0', 'blockNumber': '0x2'},
+                ],
+            }
+
+    items = await get_all_logs_optimized(
+        address='0xabc',
+        start_block=0,
+        end_block=100,
+        max_concurrent=1,
+        max_offset=10,
+        api_kind='blockscout_sepolia',
+        network='sepolia',
+        api_key='',
+        http=_Http(),
+        _endpoint_builder=UrlBuilderEndpoint(),
+    )
+
+    assert [it['logIndex'] for it in items] == ['0', '1']
+
+
+@pytest.mark.asyncio
+async def test_get_all_logs_optimized_eth_narrows_to_block():
+    from aiochainscan.adapters.endpoint_builder_urlbuilder import UrlBuilderEndpoint
+    from aiochainscan.services.logs import get_all_logs_optimized
+
+    http = _BlockRangeLogsHttp(last_block=44)
+    items = await get_all_logs_optimized(
+        address='0xabc',
+        start_block=0,
+        end_block=100,
+        max_concurrent=1,
+        max_offset=10,
+        api_kind='eth',
+        network='main',
+        api_key='',
+        http=http,
+        _endpoint_builder=UrlBuilderEndpoint(),
+    )
+
+    assert [it['blockNumber'] for it in items] == [hex(b) for b in range(45)]
+    # The first request scans the full range; later ones are capped near the observed density
+    assert http.ranges[0] == (0, 100)
+    assert http.ranges[1:-1] == [(10, 19), (20, 29), (30, 39), (40, 49)]
+    assert http.ranges[-1][1] == 100
+
+
+@pytest.mark.asyncio
+async def test_record_event_background_does_not_block_caller():
+    import asyncio
+
+    from aiochainscan.services import _executor
+
+    release = asyncio.Event()
+    recorded: list[str] = []
+
+    class _SlowTelemetry:
+        async def record_event(self, name, attributes=None):  # noqa: ARG002
+            await release.wait()
+            if name == 'broken':
+                raise RuntimeError('backend down')
+            recorded.append(name)
+
+        async def record_error(self, name, error, attributes=None):  # noqa: ARG002
+            return None
+
+    telemetry = _SlowTelemetry()
+    _executor.record_event_background(telemetry, 'logs.get_logs.ok', {'items': 1})
+    _executor.record_event_background(telemetry, 'broken')
+    assert recorded == []
+    assert len(_executor._BACKGROUND_TASKS) == 2
+
+    release.set()
+    for _ in range(3):
+        await asyncio.sleep(0)
+    assert recorded == ['logs.get_logs.ok']
+    assert not _executor._BACKGROUND_TASKS
+
+
+@pytest.mark.asyncio
+async def test_get_logs_coalesces_concurrent_identical_requests():
+    import asyncio
+
+    from aiochainscan.adapters.endpoint_builder_urlbuilder import UrlBuilderEndpoint
+    from aiochainscan.services.logs import _INFLIGHT, get_logs
+
+    class _SlowHttp:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        async def get(self, url, params=None, headers=None):  # noqa: ARG002
+            self.calls += 1
+            await asyncio.sleep(0.01)
+            return {'result': [{'transactionHash': '0x1', 'logIndex': '0x0'}]}
+
+        async def post(self, url, data=None, json=None, headers=None):  # noqa: ARG002
+            raise NotImplementedError
+
+        async def aclose(self) -> None:
+            return None
+
+    http = _SlowHttp()
+    kwargs = {
+        'start_block': 1,
+        'end_block': 2,
+        'address': '0xabc',
+        'api_kind': 'eth',
+        'network': 'main',
+        'api_key': 'k',
+        'http': http,
+        '_endpoint_builder': UrlBuilderEndpoint(),
+    }
+    first, second = await asyncio.gather(get_logs(**kwargs), get_logs(**kwargs))
+
+    assert http.calls == 1
+    assert first == second == [{'transactionHash': '0x1', 'logIndex': '0x0'}]
+    assert not _INFLIGHT
+
+    await get_logs(**kwargs)
+    assert http.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_get_logs_does_not_coalesce_across_clients():
+    import asyncio
+
+    from aiochainscan.adapters.endpoint_builder_urlbuilder import UrlBuilderEndpoint
+    from aiochainscan.adapters.memory_cache import InMemoryCache
+    from aiochainscan.services.logs import get_logs
+
+    class _SlowHttp:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        async def get(self, url, params=None, headers=None):  # noqa: ARG002
+            self.calls += 1
+            await asyncio.sleep(0.01)
+            return {'result': [{'transactionHash': '0x1', 'logIndex': '0x0'}]}
+
+        async def aclose(self) -> None:
+            return None
+
+    http_a, http_b = _SlowHttp(), _SlowHttp()
+    cache_a, cache_b = InMemoryCache(), InMemoryCache()
+    kwargs = {
+        'start_block': 1,
+        'end_block': 2,
+        'address': '0xabc',
+        'api_kind': 'eth',
+        'network': 'main',
+        'api_key': 'k',
+        '_endpoint_builder': UrlBuilderEndpoint(),
+    }
+    await asyncio.gather(
+        get_logs(http=http_a, _cache=cache_a, **kwargs),
+        get_logs(http=http_b, _cache=cache_b, **kwargs),
+    )
+
+    # Each client runs its own request and fills its own cache
+    assert (http_a.calls, http_b.calls) == (1, 1)
+    assert cache_a._store and cache_b._store
+
+
+@pytest.mark.asyncio
+async def test_get_logs_serves_stale_entry_and_refreshes_in_background():
+    import asyncio
+
+    from aiochainscan.adapters.endpoint_builder_urlbuilder import UrlBuilderEndpoint
+    from aiochainscan.adapters.memory_cache import InMemoryCache
+    from aiochainscan.services import logs as logs_service
+
+    class _CountingHttp:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        async def get(self, url, params=None, headers=None):  # noqa: ARG002
+            self.calls += 1
+            return {'result': [{'transactionHash': f'0x{self.calls}', 'logIndex': '0x0'}]}
+
+        async def post(self, url, data=None, json=None, headers=None):  # noqa: ARG002
+            raise NotImplementedError
+
+        async def aclose(self) -> None:
+            return None
+
+    http = _CountingHttp()
+    cache = InMemoryCache()
+    kwargs = {
+        'start_block': 1,
+        'end_block': 2,
+        'address': '0xabc',
+        'api_kind': 'eth',
+        'network': 'main',
+        'api_key': 'k',
+        'http': http,
+        '_endpoint_builder': UrlBuilderEndpoint(),
+        '_cache': cache,
+    }
+
+    first = await logs_service.get_logs(**kwargs)
+    assert first[0]['transactionHash'] == '0x1'
+    assert await logs_service.get_logs(**kwargs) == first  # fresh hit
+    assert http.calls == 1
+
+    # Age the entry past the fresh TTL: the stale value is returned immediately
+    cache_key = next(iter(cache._store))
+    entry, expires_at = cache._store[cache_key]
+    entry['stored_at'] -= logs_service.CACHE_TTL_SECONDS + 1
+    cache._store[cache_key] = (entry, expires_at)
+
+    assert await logs_service.get_logs(**kwargs) == first
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert http.calls == 2
+
+    refreshed = await logs_service.get_logs(**kwargs)
+    assert refreshed[0]['transactionHash'] == '0x2'
+    assert http.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_get_logs_cache_key_accepts_none_topic_slots():
+    from aiochainscan.adapters.endpoint_builder_urlbuilder import UrlBuilderEndpoint
+    from aiochainscan.services import logs as logs_service
+
+    class _Http:
+        def __init__(self) -> None:
+            self.params: list[dict[str, object]] = []
+
+        async def get(self, url, params=None, headers=None):  # noqa: ARG002
+            self.params.append(dict(params))
+            return {'result': []}
+
+        async def aclose(self) -> None:
+            return None
+
+    http = _Http()
+    result = await logs_service.get_logs(
+        start_block=1,
+        end_block=2,
+        address='0xabc',
+        api_kind='eth',
+        network='main',
+        api_key='k',
+        http=http,
+        _endpoint_builder=UrlBuilderEndpoint(),
+        topics=[None, '0xabc'],  # type: ignore[list-item]
+    )
+
+    assert result == []
+    assert http.params[0]['topic1'] == '0xabc'
+    assert 'topic0' not in http.params[0]
+
+    key_args = {
+        'api_kind': 'eth',
+        'network': 'main',
+        'address': '0xabc',
+        'start_block': 1,
+        'end_block': 2,
+        'topic_operators': None,
+        'page': None,
+        'offset': None,
+    }
+    assert logs_service._logs_cache_key(topics=['a,b'], **key_args) != (
+        logs_service._logs_cache_key(topics=['a', 'b'], **key_args)
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_logs_caches_empty_finalized_ranges():
+    from aiochainscan.adapters.endpoint_builder_urlbuilder import UrlBuilderEndpoint
+    from aiochainscan.adapters.memory_cache import InMemoryCache
+    from aiochainscan.services import logs as logs_service
+
+    class _EmptyHttp:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        async def get(self, url, params=None, headers=None):  # noqa: ARG002
+            self.calls += 1
+            return {'result': []}
+
+        async def post(self, url, data=None, json=None, headers=None):  # noqa: ARG002
+            raise NotImplementedError
+
+        async def aclose(self) -> None:
+            return None
+
+    http = _EmptyHttp()
+    cache = InMemoryCache()
+    kwargs = {
+        'address': '0xabc',
+        'api_kind': 'eth',
+        'network': 'test-final',
+        'api_key': 'k',
+        'http': http,
+        '_endpoint_builder': UrlBuilderEndpoint(),
+        '_cache': cache,
+    }
+    logs_service._LATEST_BLOCKS[('eth', 'test-final')] = 1_000
+    try:
+        assert await logs_service.get_logs(start_block=1, end_block=100, **kwargs) == []
+        assert await logs_service.get_logs(start_block=900, end_block=990, **kwargs) == []
+    finally:
+        del logs_service._LATEST_BLOCKS[('eth', 'test-final')]
+
+    entries = {key: value for key, (value, _) in cache._store.items()}
+    finals = sorted(entry['final'] for entry in entries.values())
+    # Only the range safely behind the head is marked final
+    assert finals == [False, True]
+    assert http.calls == 2
+
+    await logs_service.get_logs(start_block=1, end_block=100, **kwargs)
+    assert http.calls == 2
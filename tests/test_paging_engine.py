@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+from aiochainscan.services.paging_engine import FetchSpec, ProviderPolicy, fetch_all_generic
+
+
+def _item(n: int) -> dict[str, str]:
+    return {'hash': f'0x{n}', 'blockNumber': str(n)}
+
+
+@pytest.mark.asyncio
+async def test_paged_mode_slides_window_past_slow_page():
+    launched: list[int] = []
+    page_two_release = asyncio.Event()
+
+    async def fetch_page(*, page: int, start_block: int, end_block: int, offset: int):  # noqa: ARG001
+        launched.append(page)
+        if page == 2:
+            await page_two_release.wait()
+        if page >= 4:
+            return [_item(40 + page)]  # short page ends the scan
+        return [_item(page * 10 + i) for i in range(offset)]
+
+    spec = FetchSpec(
+        name='test',
+        fetch_page=fetch_page,
+        key_fn=lambda it: it.get('hash'),
+        order_fn=lambda it: (int(it['blockNumber']), 0),
+        max_offset=2,
+    )
+    policy = ProviderPolicy(mode='paged', prefetch=2, window_cap=None, rps_key=None)
+    stats: dict[str, int] = {}
+
+    task = asyncio.ensure_future(
+        fetch_all_generic(
+            start_block=0,
+            end_block=100,
+            fetch_spec=spec,
+            policy=policy,
+            rate_limiter=None,
+            retry=None,
+            telemetry=None,
+            max_concurrent=2,
+            stats=stats,
+        )
+    )
+    for _ in range(5):
+        await asyncio.sleep(0)
+    # Page 1 finished, so page 3 started while page 2 is still pending
+    assert launched == [1, 2, 3]
+
+    page_two_release.set()
+    result = await task
+
+    assert [it['blockNumber'] for it in result] == ['10', '11', '20', '21', '30', '31', '44']
+    assert stats['pages_processed'] == 4
+
+
+@pytest.mark.asyncio
+async def test_gather_pages_cancels_siblings_on_failure():
+    from aiochainscan.services.paging_engine import _gather_pages
+
+    cancelled = asyncio.Event()
+
+    async def failing() -> list[dict[str, str]]:
+        raise RuntimeError('429')
+
+    async def slow() -> list[dict[str, str]]:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return []
+
+    with pytest.raises(RuntimeError, match='429'):
+        await _gather_pages([slow(), failing()])
+    await asyncio.sleep(0)
+    assert cancelled.is_set()
+
+
+def test_resolve_policy_clamps_blockscout_prefetch():
+    from aiochainscan.services.paging_engine import (
+        MAX_PAGED_PREFETCH,
+        resolve_policy_for_provider,
+    )
+
+    policy = resolve_policy_for_provider(
+        api_kind='blockscout_eth', network='main', max_concurrent=64
+    )
+    assert policy.prefetch == MAX_PAGED_PREFETCH
+    assert (
+        resolve_policy_for_provider(
+            api_kind='blockscout_eth', network='main', max_concurrent=3
+        ).prefetch
+        == 3
+    )
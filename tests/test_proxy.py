@@ -322,3 +322,252 @@ async def test_estimate_gas(proxy):
         await proxy.estimate_gas(to='0x123', value='val', gas_price='123', gas='456')
         hex_mock.assert_called_once_with('0x123')
         mock.assert_called_once()
+
+
+class _RecordingHttp:
+    def __init__(self, response):
+        self.response = response
+        self.calls: list[tuple[str, dict]] = []
+        self.closed = False
+
+    async def get(self, url, params=None, headers=None):  # noqa: ARG002
+        self.calls.append(('get', dict(params or {})))
+        return self.response
+
+    async def post(self, url, data=None, json=None, headers=None):  # noqa: ARG002
+        self.calls.append(('post', dict(data or {})))
+        return self.response
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_proxy_services_share_request_pipeline():
+    from aiochainscan.adapters.endpoint_builder_urlbuilder import UrlBuilderEndpoint
+    from aiochainscan.services.proxy import get_tx_count, send_raw_tx
+
+    common = {
+        'api_kind': 'eth',
+        'network': 'main',
+        'api_key': 'k',
+        '_endpoint_builder': UrlBuilderEndpoint(),
+    }
+
+    http = _RecordingHttp({'result': '0x5'})
+    value = await get_tx_count(
+        address='0xabc', tag=16, http=http, extra_params={'skip': None, 'x': 1}, **common
+    )
+    assert value == '0x5'
+    method, params = http.calls[0]
+    assert method == 'get'
+    assert params['module'] == 'proxy'
+    assert params['action'] == 'eth_getTransactionCount'
+    assert params['tag'] == '0x10'
+    assert params['x'] == 1
+    assert 'skip' not in params
+
+    http = _RecordingHttp('0xhash')
+    assert await send_raw_tx(raw_hex='0xdead', http=http, **common) == {'result': '0xhash'}
+    method, data = http.calls[0]
+    assert method == 'post'
+    assert data['action'] == 'eth_sendRawTransaction'
+    assert data['hex'] == '0xdead'
+
+
+def test_normalize_proxy_tx_parses_hex_and_tolerates_bad_fields():
+    from aiochainscan.services.proxy import normalize_proxy_tx
+
+    dto = normalize_proxy_tx(
+        {
+            'hash': '0xaa',
+            'blockNumber': '0x10',
+            'value': '42',
+            'gas': 'garbage',
+            'gasPrice': None,
+            'nonce': 3,
+            'from': '0x1',
+        }
+    )
+    assert dto['tx_hash'] == '0xaa'
+    assert dto['block_number'] == 16
+    assert dto['value_wei'] == 42
+    assert dto['gas'] is None
+    assert dto['gas_price_wei'] is None
+    assert dto['nonce'] == 3
+    assert dto['to_address'] is None
+
+
+@pytest.mark.asyncio
+async def test_facade_leaves_injected_http_client_open():
+    from aiochainscan import get_block_number
+    from aiochainscan.adapters.noop_telemetry import NoopTelemetry
+
+    http = _RecordingHttp({'result': '0x10'})
+    for _ in range(2):
+        value = await get_block_number(
+            api_kind='eth', network='main', api_key='k', http=http, telemetry=NoopTelemetry()
+        )
+        assert value == '0x10'
+    assert len(http.calls) == 2
+    assert http.closed is False
+
+
+@pytest.mark.asyncio
+async def test_get_txs_by_block_number_and_index_preserves_order():
+    import asyncio
+
+    from aiochainscan.adapters.endpoint_builder_urlbuilder import UrlBuilderEndpoint
+    from aiochainscan.services.proxy import get_txs_by_block_number_and_index
+
+    class _IndexHttp(_RecordingHttp):
+        async def get(self, url, params=None, headers=None):  # noqa: ARG002
+            index = int(params['index'], 16)
+            # Later indices answer first
+            await asyncio.sleep(0.001 * (5 - index))
+            return {'result': {'transactionIndex': hex(index)}}
+
+    txs = await get_txs_by_block_number_and_index(
+        tag=100,
+        indices=[0, 1, 2, 3],
+        api_kind='eth',
+        network='main',
+        api_key='k',
+        http=_IndexHttp(None),
+        _endpoint_builder=UrlBuilderEndpoint(),
+    )
+    assert [tx['transactionIndex'] for tx in txs] == ['0x0', '0x1', '0x2', '0x3']
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_proxy_reads_share_one_request():
+    import asyncio
+
+    from aiochainscan.adapters.endpoint_builder_urlbuilder import UrlBuilderEndpoint
+    from aiochainscan.services.proxy import _INFLIGHT, get_gas_price, send_raw_tx
+
+    class _SlowHttp(_RecordingHttp):
+        async def get(self, url, params=None, headers=None):
+            result = await super().get(url, params=params, headers=headers)
+            await asyncio.sleep(0.01)
+            return result
+
+    http = _SlowHttp({'result': '0x3b9aca00'})
+    common = {
+        'api_kind': 'eth',
+        'network': 'main',
+        'api_key': 'k',
+        'http': http,
+        '_endpoint_builder': UrlBuilderEndpoint(),
+    }
+    prices = await asyncio.gather(*(get_gas_price(**common) for _ in range(3)))
+    assert prices == ['0x3b9aca00'] * 3
+    assert len(http.calls) == 1
+    assert not _INFLIGHT
+
+    await asyncio.gather(
+        send_raw_tx(raw_hex='0x1', **common), send_raw_tx(raw_hex='0x1', **common)
+    )
+    assert [method for method, _ in http.calls].count('post') == 2
+
+
+@pytest.mark.asyncio
+async def test_block_number_and_gas_price_use_short_lived_cache():
+    from aiochainscan.adapters.endpoint_builder_urlbuilder import UrlBuilderEndpoint
+    from aiochainscan.adapters.memory_cache import InMemoryCache
+    from aiochainscan.services.proxy import get_block_number, get_gas_price
+
+    http = _RecordingHttp({'result': '0x10'})
+    common = {
+        'api_kind': 'eth',
+        'network': 'main',
+        'api_key': 'k',
+        'http': http,
+        '_endpoint_builder': UrlBuilderEndpoint(),
+        '_cache': InMemoryCache(),
+    }
+    assert await get_block_number(**common) == '0x10'
+    assert await get_block_number(**common) == '0x10'
+    assert await get_gas_price(**common) == '0x10'
+    assert await get_gas_price(**common) == '0x10'
+    assert len(http.calls) == 2
+
+    # Extra provider params bypass the cache
+    await get_gas_price(extra_params={'chainid': 1}, **common)
+    assert len(http.calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_argument_less_proxy_actions_are_signed_once_per_session():
+    from aiochainscan.adapters.endpoint_builder_urlbuilder import UrlBuilderEndpoint
+    from aiochainscan.services.proxy import get_block_number, get_gas_price
+
+    builder = UrlBuilderEndpoint()
+    session = builder.open(api_key='k', api_kind='eth', network='main')
+    sign_calls: list[dict] = []
+    original = session.filter_and_sign
+
+    def _counting_sign(params, headers):
+        sign_calls.append(dict(params or {}))
+        return original(params, headers)
+
+    session.filter_and_sign = _counting_sign
+
+    class _Builder:
+        def open(self, *, api_key, api_kind, network):  # noqa: ARG002
+            return session
+
+    http = _RecordingHttp({'result': '0x1'})
+    common = {
+        'api_kind': 'eth',
+        'network': 'main',
+        'api_key': 'k',
+        'http': http,
+        '_endpoint_builder': _Builder(),
+    }
+    for _ in range(3):
+        await get_block_number(**common)
+        await get_gas_price(**common)
+    await get_gas_price(extra_params={'chainid': 1}, **common)
+
+    assert [call['action'] for call in sign_calls] == [
+        'eth_blockNumber',
+        'eth_gasPrice',
+        'eth_gasPrice',
+    ]
+    assert len(http.calls) == 7
+
+
+@pytest.mark.asyncio
+async def test_proxy_snapshot_fetches_requested_fields_concurrently():
+    import asyncio
+
+    from aiochainscan.adapters.endpoint_builder_urlbuilder import UrlBuilderEndpoint
+    from aiochainscan.services.proxy import ProxySnapshot, get_proxy_snapshot
+
+    in_flight = 0
+    peak = 0
+
+    class _ActionHttp(_RecordingHttp):
+        async def get(self, url, params=None, headers=None):  # noqa: ARG002
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {'result': params['action']}
+
+    snapshot = await get_proxy_snapshot(
+        api_kind='eth',
+        network='main',
+        api_key='k',
+        http=_ActionHttp(None),
+        _endpoint_builder=UrlBuilderEndpoint(),
+        tx_count_for='0xabc',
+    )
+    assert snapshot == ProxySnapshot(
+        block_number='eth_blockNumber',
+        gas_price='eth_gasPrice',
+        tx_count='eth_getTransactionCount',
+    )
+    assert peak == 3
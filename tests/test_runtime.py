@@ -0,0 +1,12 @@
+import asyncio
+import sys
+
+from aiochainscan import install_uvloop
+
+
+def test_install_uvloop_without_uvloop_keeps_default_policy(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'uvloop', None)
+    policy = asyncio.get_event_loop_policy()
+
+    assert install_uvloop() is False
+    assert asyncio.get_event_loop_policy() is policy
@@ -316,3 +316,206 @@ async def test_token_balance_feature_not_supported():
             assert 'token_balance_by_block' in str(exc_info.value)
         finally:
             await c.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ('response', 'expected'),
+    [
+        ({'result': '1500'}, 1500),
+        ('42', 42),
+        (' 7 ', 7),
+        (3, 3),
+        (2.0, 2),
+        ('not-a-number', 0),
+        ('--5', 0),
+        (None, 0),
+        (True, 1),
+        ({'result': float('inf')}, 0),
+        ({'result': float('nan')}, 0),
+    ],
+)
+async def test_get_token_balance_service_coerces_payloads(response, expected):
+    from aiochainscan.adapters.endpoint_builder_urlbuilder import UrlBuilderEndpoint
+    from aiochainscan.services.token import get_token_balance
+
+    class _Http:
+        async def get(self, url, params=None, headers=None):  # noqa: ARG002
+            return response
+
+        async def post(self, url, data=None, json=None, headers=None):  # noqa: ARG002
+            raise NotImplementedError
+
+        async def aclose(self) -> None:
+            return None
+
+    value = await get_token_balance(
+        holder='0x1',
+        token_contract='0x2',
+        api_kind='eth',
+        network='main',
+        api_key='k',
+        http=_Http(),
+        _endpoint_builder=UrlBuilderEndpoint(),
+    )
+    assert value == expected
+    assert type(value) is int  # noqa: E721
+
+
+@pytest.mark.asyncio
+async def test_get_token_balance_service_serves_repeat_lookups_from_cache():
+    from aiochainscan.adapters.endpoint_builder_urlbuilder import UrlBuilderEndpoint
+    from aiochainscan.adapters.memory_cache import InMemoryCache
+    from aiochainscan.services.token import get_token_balance
+
+    calls: list[dict] = []
+
+    class _Http:
+        async def get(self, url, params=None, headers=None):  # noqa: ARG002
+            calls.append(dict(params or {}))
+            return {'result': '100'}
+
+        async def post(self, url, data=None, json=None, headers=None):  # noqa: ARG002
+            raise NotImplementedError
+
+        async def aclose(self) -> None:
+            return None
+
+    kwargs = {
+        'holder': '0x1',
+        'token_contract': '0x2',
+        'api_kind': 'eth',
+        'network': 'main',
+        'api_key': 'k',
+        'http': _Http(),
+        '_endpoint_builder': UrlBuilderEndpoint(),
+        '_cache': InMemoryCache(),
+    }
+    assert await get_token_balance(**kwargs) == 100
+    assert await get_token_balance(**kwargs) == 100
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_token_balance_service_refreshes_stale_entry_in_background():
+    import asyncio
+
+    from aiochainscan.adapters.endpoint_builder_urlbuilder import UrlBuilderEndpoint
+    from aiochainscan.adapters.memory_cache import InMemoryCache
+    from aiochainscan.services import token as token_service
+
+    class _Http:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        async def get(self, url, params=None, headers=None):  # noqa: ARG002
+            self.calls += 1
+            return {'result': str(self.calls * 100)}
+
+        async def post(self, url, data=None, json=None, headers=None):  # noqa: ARG002
+            raise NotImplementedError
+
+        async def aclose(self) -> None:
+            return None
+
+    http = _Http()
+    cache = InMemoryCache()
+    kwargs = {
+        'holder': '0x1',
+        'token_contract': '0x2',
+        'api_kind': 'eth',
+        'network': 'main',
+        'api_key': 'k',
+        'http': http,
+        '_endpoint_builder': UrlBuilderEndpoint(),
+        '_cache': cache,
+    }
+    assert await token_service.get_token_balance(**kwargs) == 100
+
+    cache_key = next(iter(cache._store))
+    entry, expires_at = cache._store[cache_key]
+    entry['stored_at'] -= token_service.CACHE_TTL_SECONDS_TOKEN_BALANCE + 1
+    cache._store[cache_key] = (entry, expires_at)
+
+    # Stale value comes back immediately; concurrent stale readers trigger one refresh
+    stale = await asyncio.gather(*(token_service.get_token_balance(**kwargs) for _ in range(3)))
+    assert stale == [100, 100, 100]
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert http.calls == 2
+    assert await token_service.get_token_balance(**kwargs) == 200
+    assert http.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_get_token_balance_service_does_not_coalesce_across_clients():
+    import asyncio
+
+    from aiochainscan.adapters.endpoint_builder_urlbuilder import UrlBuilderEndpoint
+    from aiochainscan.adapters.memory_cache import InMemoryCache
+    from aiochainscan.services.token import get_token_balance
+
+    class _SlowHttp:
+        def __init__(self, balance: str) -> None:
+            self.balance = balance
+            self.calls = 0
+
+        async def get(self, url, params=None, headers=None):  # noqa: ARG002
+            self.calls += 1
+            await asyncio.sleep(0.01)
+            return {'result': self.balance}
+
+        async def aclose(self) -> None:
+            return None
+
+    http_a, http_b = _SlowHttp('100'), _SlowHttp('200')
+    cache_a, cache_b = InMemoryCache(), InMemoryCache()
+    kwargs = {
+        'holder': '0x1',
+        'token_contract': '0x2',
+        'api_kind': 'eth',
+        'network': 'main',
+        'api_key': 'k',
+        '_endpoint_builder': UrlBuilderEndpoint(),
+    }
+    results = await asyncio.gather(
+        get_token_balance(http=http_a, _cache=cache_a, **kwargs),
+        get_token_balance(http=http_b, _cache=cache_b, **kwargs),
+    )
+
+    # Each client runs its own request and fills its own cache
+    assert results == [100, 200]
+    assert (http_a.calls, http_b.calls) == (1, 1)
+    assert cache_a._store and cache_b._store
+
+
+@pytest.mark.asyncio
+async def test_get_token_balance_service_jitters_fresh_window(monkeypatch):
+    from aiochainscan.adapters.endpoint_builder_urlbuilder import UrlBuilderEndpoint
+    from aiochainscan.adapters.memory_cache import InMemoryCache
+    from aiochainscan.services import token as token_service
+
+    class _Http:
+        async def get(self, url, params=None, headers=None):  # noqa: ARG002
+            return {'result': '100'}
+
+    cache = InMemoryCache()
+    common = {
+        'api_kind': 'eth',
+        'network': 'main',
+        'api_key': 'k',
+        'http': _Http(),
+        '_endpoint_builder': UrlBuilderEndpoint(),
+        '_cache': cache,
+    }
+    ttl = token_service.CACHE_TTL_SECONDS_TOKEN_BALANCE
+    jitter = token_service.CACHE_REFRESH_JITTER_TOKEN_BALANCE
+
+    monkeypatch.setattr(token_service, 'random', lambda: 0.0)
+    await token_service.get_token_balance(holder='0x1', token_contract='0x2', **common)
+    monkeypatch.setattr(token_service, 'random', lambda: 1.0)
+    await token_service.get_token_balance(holder='0x3', token_contract='0x2', **common)
+
+    # Entries written together get different fresh windows within [ttl * (1 - jitter), ttl]
+    windows = sorted(entry['fresh_for'] for entry, _ in cache._store.values())
+    assert windows == [pytest.approx(ttl * (1 - jitter)), pytest.approx(ttl)]
@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_spaces_concurrent_acquirers(monkeypatch):
+    from aiochainscan.adapters import token_bucket_rate_limiter as module
+    from aiochainscan.adapters.token_bucket_rate_limiter import TokenBucketRateLimiter
+
+    now = [100.0]
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(round(delay, 6))
+
+    monkeypatch.setattr(module.time, 'monotonic', lambda: now[0])
+    monkeypatch.setattr(module.asyncio, 'sleep', fake_sleep)
+
+    limiter = TokenBucketRateLimiter(rate=10, capacity=2)
+    await asyncio.gather(*(limiter.acquire('k') for _ in range(5)))
+    # Two burst tokens pass immediately; the rest are spaced 0.1s apart
+    assert sleeps == [0.1, 0.2, 0.3]
+
+    await limiter.acquire('other')
+    assert sleeps == [0.1, 0.2, 0.3]
+
+    with pytest.raises(ValueError):
+        TokenBucketRateLimiter(rate=0)
+
+
+def test_try_acquire_nowait_spends_tokens_without_waiting(monkeypatch):
+    from aiochainscan.adapters import simple_rate_limiter, token_bucket_rate_limiter
+    from aiochainscan.adapters.simple_rate_limiter import SimpleRateLimiter
+    from aiochainscan.adapters.token_bucket_rate_limiter import TokenBucketRateLimiter
+
+    now = [100.0]
+    monkeypatch.setattr(token_bucket_rate_limiter.time, 'monotonic', lambda: now[0])
+    monkeypatch.setattr(simple_rate_limiter.time, 'monotonic', lambda: now[0])
+
+    bucket = TokenBucketRateLimiter(rate=10, capacity=2)
+    assert [bucket.try_acquire_nowait('k') for _ in range(3)] == [True, True, False]
+    now[0] += 0.1
+    assert bucket.try_acquire_nowait('k') is True
+    assert bucket.try_acquire_nowait('k') is False
+
+    simple = SimpleRateLimiter(min_interval_seconds=1.0, burst=1)
+    assert simple.try_acquire_nowait('k') is True
+    assert simple.try_acquire_nowait('k') is False
+    now[0] += 1.0
+    assert simple.try_acquire_nowait('k') is True
+
+
+@pytest.mark.asyncio
+async def test_run_with_policies_skips_acquire_when_fast_path_succeeds():
+    from aiochainscan.services._executor import run_with_policies
+
+    class _Limiter:
+        def __init__(self, free: bool) -> None:
+            self.free = free
+            self.awaited: list[str] = []
+
+        def try_acquire_nowait(self, key: str) -> bool:  # noqa: ARG002
+            return self.free
+
+        async def acquire(self, key: str) -> None:
+            self.awaited.append(key)
+
+    async def call() -> str:
+        return 'ok'
+
+    for free, awaited in ((True, []), (False, ['k'])):
+        limiter = _Limiter(free)
+        result = await run_with_policies(
+            do_call=call,
+            telemetry=None,
+            telemetry_name='t',
+            api_kind='eth',
+            network='main',
+            rate_limiter=limiter,
+            rate_limiter_key='k',
+        )
+        assert result == 'ok'
+        assert limiter.awaited == awaited
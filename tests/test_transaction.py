@@ -90,3 +90,158 @@ async def test_get_transaction_by_hash_graphql(monkeypatch):
         _federator=SimpleProviderFederator(),
     )
     assert data.get('hash') == '0xabc'
+
+
+def test_normalize_transactions_matches_single_item_normalization():
+    from aiochainscan import normalize_transaction, normalize_transactions
+
+    raws = [
+        {'hash': '0xa', 'blockNumber': '0x10', 'value': '0x0', 'gas': '21000', 'nonce': '0x1'},
+        {'tx_hash': '0xb', 'block_number': 17, 'gasPrice': 'bogus', 'from': '0x1'},
+        {},
+    ]
+    out = normalize_transactions(raws)
+    assert out == [normalize_transaction(raw) for raw in raws]
+    assert out[0]['block_number'] == 16
+    assert out[0]['value_wei'] == 0
+    assert out[0]['gas'] == 21000
+    assert out[1]['tx_hash'] == '0xb'
+    assert out[1]['block_number'] == 17
+    assert out[1]['gas_price_wei'] is None
+    assert out[2]['tx_hash'] == ''
+
+
+def test_normalize_transactions_reuses_first_record_schema():
+    from aiochainscan import normalize_transaction, normalize_transactions
+
+    raws = [{'txhash': f'0x{n}', 'block_number': str(n), 'nonce': hex(n)} for n in range(3)]
+    raws.append({'hash': '0xff', 'blockNumber': '0x20'})
+
+    out = normalize_transactions(raws)
+    assert out == [normalize_transaction(raw) for raw in raws]
+    assert [tx['block_number'] for tx in out] == [0, 1, 2, 32]
+
+
+def test_normalize_transactions_falls_back_on_falsy_resolved_keys():
+    from aiochainscan import normalize_transaction, normalize_transactions
+
+    raws = [
+        {'hash': '0xa', 'blockNumber': '0x1'},
+        {'hash': None, 'tx_hash': '0xabc', 'blockNumber': '0x1'},
+        {'hash': '0xb', 'blockNumber': '', 'block_number': 5},
+    ]
+    out = normalize_transactions(raws)
+    assert out == [normalize_transaction(raw) for raw in raws]
+    assert out[1]['tx_hash'] == '0xabc'
+    assert out[2]['block_number'] == 5
+
+    # A key ahead of the resolved one in the fallback chain wins, as for a single record
+    raws = [{'tx_hash': '0xc', 'block_number': 1}, {'tx_hash': '0xd', 'hash': '0xe'}]
+    out = normalize_transactions(raws)
+    assert out == [normalize_transaction(raw) for raw in raws]
+    assert out[1]['tx_hash'] == '0xe'
+
+
+@pytest.mark.asyncio
+async def test_get_transaction_by_hash_cache_hit_skips_endpoint_setup():
+    from aiochainscan.adapters.memory_cache import InMemoryCache
+    from aiochainscan.services.transaction import get_transaction_by_hash
+
+    class _NoEndpointBuilder:
+        def open(self, **kwargs):  # noqa: ARG002
+            raise AssertionError('endpoint should not be opened on a cache hit')
+
+    class _NoHttp:
+        async def get(self, url, params=None, headers=None):  # noqa: ARG002
+            raise AssertionError('no request expected')
+
+        async def post(self, url, data=None, json=None, headers=None):  # noqa: ARG002
+            raise AssertionError('no request expected')
+
+        async def aclose(self) -> None:
+            return None
+
+    cache = InMemoryCache()
+    await cache.set('tx:eth:main:0xabc', {'hash': '0xabc'})
+    tx = await get_transaction_by_hash(
+        txhash='0xabc',
+        api_kind='eth',
+        network='main',
+        api_key='k',
+        http=_NoHttp(),
+        _endpoint_builder=_NoEndpointBuilder(),
+        _cache=cache,
+    )
+    assert tx == {'hash': '0xabc'}
+
+
+@pytest.mark.asyncio
+async def test_status_calls_sign_txhash_with_action():
+    from aiochainscan.services.transaction import (
+        get_contract_execution_status,
+        get_tx_receipt_status,
+    )
+
+    session = UrlBuilderEndpoint().open(api_key='k', api_kind='eth', network='main')
+    sign_calls: list[dict] = []
+    original = session.filter_and_sign
+
+    def _counting_sign(params, headers):
+        sign_calls.append(dict(params or {}))
+        return original(params, headers)
+
+    session.filter_and_sign = _counting_sign
+
+    class _Builder:
+        def open(self, *, api_key, api_kind, network):  # noqa: ARG002
+            return session
+
+    sent: list[dict] = []
+
+    class _Http:
+        async def get(self, url, params=None, headers=None):  # noqa: ARG002
+            sent.append(dict(params or {}))
+            return {'status': '1'}
+
+    common = {
+        'api_kind': 'eth',
+        'network': 'main',
+        'api_key': 'k',
+        'http': _Http(),
+        '_endpoint_builder': _Builder(),
+    }
+    await get_tx_receipt_status(txhash='0xa', **common)
+    await get_tx_receipt_status(txhash='0xb', **common)
+    await get_contract_execution_status(txhash='0xa', **common)
+
+    # The builder sees the complete parameter set, txhash included
+    assert [(call['action'], call['txhash']) for call in sign_calls] == [
+        ('gettxreceiptstatus', '0xa'),
+        ('gettxreceiptstatus', '0xb'),
+        ('getstatus', '0xa'),
+    ]
+    assert [params['txhash'] for params in sent] == ['0xa', '0xb', '0xa']
+    assert sent[1] == {
+        'module': 'transaction',
+        'action': 'gettxreceiptstatus',
+        'chainid': '1',
+        'txhash': '0xb',
+    }
+
+
+def test_normalizers_share_one_int_parser():
+    from aiochainscan.services.block import normalize_block
+    from aiochainscan.services.logs import normalize_log_entry
+    from aiochainscan.services.proxy import normalize_proxy_tx
+    from aiochainscan.services.transaction import normalize_transaction
+
+    raw = {'hash': '0xa', 'blockNumber': '010', 'value': '0X1F', 'gas': ' 21000 ', 'nonce': '0o7'}
+    tx = normalize_transaction(raw)
+    assert (tx['block_number'], tx['value_wei'], tx['gas'], tx['nonce']) == (10, 31, 21000, None)
+    proxy_tx = normalize_proxy_tx(raw)
+    assert (proxy_tx['block_number'], proxy_tx['value_wei'], proxy_tx['nonce']) == (10, 31, None)
+    assert normalize_log_entry({'address': '0x1', 'blockNumber': '010'})['block_number'] == 10
+    assert normalize_block({'number': '0x10', 'gasUsed': 0})['gas_used'] == 0
+    # Non-finite floats fall back to the default instead of raising OverflowError
+    assert normalize_transaction({'hash': '0xa', 'value': float('inf')})['value_wei'] is None
+    assert normalize_block({'number': '0x10', 'gasUsed': float('-inf')})['gas_used'] is None
@@ -2,17 +2,87 @@
 Tests for the unified ChainscanClient architecture.
 """
 
+import json
+from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
 
+import aiohttp
 import pytest
 
 from aiochainscan.core.client import ChainscanClient
 from aiochainscan.core.endpoint import PARSERS, EndpointSpec
 from aiochainscan.core.method import Method
+from aiochainscan.exceptions import ChainscanClientContentTypeError
 from aiochainscan.scanners import get_scanner_class, register_scanner
 from aiochainscan.scanners.base import Scanner
 
 
+class _FakeResponse:
+    """Minimal aiohttp response: JSON for dict bodies, a content-type error for text."""
+
+    def __init__(self, status: int, body: Any) -> None:
+        self.status = status
+        self.method = 'GET'
+        self.url = 'https://example.test'
+        self.closed = False
+        self._body = body
+
+    def raise_for_status(self) -> None:
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(Mock(), (), status=self.status)
+
+    async def json(self) -> Any:
+        if isinstance(self._body, str):
+            raise aiohttp.ContentTypeError(Mock(), (), status=self.status)
+        return self._body
+
+    async def text(self) -> str:
+        return self._body if isinstance(self._body, str) else json.dumps(self._body)
+
+    def close(self) -> None:
+        self.closed = True
+
+    async def __aenter__(self) -> '_FakeResponse':
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+
+class _FakeSession:
+    """Caller-owned session stand-in answering every request with one response."""
+
+    def __init__(self, status: int, body: Any) -> None:
+        self.status = status
+        self.body = body
+        self.calls: list[tuple[str, str, dict[str, Any]]] = []
+        self.closed = False
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> _FakeResponse:
+        # Entry point used by aiohttp-retry (the Etherscan-style Network path)
+        self.calls.append((method, str(url), kwargs))
+        return _FakeResponse(self.status, self.body)
+
+    def get(self, url: str, **kwargs: Any) -> _FakeResponse:
+        self.calls.append(('GET', url, kwargs))
+        return _FakeResponse(self.status, self.body)
+
+    def post(self, url: str, **kwargs: Any) -> _FakeResponse:
+        self.calls.append(('POST', url, kwargs))
+        return _FakeResponse(self.status, self.body)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+_SESSION_CLIENTS = {
+    'etherscan': ('etherscan', 'v2', 'eth', 'ethereum', 'key', None),
+    'blockscout': ('blockscout', 'v1', 'blockscout_sepolia', 'sepolia', '', None),
+    'routscan': ('routscan', 'v1', 'routscan_mode', 'mode', '', None),
+    'moralis': ('moralis', 'v1', 'moralis', 'eth', 'key', 1),
+}
+
+
 class TestMethod:
     """Test Method enum functionality."""
 
@@ -241,6 +311,24 @@ class TestChainscanClient:
             assert result == '1000000000000000000'
             mock_scanner.call.assert_called_once_with(Method.ACCOUNT_BALANCE, address='0x123')
 
+    @pytest.mark.asyncio
+    async def test_client_reuses_injected_session(self):
+        """Injected session serves every call and stays open for the caller."""
+        session = _FakeSession(200, {'status': '1', 'message': 'OK', 'result': '42'})
+        clients = [
+            ChainscanClient('etherscan', 'v2', 'eth', 'ethereum', 'key', session=session),
+            ChainscanClient(
+                'blockscout', 'v1', 'blockscout_sepolia', 'sepolia', '', session=session
+            ),
+        ]
+        for client in clients:
+            assert await client.call(Method.ACCOUNT_BALANCE, address='0x1') == '42'
+
+        assert len(session.calls) == 2
+        assert session.calls[0][2]['params']['action'] == 'balance'
+        assert 'blockscout' in session.calls[1][1]
+        assert not session.closed
+
     def test_client_supports_method(self):
         """Test checking method support."""
         mock_scanner = Mock()
@@ -360,3 +448,54 @@ async def test_end_to_end_workflow():
             mock_call.assert_called_once_with(
                 Method.ACCOUNT_BALANCE, address='0x742d35Cc6634C0532925a3b8D9Fa7a3D91'
             )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ('scanner', 'expected', 'match'),
+    [
+        ('etherscan', aiohttp.ClientResponseError, '403'),
+        ('blockscout', Exception, 'BlockScout API error'),
+        ('routscan', Exception, 'RoutScan API error'),
+        ('moralis', Exception, 'Moralis API error 403'),
+    ],
+)
+async def test_shared_session_error_status(scanner, expected, match):
+    """A non-200 on a shared session fails exactly like on the scanner's own session."""
+    name, version, api_kind, network, api_key, chain_id = _SESSION_CLIENTS[scanner]
+    session = _FakeSession(403, 'Forbidden')
+    client = ChainscanClient(
+        name, version, api_kind, network, api_key, chain_id=chain_id, session=session
+    )
+
+    with pytest.raises(expected, match=match):
+        await client.call(Method.ACCOUNT_BALANCE, address='0x1')
+    assert session.calls
+    assert not session.closed
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ('scanner', 'expected', 'match'),
+    [
+        ('etherscan', ChainscanClientContentTypeError, '202'),
+        ('blockscout', Exception, 'BlockScout API error'),
+        ('routscan', Exception, 'RoutScan API error'),
+        ('moralis', Exception, 'Moralis API error for chain'),
+    ],
+)
+async def test_shared_session_text_body(scanner, expected, match):
+    """A non-JSON body on a shared session keeps each scanner's error semantics."""
+    name, version, api_kind, network, api_key, chain_id = _SESSION_CLIENTS[scanner]
+    status = 200 if scanner == 'moralis' else 202
+    session = _FakeSession(status, '<html>maintenance</html>')
+    client = ChainscanClient(
+        name, version, api_kind, network, api_key, chain_id=chain_id, session=session
+    )
+
+    with pytest.raises(expected, match=match) as excinfo:
+        await client.call(Method.ACCOUNT_BALANCE, address='0x1')
+    if scanner == 'etherscan':
+        assert excinfo.value.status == 202
+        assert excinfo.value.content == '<html>maintenance</html>'
+    assert not session.closed
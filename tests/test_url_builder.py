@@ -34,6 +34,8 @@ def test_filter_params(ub):
     assert ub._filter_params({1: 2, 3: None}) == {1: 2}
     assert ub._filter_params({1: 2, 3: 0}) == {1: 2, 3: 0}
     assert ub._filter_params({1: 2, 3: False}) == {1: 2, 3: False}
+    clean = {1: 2}
+    assert ub._filter_params(clean) is not clean
 
 
 def test_query_param_auth():
@@ -43,6 +45,19 @@ def test_query_param_auth():
     assert headers == {}
 
 
+def test_filter_and_sign_leaves_caller_mappings_untouched():
+    from types import MappingProxyType
+
+    ub = UrlBuilder(apikey(), 'fantom', 'main')
+    params = {'module': 'proxy', 'skip': None}
+    headers = {'X-Trace': 1}
+    signed_params, signed_headers = ub.filter_and_sign(params, MappingProxyType(headers))
+    assert signed_params == {'module': 'proxy', 'chainid': '250', 'apikey': ub._API_KEY}
+    assert signed_headers == {'X-Trace': '1'}
+    assert params == {'module': 'proxy', 'skip': None}
+    assert headers == {'X-Trace': 1}
+
+
 @pytest.mark.parametrize(
     'api_kind,network_name,expected',
     [